@@ -5,6 +5,10 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Default user library location, shared with callers that need the path
+# without constructing a manager (which eagerly loads every library)
+DEFAULT_USER_LIB_PATH = Path.home() / ".ved" / "libraries" / "user_library.vedlib"
+
 
 class ComponentDefinition:
     """Definition of a component in the library"""
@@ -32,7 +36,7 @@ class ComponentLibraryManager:
     
     def __init__(self, builtin_lib_path: Optional[Path] = None, user_lib_path: Optional[Path] = None):
         self.builtin_lib_path = builtin_lib_path or Path(__file__).parent / "builtin_library.vedlib"
-        self.user_lib_path = user_lib_path or Path.home() / ".ved" / "libraries" / "user_library.vedlib"
+        self.user_lib_path = user_lib_path or DEFAULT_USER_LIB_PATH
         self.builtin_components: Dict[str, ComponentDefinition] = {}
         self.user_components: Dict[str, ComponentDefinition] = {}
         
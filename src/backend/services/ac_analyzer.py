@@ -70,6 +70,40 @@ class ACAnalyzer:
             'phase': np.radians(phase)
         })
 
+    def add_resistors_bulk(self, names: List[str], node1, node2,
+                          values) -> None:
+        """Add many resistors in a single call (batched add_resistor)"""
+        self.components.extend(
+            {'type': 'resistor', 'name': name, 'node1': int(n1),
+             'node2': int(n2), 'value': float(value)}
+            for name, n1, n2, value in zip(names, node1, node2, values))
+
+    def add_capacitors_bulk(self, names: List[str], node1, node2,
+                           values) -> None:
+        """Add many capacitors in a single call"""
+        self.components.extend(
+            {'type': 'capacitor', 'name': name, 'node1': int(n1),
+             'node2': int(n2), 'value': float(value)}
+            for name, n1, n2, value in zip(names, node1, node2, values))
+
+    def add_inductors_bulk(self, names: List[str], node1, node2,
+                          values) -> None:
+        """Add many inductors in a single call"""
+        self.components.extend(
+            {'type': 'inductor', 'name': name, 'node1': int(n1),
+             'node2': int(n2), 'value': float(value)}
+            for name, n1, n2, value in zip(names, node1, node2, values))
+
+    def add_voltage_sources_bulk(self, names: List[str], node_pos, node_neg,
+                                magnitudes, phase: float = 0) -> None:
+        """Add many AC voltage sources in a single call (shared phase)"""
+        phase_rad = np.radians(phase)
+        self.voltage_sources.extend(
+            {'name': name, 'node_pos': int(n_pos), 'node_neg': int(n_neg),
+             'magnitude': float(magnitude), 'phase': phase_rad}
+            for name, n_pos, n_neg, magnitude in zip(names, node_pos,
+                                                     node_neg, magnitudes))
+
     def solve(self, frequencies: List[float], num_nodes: int = None) -> Dict[str, Any]:
         """
         Solve AC circuit over frequency range.
@@ -98,57 +132,72 @@ class ACAnalyzer:
             'response': {},
             'impedances': {}
         }
-        
-        for frequency in frequencies:
-            omega = 2 * np.pi * frequency
-            
-            # Build admittance matrix (complex)
-            Y = np.zeros((num_nodes, num_nodes), dtype=complex)
-            I = np.zeros(num_nodes, dtype=complex)
-            
+
+        omegas = 2 * np.pi * np.asarray(frequencies, dtype=float)
+
+        # Stamp the frequency-independent G (conductance), C (capacitance)
+        # and Gamma (reciprocal inductance) matrices once; each frequency
+        # point is then the linear combination Y = G + jwC - (j/w)Gamma
+        # instead of a per-frequency Python pass over all components
+        G = np.zeros((num_nodes, num_nodes))
+        C = np.zeros_like(G)
+        Gamma = np.zeros_like(G)
+
+        for comp in self.components:
+            if comp['type'] == 'resistor':
+                target, val = G, 1.0 / comp['value']
+            elif comp['type'] == 'capacitor':
+                target, val = C, comp['value']
+            elif comp['type'] == 'inductor':
+                target, val = Gamma, 1.0 / comp['value']
+            else:
+                continue
+            n1 = comp['node1']
+            n2 = comp['node2']
+            target[n1, n1] += val
+            target[n2, n2] += val
+            target[n1, n2] -= val
+            target[n2, n1] -= val
+
+        # Per-component impedance magnitude/phase across the whole sweep
+        imp_mag = {}
+        imp_phase = {}
+        with np.errstate(divide='ignore'):
+            for comp in self.components:
+                if comp['type'] == 'resistor':
+                    imp_mag[comp['name']] = np.full(len(omegas), comp['value'])
+                    imp_phase[comp['name']] = np.zeros(len(omegas))
+                elif comp['type'] == 'capacitor':
+                    imp_mag[comp['name']] = 1.0 / (omegas * comp['value'])
+                    imp_phase[comp['name']] = np.full(len(omegas), -90.0)
+                elif comp['type'] == 'inductor':
+                    imp_mag[comp['name']] = omegas * comp['value']
+                    imp_phase[comp['name']] = np.full(len(omegas), 90.0)
+
+        # Source injections are frequency-independent; build the RHS once
+        I = np.zeros(num_nodes, dtype=complex)
+        for src in self.voltage_sources:
+            V_source = src['magnitude'] * np.exp(1j * src['phase'])
+            I[src['node_pos']] -= V_source / (1 + 1e-12)  # Very small source impedance
+            I[src['node_neg']] += V_source / (1 + 1e-12)
+
+        for k, frequency in enumerate(frequencies):
+            omega = omegas[k]
+
+            # Record impedances even when the solve below is skipped
+            results['impedances'][frequency] = {
+                name: {'magnitude': imp_mag[name][k],
+                       'phase': imp_phase[name][k]}
+                for name in imp_mag
+            }
+
+            # Reactive admittances are undefined at DC; skip as before
+            if omega == 0.0 and (C.any() or Gamma.any()):
+                continue
+
             try:
-                # Process components
-                for comp in self.components:
-                    n1 = comp['node1']
-                    n2 = comp['node2']
-                    
-                    if comp['type'] == 'resistor':
-                        Z = comp['value']
-                        Y_comp = 1.0 / Z
-                    
-                    elif comp['type'] == 'capacitor':
-                        Z = 1.0 / (1j * omega * comp['value'])
-                        Y_comp = 1.0 / Z
-                    
-                    elif comp['type'] == 'inductor':
-                        Z = 1j * omega * comp['value']
-                        Y_comp = 1.0 / Z
-                    else:
-                        continue
-                    
-                    # Add to admittance matrix
-                    Y[n1, n1] += Y_comp
-                    Y[n2, n2] += Y_comp
-                    Y[n1, n2] -= Y_comp
-                    Y[n2, n1] -= Y_comp
-                    
-                    # Store impedance
-                    if frequency not in results['impedances']:
-                        results['impedances'][frequency] = {}
-                    results['impedances'][frequency][comp['name']] = {
-                        'magnitude': abs(Z),
-                        'phase': np.degrees(cmath.phase(Z))
-                    }
-                
-                # Process voltage sources
-                for src in self.voltage_sources:
-                    n_pos = src['node_pos']
-                    n_neg = src['node_neg']
-                    V_source = src['magnitude'] * np.exp(1j * src['phase'])
-                    
-                    I[n_pos] -= V_source / (1 + 1e-12)  # Very small source impedance
-                    I[n_neg] += V_source / (1 + 1e-12)
-                
+                Y = G + (1j * omega) * C - (1j / omega if omega else 0) * Gamma
+
                 # Solve
                 try:
                     V = np.linalg.solve(Y, I)
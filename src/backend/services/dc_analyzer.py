@@ -7,7 +7,8 @@ Independent analyzer service that can be used standalone.
 
 import numpy as np
 from typing import Dict, List, Any, Tuple
-from scipy.linalg import solve
+from scipy.sparse import coo_matrix
+from scipy.sparse.linalg import splu
 
 
 class DCAnalyzer:
@@ -26,6 +27,9 @@ class DCAnalyzer:
         self.voltage_sources = []
         self.current_sources = []
         self.ground_node = 0
+        # Cached (signature, factorization, rhs) from the previous solve;
+        # reused while the circuit topology is unchanged
+        self._factor_cache = None
 
     def add_resistor(self, name: str, node1: int, node2: int, value: float) -> None:
         """Add resistor: V1 - V2 = I*R"""
@@ -59,6 +63,36 @@ class DCAnalyzer:
             'current': current
         })
 
+    def add_resistors_bulk(self, names: List[str], node1: np.ndarray,
+                          node2: np.ndarray, values: np.ndarray) -> None:
+        """Add many resistors in a single call (batched add_resistor)"""
+        values = np.asarray(values, dtype=float)
+        if np.any(values <= 0):
+            raise ValueError("Resistor values must be positive")
+        self.components.extend(
+            {'type': 'resistor', 'name': name, 'node1': int(n1),
+             'node2': int(n2), 'value': float(value)}
+            for name, n1, n2, value in zip(names, node1, node2, values))
+
+    def add_voltage_sources_bulk(self, names: List[str], node_pos: np.ndarray,
+                                node_neg: np.ndarray,
+                                voltages: np.ndarray) -> None:
+        """Add many voltage sources in a single call"""
+        self.voltage_sources.extend(
+            {'name': name, 'node_pos': int(n_pos), 'node_neg': int(n_neg),
+             'voltage': float(voltage)}
+            for name, n_pos, n_neg, voltage in zip(names, node_pos, node_neg,
+                                                   voltages))
+
+    def add_current_sources_bulk(self, names: List[str], node1: np.ndarray,
+                                node2: np.ndarray,
+                                currents: np.ndarray) -> None:
+        """Add many current sources in a single call"""
+        self.current_sources.extend(
+            {'name': name, 'node1': int(n1), 'node2': int(n2),
+             'current': float(current)}
+            for name, n1, n2, current in zip(names, node1, node2, currents))
+
     def solve(self, num_nodes: int = None) -> Dict[str, Any]:
         """
         Solve DC circuit using nodal analysis.
@@ -73,55 +107,89 @@ class DCAnalyzer:
             num_nodes = self._detect_node_count()
         
         self.node_count = num_nodes
-        
-        # Build Y matrix (admittance) and I vector (current sources)
+
+        # Component lists only grow (or are cleared), so the length
+        # signature identifies the sparsity pattern and stamped values
+        signature = (len(self.components), len(self.voltage_sources),
+                     len(self.current_sources), num_nodes)
+        if self._factor_cache is not None and self._factor_cache[0] == signature:
+            return self._solve_factored(*self._factor_cache[1:])
+
+        # Build Y matrix (admittance) as sparse triplets and I vector
         num_vars = num_nodes + len(self.voltage_sources)
-        Y = np.zeros((num_vars, num_vars))
+        rows = []
+        cols = []
+        data = []
         I = np.zeros(num_vars)
-        
+
         try:
-            # Process resistors (conductances)
-            for comp in self.components:
-                if comp['type'] == 'resistor':
-                    n1 = comp['node1']
-                    n2 = comp['node2']
-                    G = 1.0 / comp['value']  # Conductance
-                    
-                    # Diagonal terms
-                    Y[n1, n1] += G
-                    Y[n2, n2] += G
-                    # Off-diagonal terms
-                    Y[n1, n2] -= G
-                    Y[n2, n1] -= G
-            
+            # Process resistors (conductances) - stamped in bulk
+            resistors = [c for c in self.components if c['type'] == 'resistor']
+            if resistors:
+                count = len(resistors)
+                n1 = np.fromiter((c['node1'] for c in resistors),
+                                 dtype=np.int32, count=count)
+                n2 = np.fromiter((c['node2'] for c in resistors),
+                                 dtype=np.int32, count=count)
+                G = 1.0 / np.fromiter((c['value'] for c in resistors),
+                                      dtype=np.float64, count=count)
+
+                # Diagonal terms, then off-diagonal terms; duplicate
+                # (row, col) entries are summed on conversion
+                rows.extend((n1, n2, n1, n2))
+                cols.extend((n1, n2, n2, n1))
+                data.extend((G, G, -G, -G))
+
             # Process independent current sources
-            for src in self.current_sources:
-                n1 = src['node1']
-                n2 = src['node2']
-                I_val = src['current']
-                I[n1] -= I_val  # Current out of node
-                I[n2] += I_val  # Current into node
-            
+            if self.current_sources:
+                count = len(self.current_sources)
+                n1 = np.fromiter((s['node1'] for s in self.current_sources),
+                                 dtype=np.intp, count=count)
+                n2 = np.fromiter((s['node2'] for s in self.current_sources),
+                                 dtype=np.intp, count=count)
+                I_val = np.fromiter((s['current'] for s in self.current_sources),
+                                    dtype=np.float64, count=count)
+                np.subtract.at(I, n1, I_val)  # Current out of node
+                np.add.at(I, n2, I_val)       # Current into node
+
             # Process independent voltage sources (KVL constraints)
-            for i, src in enumerate(self.voltage_sources):
-                eq_idx = num_nodes + i
-                n_pos = src['node_pos']
-                n_neg = src['node_neg']
-                V_val = src['voltage']
-                
-                # V_pos - V_neg = V_val
-                Y[eq_idx, n_pos] = 1
-                Y[eq_idx, n_neg] = -1
-                I[eq_idx] = V_val
-                
-                # Transpose for symmetric treatment
-                Y[n_pos, eq_idx] = 1
-                Y[n_neg, eq_idx] = -1
-            
-            # Solve system
+            if self.voltage_sources:
+                count = len(self.voltage_sources)
+                eq_idx = num_nodes + np.arange(count, dtype=np.int32)
+                n_pos = np.fromiter((s['node_pos'] for s in self.voltage_sources),
+                                    dtype=np.int32, count=count)
+                n_neg = np.fromiter((s['node_neg'] for s in self.voltage_sources),
+                                    dtype=np.int32, count=count)
+                ones = np.ones(count)
+
+                # V_pos - V_neg = V_val, plus transpose for symmetric treatment
+                rows.extend((eq_idx, eq_idx, n_pos, n_neg))
+                cols.extend((n_pos, n_neg, eq_idx, eq_idx))
+                data.extend((ones, -ones, ones, -ones))
+                I[eq_idx] = np.fromiter(
+                    (s['voltage'] for s in self.voltage_sources),
+                    dtype=np.float64, count=count)
+
+            # Assemble and solve sparse system
+            row_arr = np.concatenate(rows) if rows else np.empty(0, dtype=np.int32)
+            col_arr = np.concatenate(cols) if cols else np.empty(0, dtype=np.int32)
+            data_arr = np.concatenate(data) if data else np.empty(0)
+
+            # Ground node 0: every element's stamps cancel across the node
+            # rows, so without replacing the reference row with V_0 = 0
+            # the system is singular for any circuit
+            keep = row_arr != 0
+            row_arr = np.append(row_arr[keep], np.int32(0))
+            col_arr = np.append(col_arr[keep], np.int32(0))
+            data_arr = np.append(data_arr[keep], 1.0)
+            I[0] = 0.0
+
+            Y = coo_matrix((data_arr, (row_arr, col_arr)),
+                           shape=(num_vars, num_vars)).tocsc()
+
             try:
-                X = solve(Y, I)
-            except np.linalg.LinAlgError:
+                lu = splu(Y)
+            except RuntimeError:
                 return {
                     'status': 'error',
                     'message': 'Circuit matrix singular - check for floating nodes',
@@ -129,35 +197,71 @@ class DCAnalyzer:
                     'currents': {},
                     'power': {}
                 }
-            
+
+            self._factor_cache = (signature, lu, I)
+            return self._solve_factored(lu, I)
+
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': str(e),
+                'node_voltages': {},
+                'currents': {},
+                'power': {}
+            }
+
+    def _solve_factored(self, lu, I: np.ndarray) -> Dict[str, Any]:
+        """Solve with an existing LU factorization and extract results"""
+        num_nodes = self.node_count
+        try:
+            X = lu.solve(I)
+            if not np.all(np.isfinite(X)):
+                return {
+                    'status': 'error',
+                    'message': 'Circuit matrix singular - check for floating nodes',
+                    'node_voltages': {},
+                    'currents': {},
+                    'power': {}
+                }
+
             # Extract results
             node_voltages = {i: X[i] for i in range(num_nodes)}
             source_currents = {self.voltage_sources[i]['name']: X[num_nodes + i]
                               for i in range(len(self.voltage_sources))}
             
-            # Calculate component currents and power
+            # Calculate component currents and power as whole-array ops
+            # instead of per-component Python arithmetic
             currents = {}
             power = {}
-            
-            for comp in self.components:
-                if comp['type'] == 'resistor':
-                    n1 = comp['node1']
-                    n2 = comp['node2']
-                    V_diff = X[n1] - X[n2]
-                    I_comp = V_diff / comp['value']
-                    P_comp = I_comp * I_comp * comp['value']
-                    
-                    currents[comp['name']] = I_comp
-                    power[comp['name']] = P_comp
-            
-            for src in self.current_sources:
-                currents[src['name']] = src['current']
-                n1 = src['node1']
-                n2 = src['node2']
-                V_diff = X[n1] - X[n2]
-                P_comp = V_diff * src['current']
-                power[src['name']] = P_comp
-            
+
+            resistors = [c for c in self.components if c['type'] == 'resistor']
+            if resistors:
+                count = len(resistors)
+                n1 = np.fromiter((c['node1'] for c in resistors),
+                                 dtype=np.intp, count=count)
+                n2 = np.fromiter((c['node2'] for c in resistors),
+                                 dtype=np.intp, count=count)
+                R = np.fromiter((c['value'] for c in resistors),
+                                dtype=np.float64, count=count)
+                I_comp = (X[n1] - X[n2]) / R
+                P_comp = I_comp * I_comp * R
+                names = [c['name'] for c in resistors]
+                currents.update(zip(names, I_comp))
+                power.update(zip(names, P_comp))
+
+            if self.current_sources:
+                count = len(self.current_sources)
+                n1 = np.fromiter((s['node1'] for s in self.current_sources),
+                                 dtype=np.intp, count=count)
+                n2 = np.fromiter((s['node2'] for s in self.current_sources),
+                                 dtype=np.intp, count=count)
+                I_src = np.fromiter((s['current'] for s in self.current_sources),
+                                    dtype=np.float64, count=count)
+                P_src = (X[n1] - X[n2]) * I_src
+                names = [s['name'] for s in self.current_sources]
+                currents.update(zip(names, I_src))
+                power.update(zip(names, P_src))
+
             for src in self.voltage_sources:
                 currents[src['name']] = source_currents[src['name']]
                 power[src['name']] = src['voltage'] * source_currents[src['name']]
@@ -203,3 +307,4 @@ class DCAnalyzer:
         self.voltage_sources = []
         self.current_sources = []
         self.node_count = 0
+        self._factor_cache = None
@@ -77,6 +77,18 @@ class ServiceManager:
             'transient': self.transient_analyzer,
         }
 
+    def new_dc_analyzer(self) -> DCAnalyzer:
+        """Create a fresh DC analyzer with isolated circuit state"""
+        return DCAnalyzer()
+
+    def new_ac_analyzer(self) -> ACAnalyzer:
+        """Create a fresh AC analyzer with isolated circuit state"""
+        return ACAnalyzer()
+
+    def new_transient_analyzer(self) -> TransientAnalyzer:
+        """Create a fresh transient analyzer with isolated circuit state"""
+        return TransientAnalyzer()
+
     def parse_value(self, value_str: str) -> float:
         """Parse component value string"""
         return self.value_parser.parse(value_str)
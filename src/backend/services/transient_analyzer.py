@@ -107,6 +107,42 @@ class TransientAnalyzer:
         
         self.add_voltage_source(name, node_pos, node_neg, sin_func)
 
+    def add_resistors_bulk(self, names: List[str], node1, node2,
+                          values) -> None:
+        """Add many resistors in a single call (batched add_resistor)"""
+        self.components.extend(
+            {'type': 'resistor', 'name': name, 'node1': int(n1),
+             'node2': int(n2), 'value': float(value)}
+            for name, n1, n2, value in zip(names, node1, node2, values))
+
+    def add_capacitors_bulk(self, names: List[str], node1, node2,
+                           values) -> None:
+        """Add many capacitors in a single call (zero initial voltage)"""
+        self.components.extend(
+            {'type': 'capacitor', 'name': name, 'node1': int(n1),
+             'node2': int(n2), 'value': float(value)}
+            for name, n1, n2, value in zip(names, node1, node2, values))
+        for name in names:
+            self.initial_conditions[name] = 0
+
+    def add_inductors_bulk(self, names: List[str], node1, node2,
+                          values) -> None:
+        """Add many inductors in a single call (zero initial current)"""
+        self.components.extend(
+            {'type': 'inductor', 'name': name, 'node1': int(n1),
+             'node2': int(n2), 'value': float(value)}
+            for name, n1, n2, value in zip(names, node1, node2, values))
+        for name in names:
+            self.initial_conditions[name] = 0
+
+    def add_pulse_sources_bulk(self, names: List[str], node_pos, node_neg,
+                              v_pulse, v_initial: float = 0,
+                              t_rise: float = 0) -> None:
+        """Add many step pulse sources in a single call (shared edge time)"""
+        for name, n_pos, n_neg, v in zip(names, node_pos, node_neg, v_pulse):
+            self.add_pulse_source(name, int(n_pos), int(n_neg),
+                                  v_initial, float(v), t_rise)
+
     def solve(self, t_span: Tuple[float, float], num_points: int = 1000,
              method: str = 'RK45') -> Dict[str, Any]:
         """
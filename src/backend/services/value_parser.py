@@ -6,8 +6,16 @@ Handles standard electrical units and provides value conversion.
 """
 
 import re
+from functools import lru_cache
 from typing import Union, Optional, Tuple
 
+import numpy as np
+
+# Prefix tables for vectorized formatting, ordered by magnitude
+_PREFIXES = ('p', 'n', 'u', 'm', '', 'k', 'M', 'G')
+_PREFIX_MULTIPLIERS = np.array([1e-12, 1e-9, 1e-6, 1e-3, 1, 1e3, 1e6, 1e9])
+_LOG_BREAKS = np.log10(_PREFIX_MULTIPLIERS)
+
 
 class ValueParser:
     """
@@ -58,31 +66,11 @@ class ValueParser:
         """
         if isinstance(value, (int, float)):
             return float(value)
-        
+
         if not isinstance(value, str):
             raise ValueError(f"Invalid value type: {type(value)}")
-        
-        # Clean up the input - convert to lowercase for prefix matching
-        value = value.strip().lower()
-        
-        # Remove common unit suffixes (Ω, F, H, V, A, Hz)
-        for unit_char in ['ω', 'Ω', 'f', 'h', 'v', 'a', 'z']:
-            value = value.replace(unit_char, '')
-        
-        # Pattern: number(s) followed by optional prefix
-        pattern = r'^([\d.]+)\s*([pnumkMG]?)$'
-        match = re.match(pattern, value)
-        
-        if not match:
-            raise ValueError(f"Cannot parse value: {value}")
-        
-        numeric_part = float(match.group(1))
-        prefix = match.group(2) or ''
-        
-        if prefix not in ValueParser.MULTIPLIERS:
-            raise ValueError(f"Unknown prefix: {prefix}")
-        
-        return numeric_part * ValueParser.MULTIPLIERS[prefix]
+
+        return _parse_cached(value)
 
     @staticmethod
     def format_value(value: float, unit: str = '', precision: int = 3) -> str:
@@ -119,6 +107,50 @@ class ValueParser:
         # Fallback for very small/large values
         return f"{sign}{abs_value:.{precision}e}{unit}"
 
+    @staticmethod
+    def format_values(values, unit: str = '', precision: int = 3) -> np.ndarray:
+        """
+        Vectorized format_value for whole arrays (node voltages, sweeps).
+
+        Prefix selection runs as one np.searchsorted over log10 magnitudes
+        instead of a per-value Python scan over the prefix list.
+
+        Args:
+            values: Array-like of numeric values
+            unit: Unit suffix (Ω, F, H, V, A, Hz)
+            precision: Decimal places
+
+        Returns:
+            Array of formatted strings
+        """
+        flat = np.atleast_1d(np.asarray(values, dtype=float))
+        abs_values = np.abs(flat)
+
+        # log10 of zero is undefined; zeros are formatted separately below
+        with np.errstate(divide='ignore'):
+            logs = np.log10(abs_values)
+
+        idx = np.searchsorted(_LOG_BREAKS, logs, side='right') - 1
+        in_range = (idx >= 0) & (logs < 12) & (abs_values > 0)
+
+        scaled = abs_values.copy()
+        scaled[in_range] /= _PREFIX_MULTIPLIERS[idx[in_range]]
+
+        out = []
+        for value, abs_value, scale, prefix_idx, ok in zip(
+                flat, abs_values, scaled, idx, in_range):
+            if value == 0:
+                out.append(f"0 {unit}")
+                continue
+            sign = '-' if value < 0 else ''
+            if ok:
+                formatted = f"{scale:.{precision}g}".rstrip('0').rstrip('.')
+                out.append(f"{sign}{formatted}{_PREFIXES[prefix_idx]}{unit}".strip())
+            else:
+                # Fallback for very small/large values
+                out.append(f"{sign}{abs_value:.{precision}e}{unit}")
+        return np.array(out, dtype=object)
+
     @staticmethod
     def convert(value: float, from_unit: str, to_unit: str) -> float:
         """
@@ -171,17 +203,50 @@ class ValueParser:
         Returns:
             Tuple of (min_factor, max_factor) for calculating range
         """
-        tolerance_str = tolerance_str.strip()
-        
-        # Handle percentage tolerance
-        if '%' in tolerance_str:
-            percent = float(tolerance_str.replace('%', '').replace('±', '').strip())
-            factor = percent / 100
-            return (1 - factor, 1 + factor)
-        
-        # Handle absolute tolerance
-        try:
-            abs_tol = ValueParser.parse(tolerance_str)
-            return (1 - abs_tol, 1 + abs_tol)
-        except:
-            raise ValueError(f"Cannot parse tolerance: {tolerance_str}")
+        return _parse_tolerance_cached(tolerance_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(value: str) -> float:
+    """Parse a value string; cached since the same strings repeat heavily
+    during netlist load and tolerance sweeps."""
+    # Clean up the input - convert to lowercase for prefix matching
+    value = value.strip().lower()
+
+    # Remove common unit suffixes (Ω, F, H, V, A, Hz)
+    for unit_char in ['ω', 'Ω', 'f', 'h', 'v', 'a', 'z']:
+        value = value.replace(unit_char, '')
+
+    # Pattern: number(s) followed by optional prefix
+    pattern = r'^([\d.]+)\s*([pnumkMG]?)$'
+    match = re.match(pattern, value)
+
+    if not match:
+        raise ValueError(f"Cannot parse value: {value}")
+
+    numeric_part = float(match.group(1))
+    prefix = match.group(2) or ''
+
+    if prefix not in ValueParser.MULTIPLIERS:
+        raise ValueError(f"Unknown prefix: {prefix}")
+
+    return numeric_part * ValueParser.MULTIPLIERS[prefix]
+
+
+@lru_cache(maxsize=4096)
+def _parse_tolerance_cached(tolerance_str: str) -> Tuple[float, float]:
+    """Parse a tolerance string; cached for repeated Monte-Carlo sweeps."""
+    tolerance_str = tolerance_str.strip()
+
+    # Handle percentage tolerance
+    if '%' in tolerance_str:
+        percent = float(tolerance_str.replace('%', '').replace('±', '').strip())
+        factor = percent / 100
+        return (1 - factor, 1 + factor)
+
+    # Handle absolute tolerance
+    try:
+        abs_tol = ValueParser.parse(tolerance_str)
+        return (1 - abs_tol, 1 + abs_tol)
+    except:
+        raise ValueError(f"Cannot parse tolerance: {tolerance_str}")
@@ -0,0 +1,76 @@
+"""
+Low-level MNA stamping kernels
+Writes resistor conductance stamps straight into a triplet data array at
+offsets precomputed from the cached sparsity pattern, fusing the four
+scatter writes per resistor into one pass. JIT-compiled when numba is
+installed; otherwise an equivalent NumPy fancy-indexing fallback is used.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _stamp_resistors_numpy(data, offsets, g):
+    """NumPy fallback: four masked scatter writes"""
+    for row, sign in ((0, 1.0), (1, 1.0), (2, -1.0), (3, -1.0)):
+        offs = offsets[row]
+        mask = offs >= 0
+        data[offs[mask]] = sign * g[mask]
+
+
+# Above this size the generated function's compile time outweighs the
+# win from straight-line stores; larger nets keep the generic kernel
+_SPECIALIZE_LIMIT = 512
+
+
+def build_specialized_stamper(offsets):
+    """
+    Generate a stamping function with the pattern offsets unrolled as
+    literals - one store per kept nonzero, no loop, no offset loads -
+    so the JIT sees pure straight-line code for a fixed netlist topology
+    Returns None when numba is unavailable or the net is too large;
+    callers then fall back to the generic stamp_resistors kernel
+    """
+    if njit is None or offsets.shape[1] > _SPECIALIZE_LIMIT:
+        return None
+
+    lines = ['def _specialized(data, g):']
+    for i in range(offsets.shape[1]):
+        for row, sign in ((0, ''), (1, ''), (2, '-'), (3, '-')):
+            o = offsets[row, i]
+            if o >= 0:
+                lines.append(f'    data[{o}] = {sign}g[{i}]')
+    if len(lines) == 1:
+        lines.append('    pass')
+
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return njit(fastmath=True)(namespace['_specialized'])
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def stamp_resistors(data, offsets, g):
+        """Write (n1,n1)/(n2,n2)/(n1,n2)/(n2,n1) stamps for all resistors
+        offsets is (4, n_resistors); negative offsets mark dropped
+        ground-row entries
+        """
+        for i in range(g.shape[0]):
+            gi = g[i]
+            o = offsets[0, i]
+            if o >= 0:
+                data[o] = gi
+            o = offsets[1, i]
+            if o >= 0:
+                data[o] = gi
+            o = offsets[2, i]
+            if o >= 0:
+                data[o] = -gi
+            o = offsets[3, i]
+            if o >= 0:
+                data[o] = -gi
+else:
+    stamp_resistors = _stamp_resistors_numpy
@@ -1,456 +1,712 @@
-"""
-Advanced Circuit Solver - Nodal analysis with real component values
-Uses: NumPy for linear algebra, SciPy for ODE solving
-Implements: DC, AC (frequency), Transient time-domain analysis
-"""
-from typing import Dict, List, Tuple, Optional
-import numpy as np
-from scipy.integrate import odeint
-from scipy.linalg import solve
-import warnings
-
-warnings.filterwarnings('ignore')
-
-
-class CircuitSolver:
-    """
-    Main circuit solver using nodal analysis and modified nodal analysis (MNA)
-    """
-    
-    def __init__(self):
-        self.nodes: Dict[str, int] = {}  # node_name -> node_index
-        self.components: List[Dict] = []  # List of component dictionaries
-        self.node_counter = 0
-        self.ground_node = None
-        
-    def add_node(self, node_name: str) -> int:
-        """Add node and return its index"""
-        if node_name not in self.nodes:
-            if node_name.lower() == "gnd" or node_name.lower() == "ground":
-                self.ground_node = node_name
-                self.nodes[node_name] = 0  # Ground is always node 0
-            else:
-                self.node_counter += 1
-                self.nodes[node_name] = self.node_counter
-        return self.nodes[node_name]
-    
-    def add_resistor(self, name: str, node1: str, node2: str, resistance: float):
-        """Add resistor between two nodes
-        Args:
-            name: Component name
-            node1: From node
-            node2: To node
-            resistance: Resistance in Ohms (e.g., 1000 for 1kΩ, 1e6 for 1MΩ)
-        """
-        if resistance <= 0:
-            raise ValueError(f"Resistor {name} must have positive resistance, got {resistance}")
-        
-        n1 = self.add_node(node1)
-        n2 = self.add_node(node2)
-        
-        self.components.append({
-            'type': 'resistor',
-            'name': name,
-            'node1': n1,
-            'node2': n2,
-            'value': resistance,  # Ohms
-        })
-    
-    def add_capacitor(self, name: str, node1: str, node2: str, capacitance: float):
-        """Add capacitor between two nodes
-        Args:
-            name: Component name
-            node1: From node
-            node2: To node
-            capacitance: Capacitance in Farads (e.g., 1e-6 for 1μF, 1e-9 for 1nF)
-        """
-        if capacitance <= 0:
-            raise ValueError(f"Capacitor {name} must have positive capacitance, got {capacitance}")
-        
-        n1 = self.add_node(node1)
-        n2 = self.add_node(node2)
-        
-        self.components.append({
-            'type': 'capacitor',
-            'name': name,
-            'node1': n1,
-            'node2': n2,
-            'value': capacitance,  # Farads
-        })
-    
-    def add_inductor(self, name: str, node1: str, node2: str, inductance: float):
-        """Add inductor between two nodes
-        Args:
-            name: Component name
-            node1: From node
-            node2: To node
-            inductance: Inductance in Henries (e.g., 1e-3 for 1mH, 1e-6 for 1μH)
-        """
-        if inductance <= 0:
-            raise ValueError(f"Inductor {name} must have positive inductance, got {inductance}")
-        
-        n1 = self.add_node(node1)
-        n2 = self.add_node(node2)
-        
-        self.components.append({
-            'type': 'inductor',
-            'name': name,
-            'node1': n1,
-            'node2': n2,
-            'value': inductance,  # Henries
-        })
-    
-    def add_voltage_source(self, name: str, node_pos: str, node_neg: str, voltage: float):
-        """Add DC voltage source
-        Args:
-            name: Component name
-            node_pos: Positive terminal node
-            node_neg: Negative terminal node
-            voltage: Voltage in Volts (e.g., 5 for 5V, 12 for 12V)
-        """
-        n_pos = self.add_node(node_pos)
-        n_neg = self.add_node(node_neg)
-        
-        self.components.append({
-            'type': 'voltage_source',
-            'name': name,
-            'node_pos': n_pos,
-            'node_neg': n_neg,
-            'value': voltage,  # Volts
-        })
-    
-    def add_current_source(self, name: str, node1: str, node2: str, current: float):
-        """Add DC current source
-        Args:
-            name: Component name
-            node1: From node
-            node2: To node
-            current: Current in Amperes (e.g., 0.01 for 10mA, 1 for 1A)
-        """
-        n1 = self.add_node(node1)
-        n2 = self.add_node(node2)
-        
-        self.components.append({
-            'type': 'current_source',
-            'name': name,
-            'node1': n1,
-            'node2': n2,
-            'value': current,  # Amperes
-        })
-    
-    def dc_analysis(self) -> Dict:
-        """
-        Perform DC operating point analysis using nodal analysis
-        Returns: Dictionary with node voltages and component currents
-        """
-        if not self.nodes:
-            return {'status': 'failed', 'error': 'No nodes in circuit'}
-        
-        num_nodes = max(self.nodes.values()) + 1
-        
-        # Build Y matrix (admittance) and I vector (current sources)
-        Y = np.zeros((num_nodes, num_nodes))
-        I = np.zeros(num_nodes)
-        
-        # First pass: add resistors and current sources
-        for comp in self.components:
-            if comp['type'] == 'resistor':
-                n1, n2 = comp['node1'], comp['node2']
-                R = comp['value']
-                G = 1.0 / R  # Conductance
-                
-                # Y[n1,n1] += G, Y[n2,n2] += G, Y[n1,n2] -= G, Y[n2,n1] -= G
-                Y[n1, n1] += G
-                Y[n2, n2] += G
-                Y[n1, n2] -= G
-                Y[n2, n1] -= G
-            
-            elif comp['type'] == 'current_source':
-                n1, n2 = comp['node1'], comp['node2']
-                current = comp['value']
-                
-                # Current flows from n1 to n2
-                I[n1] -= current
-                I[n2] += current
-        
-        # Second pass: handle voltage sources as ideal current through admittance
-        voltage_sources = [c for c in self.components if c['type'] == 'voltage_source']
-        
-        for comp in voltage_sources:
-            n_pos = comp['node_pos']
-            n_neg = comp['node_neg']
-            voltage = comp['value']
-            
-            # Add large conductance to create voltage constraint
-            # This effectively makes the voltage source a stiff voltage constraint
-            G_source = 1e6  # Very large conductance
-            
-            if n_pos != 0:
-                Y[n_pos, n_pos] += G_source
-                I[n_pos] += G_source * voltage
-            
-            if n_neg != 0:
-                Y[n_neg, n_neg] += G_source
-                I[n_neg] -= G_source * voltage
-        
-        try:
-            # Ensure ground node is constrained to 0V
-            Y[0, :] = 0
-            Y[0, 0] = 1
-            I[0] = 0
-            
-            # Solve Y*V = I
-            V = solve(Y, I)
-            
-            # Calculate component currents
-            currents = self._calculate_currents(V)
-            
-            return {
-                'status': 'success',
-                'node_voltages': V,
-                'node_names': {name: V[idx] for name, idx in self.nodes.items()},
-                'component_currents': currents,
-                'nodes': self.nodes,
-            }
-        
-        except np.linalg.LinAlgError as e:
-            return {'status': 'failed', 'error': f'Singular matrix - check circuit topology: {str(e)}'}
-        except Exception as e:
-            return {'status': 'failed', 'error': f'Analysis failed: {str(e)}'}
-    
-    def ac_analysis(self, freq_start: float = 1, freq_end: float = 1e6, num_points: int = 100) -> Dict:
-        """
-        Perform AC frequency sweep analysis
-        Returns: Frequency response (magnitude and phase)
-        """
-        frequencies = np.logspace(np.log10(freq_start), np.log10(freq_end), num_points)
-        
-        results = {
-            'frequencies': frequencies,
-            'impedance': {},
-            'transfer_function': {},
-            'status': 'success',
-        }
-        
-        # Find voltage source and calculate transfer function
-        voltage_sources = [c for c in self.components if c['type'] == 'voltage_source']
-        if not voltage_sources:
-            return {'status': 'failed', 'error': 'No voltage source for AC analysis'}
-        
-        V_source = voltage_sources[0]['value']
-        
-        # Calculate impedances at each frequency
-        for comp in self.components:
-            if comp['type'] == 'resistor':
-                R = comp['value']
-                results['impedance'][comp['name']] = {
-                    'magnitude': np.ones(num_points) * R,
-                    'phase': np.zeros(num_points),
-                }
-            
-            elif comp['type'] == 'capacitor':
-                C = comp['value']
-                Z_C = []
-                phases = []
-                for f in frequencies:
-                    omega = 2 * np.pi * f
-                    Z = 1.0 / (1j * omega * C)
-                    Z_C.append(np.abs(Z))
-                    phases.append(np.angle(Z) * 180 / np.pi)
-                
-                results['impedance'][comp['name']] = {
-                    'magnitude': np.array(Z_C),
-                    'phase': np.array(phases),
-                }
-            
-            elif comp['type'] == 'inductor':
-                L = comp['value']
-                Z_L = []
-                phases = []
-                for f in frequencies:
-                    omega = 2 * np.pi * f
-                    Z = 1j * omega * L
-                    Z_L.append(np.abs(Z))
-                    phases.append(np.angle(Z) * 180 / np.pi)
-                
-                results['impedance'][comp['name']] = {
-                    'magnitude': np.array(Z_L),
-                    'phase': np.array(phases),
-                }
-        
-        return results
-    
-    def transient_analysis(self, duration: float = 0.1, time_step: float = 0.001) -> Dict:
-        """
-        Perform transient time-domain analysis
-        Solves differential equations for RC, RL, LC circuits
-        """
-        time_points = np.arange(0, duration, time_step)
-        
-        # Check for capacitors/inductors
-        capacitors = [c for c in self.components if c['type'] == 'capacitor']
-        inductors = [c for c in self.components if c['type'] == 'inductor']
-        
-        if not capacitors and not inductors:
-            # No energy storage - just do DC analysis at each time
-            return self._transient_resistive(time_points)
-        
-        # Simple RC circuit transient
-        if capacitors and not inductors:
-            return self._transient_rc(time_points, capacitors)
-        
-        # Simple RL circuit transient
-        if inductors and not capacitors:
-            return self._transient_rl(time_points, inductors)
-        
-        return {'status': 'failed', 'error': 'RLC transient analysis not yet implemented'}
-    
-    def _transient_rc(self, time_points, capacitors) -> Dict:
-        """Simple RC transient analysis"""
-        resistors = [c for c in self.components if c['type'] == 'resistor']
-        voltage_sources = [c for c in self.components if c['type'] == 'voltage_source']
-        
-        if not resistors or not voltage_sources or not capacitors:
-            return {'status': 'failed', 'error': 'Need R, C, and voltage source for RC analysis'}
-        
-        R = resistors[0]['value']
-        C = capacitors[0]['value']
-        V_in = voltage_sources[0]['value']
-        tau = R * C
-        
-        # RC charging: V_out(t) = V_in * (1 - exp(-t/tau))
-        V_out = V_in * (1 - np.exp(-time_points / tau))
-        I = (V_in - V_out) / R
-        P = I ** 2 * R
-        
-        return {
-            'status': 'success',
-            'time': time_points,
-            'voltage_out': V_out,
-            'current': I,
-            'power': P,
-            'tau': tau,
-        }
-    
-    def _transient_rl(self, time_points, inductors) -> Dict:
-        """Simple RL transient analysis"""
-        resistors = [c for c in self.components if c['type'] == 'resistor']
-        voltage_sources = [c for c in self.components if c['type'] == 'voltage_source']
-        
-        if not resistors or not voltage_sources or not inductors:
-            return {'status': 'failed', 'error': 'Need R, L, and voltage source for RL analysis'}
-        
-        R = resistors[0]['value']
-        L = inductors[0]['value']
-        V_in = voltage_sources[0]['value']
-        tau = L / R
-        
-        # RL inductor current rise: I(t) = (V_in/R) * (1 - exp(-t*R/L))
-        I = (V_in / R) * (1 - np.exp(-time_points * R / L))
-        V_L = V_in - I * R
-        P = I ** 2 * R
-        
-        return {
-            'status': 'success',
-            'time': time_points,
-            'current': I,
-            'voltage_L': V_L,
-            'power': P,
-            'tau': tau,
-        }
-    
-    def _transient_resistive(self, time_points) -> Dict:
-        """Resistive-only transient (no energy storage)"""
-        dc_result = self.dc_analysis()
-        
-        if dc_result.get('status') != 'success':
-            return dc_result
-        
-        V_nodes = dc_result['node_voltages']
-        currents = dc_result['component_currents']
-        
-        # Repeat results across time
-        node_voltages_time = {node: np.ones(len(time_points)) * V for node, V in zip(self.nodes.keys(), V_nodes)}
-        component_currents_time = {name: np.ones(len(time_points)) * I for name, I in currents.items()}
-        
-        return {
-            'status': 'success',
-            'time': time_points,
-            'node_voltages': node_voltages_time,
-            'component_currents': component_currents_time,
-        }
-    
-    def _calculate_currents(self, V: np.ndarray) -> Dict:
-        """Calculate currents through components"""
-        currents = {}
-        
-        for comp in self.components:
-            if comp['type'] == 'resistor':
-                n1, n2 = comp['node1'], comp['node2']
-                R = comp['value']
-                V_across = V[n1] - V[n2]
-                I = V_across / R
-                currents[comp['name']] = I
-            
-            elif comp['type'] == 'capacitor':
-                n1, n2 = comp['node1'], comp['node2']
-                V_across = V[n1] - V[n2]
-                # In DC analysis, capacitor is open circuit
-                currents[comp['name']] = 0.0
-            
-            elif comp['type'] == 'inductor':
-                n1, n2 = comp['node1'], comp['node2']
-                V_across = V[n1] - V[n2]
-                # In DC analysis, inductor is short circuit
-                L = comp['value']
-                # Current through inductor would need initial condition
-                currents[comp['name']] = 0.0
-        
-        return currents
-
-
-def parse_component_value(value_str: str) -> float:
-    """
-    Parse component value string to float
-    Examples:
-        "1k" -> 1000
-        "1.5k" -> 1500
-        "1M" -> 1000000
-        "1m" -> 0.001 (milliohm/farad)
-        "1u" -> 1e-6
-        "1n" -> 1e-9
-        "1p" -> 1e-12
-    """
-    if isinstance(value_str, (int, float)):
-        return float(value_str)
-    
-    value_str = str(value_str).strip().upper()
-    
-    # Multiplier map
-    multipliers = {
-        'P': 1e-12,  # pico
-        'N': 1e-9,   # nano
-        'U': 1e-6,   # micro
-        'M': 1e-3,   # milli (or mega for first M)
-        'K': 1e3,    # kilo
-        'MEG': 1e6,  # mega
-    }
-    
-    # Remove common units
-    value_str = value_str.replace('OHM', '').replace('Ω', '')
-    value_str = value_str.replace('F', '').replace('H', '')
-    value_str = value_str.replace('A', '').replace('V', '')
-    value_str = value_str.strip()
-    
-    # Find multiplier
-    multiplier = 1.0
-    for suffix, mult in multipliers.items():
-        if value_str.endswith(suffix):
-            multiplier = mult
-            value_str = value_str[:-len(suffix)].strip()
-            break
-    
-    try:
-        return float(value_str) * multiplier
-    except ValueError:
-        raise ValueError(f"Cannot parse component value: {value_str}")
+"""
+Advanced Circuit Solver - Nodal analysis with real component values
+Uses: NumPy for linear algebra, SciPy sparse LU for the MNA solve
+Implements: DC, AC (frequency), Transient time-domain analysis
+"""
+from typing import Dict, List, Tuple, Optional
+import numpy as np
+from scipy.sparse import csc_matrix
+from scipy.sparse.linalg import splu, spsolve
+import warnings
+
+try:
+    from ._stamp import stamp_resistors, build_specialized_stamper
+except ImportError:
+    from _stamp import stamp_resistors, build_specialized_stamper
+
+# Optional GPU backend: LU factorization stays on the CPU (hard to
+# parallelize) while the repeated triangular solves run on the GPU
+try:
+    import cupy as cp
+    from cupyx.scipy.sparse import csr_matrix as _cp_csr_matrix
+    from cupyx.scipy.sparse.linalg import spsolve_triangular as _cp_trisolve
+except ImportError:
+    cp = None
+
+warnings.filterwarnings('ignore')
+
+# Pre-lowered ground-node aliases; ground is always node 0
+_GND_ALIASES = frozenset({'gnd', 'ground', '0', 'vss'})
+
+# Stiff conductance modelling ideal voltage sources in DC and AC assembly
+_G_SOURCE = 1e6
+
+
+def _solve_lu_gpu(lu, B: np.ndarray) -> np.ndarray:
+    """
+    Apply a CPU-computed SuperLU factorization to an RHS block on the GPU
+    The L/U factors are uploaded once; only the RHS block and the solution
+    cross the bus. Solves Pr*A*Pc = L*U, i.e. x = Pc*(U \\ (L \\ Pr*b))
+    """
+    n = B.shape[0]
+    inv_perm_r = np.empty(n, dtype=np.intp)
+    inv_perm_r[lu.perm_r] = np.arange(n)
+
+    L_gpu = _cp_csr_matrix(lu.L.tocsr())
+    U_gpu = _cp_csr_matrix(lu.U.tocsr())
+    b_gpu = cp.asarray(B[inv_perm_r])
+
+    y = _cp_trisolve(L_gpu, b_gpu, lower=True)
+    x = _cp_trisolve(U_gpu, y, lower=False)
+    return cp.asnumpy(x)[lu.perm_c]
+
+
+class CircuitSolver:
+    """
+    Main circuit solver using nodal analysis and modified nodal analysis (MNA)
+    """
+
+    # Slots keep per-instance memory low for Monte-Carlo sweeps that spawn
+    # many solver copies; subclasses must declare their own __slots__
+    __slots__ = ('nodes', 'components', 'node_counter', 'ground_node',
+                 '_dc_pattern', '_by_type')
+
+    def __init__(self):
+        self.nodes: Dict[str, int] = {}  # node_name -> node_index
+        self.components: List[Dict] = []  # List of component dictionaries
+        self.node_counter = 0
+        self.ground_node = None
+        self._dc_pattern = None  # Cached (n_components, rows, cols) sparsity pattern
+        # Typed index so analyses avoid re-scanning the full component list
+        self._by_type: Dict[str, List[Dict]] = {
+            'resistor': [], 'capacitor': [], 'inductor': [],
+            'voltage_source': [], 'current_source': [],
+        }
+        
+    def add_node(self, node_name: str) -> int:
+        """Add node and return its index"""
+        idx = self.nodes.get(node_name)
+        if idx is not None:
+            return idx
+        # Single set-membership test instead of per-call .lower() comparisons;
+        # only fall back to lowering when the raw name misses
+        if node_name in _GND_ALIASES or node_name.lower() in _GND_ALIASES:
+            self.ground_node = node_name
+            self.nodes[node_name] = 0  # Ground is always node 0
+            return 0
+        self.node_counter += 1
+        self.nodes[node_name] = self.node_counter
+        return self.node_counter
+    
+    def add_resistor(self, name: str, node1: str, node2: str, resistance: float):
+        """Add resistor between two nodes
+        Args:
+            name: Component name
+            node1: From node
+            node2: To node
+            resistance: Resistance in Ohms (e.g., 1000 for 1kΩ, 1e6 for 1MΩ)
+        """
+        if resistance <= 0:
+            raise ValueError(f"Resistor {name} must have positive resistance, got {resistance}")
+        
+        n1 = self.add_node(node1)
+        n2 = self.add_node(node2)
+        
+        comp = {
+            'type': 'resistor',
+            'name': name,
+            'node1': n1,
+            'node2': n2,
+            'value': resistance,  # Ohms
+        }
+        self.components.append(comp)
+        self._by_type[comp['type']].append(comp)
+    
+    def add_capacitor(self, name: str, node1: str, node2: str, capacitance: float):
+        """Add capacitor between two nodes
+        Args:
+            name: Component name
+            node1: From node
+            node2: To node
+            capacitance: Capacitance in Farads (e.g., 1e-6 for 1μF, 1e-9 for 1nF)
+        """
+        if capacitance <= 0:
+            raise ValueError(f"Capacitor {name} must have positive capacitance, got {capacitance}")
+        
+        n1 = self.add_node(node1)
+        n2 = self.add_node(node2)
+        
+        comp = {
+            'type': 'capacitor',
+            'name': name,
+            'node1': n1,
+            'node2': n2,
+            'value': capacitance,  # Farads
+        }
+        self.components.append(comp)
+        self._by_type[comp['type']].append(comp)
+    
+    def add_inductor(self, name: str, node1: str, node2: str, inductance: float):
+        """Add inductor between two nodes
+        Args:
+            name: Component name
+            node1: From node
+            node2: To node
+            inductance: Inductance in Henries (e.g., 1e-3 for 1mH, 1e-6 for 1μH)
+        """
+        if inductance <= 0:
+            raise ValueError(f"Inductor {name} must have positive inductance, got {inductance}")
+        
+        n1 = self.add_node(node1)
+        n2 = self.add_node(node2)
+        
+        comp = {
+            'type': 'inductor',
+            'name': name,
+            'node1': n1,
+            'node2': n2,
+            'value': inductance,  # Henries
+        }
+        self.components.append(comp)
+        self._by_type[comp['type']].append(comp)
+    
+    def add_voltage_source(self, name: str, node_pos: str, node_neg: str, voltage: float):
+        """Add DC voltage source
+        Args:
+            name: Component name
+            node_pos: Positive terminal node
+            node_neg: Negative terminal node
+            voltage: Voltage in Volts (e.g., 5 for 5V, 12 for 12V)
+        """
+        n_pos = self.add_node(node_pos)
+        n_neg = self.add_node(node_neg)
+        
+        comp = {
+            'type': 'voltage_source',
+            'name': name,
+            'node_pos': n_pos,
+            'node_neg': n_neg,
+            'value': voltage,  # Volts
+        }
+        self.components.append(comp)
+        self._by_type[comp['type']].append(comp)
+    
+    def add_current_source(self, name: str, node1: str, node2: str, current: float):
+        """Add DC current source
+        Args:
+            name: Component name
+            node1: From node
+            node2: To node
+            current: Current in Amperes (e.g., 0.01 for 10mA, 1 for 1A)
+        """
+        n1 = self.add_node(node1)
+        n2 = self.add_node(node2)
+        
+        comp = {
+            'type': 'current_source',
+            'name': name,
+            'node1': n1,
+            'node2': n2,
+            'value': current,  # Amperes
+        }
+        self.components.append(comp)
+        self._by_type[comp['type']].append(comp)
+    
+    def dc_analysis(self) -> Dict:
+        """
+        Perform DC operating point analysis using nodal analysis
+        Returns: Dictionary with node voltages and component currents
+        """
+        if not self.nodes:
+            return {'status': 'failed', 'error': 'No nodes in circuit'}
+
+        # node_counter already tracks the highest assigned index, so the
+        # per-call max() scan over the node dict is unnecessary
+        num_nodes = self.node_counter + 1
+
+        try:
+            Y, I = self._assemble_dc(num_nodes)
+
+            # Solve Y*V = I; MMD_AT_PLUS_A suits the near-symmetric MNA matrix
+            lu = splu(Y, permc_spec='MMD_AT_PLUS_A')
+            V = lu.solve(I)
+
+            if not np.all(np.isfinite(V)):
+                return {'status': 'failed', 'error': 'Singular matrix - check circuit topology'}
+
+            # Calculate component currents
+            currents = self._calculate_currents(V)
+            
+            return {
+                'status': 'success',
+                'node_voltages': V,
+                'node_names': {name: V[idx] for name, idx in self.nodes.items()},
+                'component_currents': currents,
+                'nodes': self.nodes,
+            }
+        
+        except np.linalg.LinAlgError as e:
+            return {'status': 'failed', 'error': f'Singular matrix - check circuit topology: {str(e)}'}
+        except Exception as e:
+            return {'status': 'failed', 'error': f'Analysis failed: {str(e)}'}
+    
+    def _assemble_dc(self, num_nodes: int) -> Tuple[csc_matrix, np.ndarray]:
+        """
+        Assemble the DC MNA system Y*V = I for the current component values
+        Reuses the cached sparsity pattern on value-only re-solves
+        """
+        I = np.zeros(num_nodes)
+
+        # Gather resistor conductances as an SoA array; stamped in bulk below
+        resistors = self._by_type['resistor']
+        res_G = np.array([1.0 / c['value'] for c in resistors])
+
+        # Current sources: bulk-accumulate into the RHS vector
+        current_sources = self._by_type['current_source']
+        if current_sources:
+            cs_n1 = np.array([c['node1'] for c in current_sources], dtype=np.int32)
+            cs_n2 = np.array([c['node2'] for c in current_sources], dtype=np.int32)
+            cs_val = np.array([c['value'] for c in current_sources])
+            # Current flows from n1 to n2
+            np.add.at(I, cs_n1, -cs_val)
+            np.add.at(I, cs_n2, cs_val)
+
+        # Handle voltage sources as ideal current through a large conductance;
+        # this effectively makes the voltage source a stiff voltage constraint
+        voltage_sources = self._by_type['voltage_source']
+
+        vs_nodes = []
+        for comp in voltage_sources:
+            voltage = comp['value']
+            if comp['node_pos'] != 0:
+                vs_nodes.append(comp['node_pos'])
+                I[comp['node_pos']] += _G_SOURCE * voltage
+            if comp['node_neg'] != 0:
+                vs_nodes.append(comp['node_neg'])
+                I[comp['node_neg']] -= _G_SOURCE * voltage
+
+        # The sparsity pattern depends only on topology, so reuse the cached
+        # row/col index arrays on value-only re-solves (Monte-Carlo and
+        # tolerance sweeps re-run dc_analysis with perturbed values)
+        if self._dc_pattern is not None and self._dc_pattern[0] == len(self.components):
+            _, rows, cols, res_offsets, data_template, specialized = self._dc_pattern
+        else:
+            res_n1 = np.array([c['node1'] for c in resistors], dtype=np.int32)
+            res_n2 = np.array([c['node2'] for c in resistors], dtype=np.int32)
+            vs_arr = np.array(vs_nodes, dtype=np.int32)
+
+            # COO triplets: diagonal stamps (n1,n1)/(n2,n2) get +G,
+            # off-diagonal stamps (n1,n2)/(n2,n1) get -G, then the
+            # voltage-source diagonal entries
+            all_rows = np.concatenate([res_n1, res_n2, res_n1, res_n2, vs_arr])
+            all_cols = np.concatenate([res_n1, res_n2, res_n2, res_n1, vs_arr])
+
+            # The ground node is constrained to 0V at assembly time: skip
+            # every stamp into row 0 and add a single (0,0)=1 entry instead
+            # of wiping a whole matrix row afterwards. Column-0 stamps are
+            # harmless since V[0] solves to exactly 0.
+            keep = all_rows != 0
+            rows = np.append(all_rows[keep], 0)
+            cols = np.append(all_cols[keep], 0)
+
+            # Destination slot of every original triplet in the filtered
+            # data array; -1 marks dropped ground-row stamps. The first
+            # 4*n_res triplets are the resistor blocks, the rest the
+            # voltage-source diagonal, which is constant per topology and
+            # prefilled in the template along with the ground pin.
+            pos = np.cumsum(keep) - 1
+            pos[~keep] = -1
+            res_offsets = np.ascontiguousarray(
+                pos[:4 * len(resistors)].reshape(4, len(resistors)))
+            data_template = np.empty(len(rows))
+            vs_pos = pos[4 * len(resistors):]
+            data_template[vs_pos[vs_pos >= 0]] = _G_SOURCE
+            data_template[-1] = 1.0
+
+            # With numba present, small fixed topologies get a generated
+            # stamper with the offsets unrolled as literals; None keeps
+            # the generic kernel
+            specialized = build_specialized_stamper(res_offsets)
+            self._dc_pattern = (len(self.components), rows, cols,
+                                res_offsets, data_template, specialized)
+
+        # Value-only work per solve: copy the template and let the stamp
+        # kernel write the conductances in a single fused pass
+        data = data_template.copy()
+        if specialized is not None:
+            specialized(data, res_G)
+        else:
+            stamp_resistors(data, res_offsets, res_G)
+        I[0] = 0
+
+        Y = csc_matrix((data, (rows, cols)), shape=(num_nodes, num_nodes))
+        return Y, I
+
+    def dc_source_sweep(self, source_name: str, values,
+                        use_gpu: bool = False) -> Dict:
+        """
+        Solve the DC operating point for many values of one voltage source
+        Source values only enter the right-hand side under the stiff-
+        conductance model, so the matrix is factorized once and all sweep
+        points are solved in a single multi-RHS triangular solve (BLAS-3)
+        instead of one factor-plus-solve per point
+        With use_gpu=True and cupy installed, the triangular solves run on
+        the GPU against the CPU-computed factors; without cupy the flag
+        silently falls back to the CPU path
+        """
+        source = next((c for c in self._by_type['voltage_source']
+                       if c['name'] == source_name), None)
+        if source is None:
+            return {'status': 'failed',
+                    'error': f'No voltage source named {source_name}'}
+        if not self.nodes:
+            return {'status': 'failed', 'error': 'No nodes in circuit'}
+
+        values = np.asarray(values, dtype=float)
+        num_nodes = self.node_counter + 1
+
+        try:
+            Y, I = self._assemble_dc(num_nodes)
+
+            # Every column shares the base RHS; the swept source shifts its
+            # node injections by the per-point delta from its current value
+            B = np.repeat(I[:, None], len(values), axis=1)
+            delta = _G_SOURCE * (values - source['value'])
+            if source['node_pos'] != 0:
+                B[source['node_pos'], :] += delta
+            if source['node_neg'] != 0:
+                B[source['node_neg'], :] -= delta
+
+            lu = splu(Y, permc_spec='MMD_AT_PLUS_A')
+            if use_gpu and cp is not None:
+                V = _solve_lu_gpu(lu, B)
+            else:
+                V = lu.solve(B)
+
+            if not np.all(np.isfinite(V)):
+                return {'status': 'failed', 'error': 'Singular matrix - check circuit topology'}
+
+            return {
+                'status': 'success',
+                'values': values,
+                'node_voltages': V,
+                'node_names': {name: V[idx, :] for name, idx in self.nodes.items()},
+                'nodes': self.nodes,
+            }
+
+        except np.linalg.LinAlgError as e:
+            return {'status': 'failed', 'error': f'Singular matrix - check circuit topology: {str(e)}'}
+        except Exception as e:
+            return {'status': 'failed', 'error': f'Analysis failed: {str(e)}'}
+
+    def dc_analysis_refactor(self, new_values: Optional[Dict[str, float]] = None) -> Dict:
+        """
+        Re-run DC analysis after value-only perturbations (fixed topology)
+        Updates component values by name, then re-solves reusing the cached
+        sparsity pattern - intended for Monte-Carlo / tolerance sweeps
+        """
+        if new_values:
+            for comp in self.components:
+                value = new_values.get(comp['name'])
+                if value is not None:
+                    comp['value'] = value
+        return self.dc_analysis()
+
+    def ac_analysis(self, freq_start: float = 1, freq_end: float = 1e6, num_points: int = 100,
+                    dtype=np.complex128) -> Dict:
+        """
+        Perform AC frequency sweep analysis
+        Returns: Frequency response (magnitude and phase)
+        dtype complex64 halves matrix memory traffic for the sweep solves;
+        RLC network condition numbers are modest, so single precision is
+        usually sufficient for Bode plots (complex128 stays the default)
+        """
+        dtype = np.dtype(dtype)
+        frequencies = np.logspace(np.log10(freq_start), np.log10(freq_end), num_points)
+        omega = 2 * np.pi * frequencies
+
+        results = {
+            'frequencies': frequencies,
+            'impedance': {},
+            'transfer_function': {},
+            'status': 'success',
+        }
+
+        voltage_sources = self._by_type['voltage_source']
+        if not voltage_sources:
+            return {'status': 'failed', 'error': 'No voltage source for AC analysis'}
+
+        # Component impedances across the whole sweep as vector ops
+        for comp in self.components:
+            if comp['type'] == 'resistor':
+                R = comp['value']
+                results['impedance'][comp['name']] = {
+                    'magnitude': np.full(num_points, R),
+                    'phase': np.zeros(num_points),
+                }
+
+            elif comp['type'] == 'capacitor':
+                C = comp['value']
+                # Z = 1/(jωC): magnitude 1/(ωC), phase -90°
+                results['impedance'][comp['name']] = {
+                    'magnitude': 1.0 / (omega * C),
+                    'phase': np.full(num_points, -90.0),
+                }
+
+            elif comp['type'] == 'inductor':
+                L = comp['value']
+                # Z = jωL: magnitude ωL, phase +90°
+                results['impedance'][comp['name']] = {
+                    'magnitude': omega * L,
+                    'phase': np.full(num_points, 90.0),
+                }
+
+        # Solve the full network per frequency: Y(ω) = G + jωC + Γ/(jω)
+        # where G holds conductances, C capacitor stamps and Γ reciprocal
+        # inductances, all sharing the assembly-time ground constraint
+        num_nodes = self.node_counter + 1
+        g_rows, g_cols, g_data = [0], [0], [1.0]  # ground pin (0,0)=1
+        c_rows, c_cols, c_data = [], [], []
+        l_rows, l_cols, l_data = [], [], []
+
+        def stamp(rows, cols, data, n1, n2, val):
+            # Skip row-0 stamps; ground is pinned to 0V above
+            if n1 != 0:
+                rows += (n1, n1)
+                cols += (n1, n2)
+                data += (val, -val)
+            if n2 != 0:
+                rows += (n2, n2)
+                cols += (n2, n1)
+                data += (val, -val)
+
+        b = np.zeros(num_nodes, dtype=dtype)
+        G_source = _G_SOURCE  # Stiff voltage-source conductance, as in DC
+
+        for comp in self.components:
+            if comp['type'] == 'resistor':
+                stamp(g_rows, g_cols, g_data,
+                      comp['node1'], comp['node2'], 1.0 / comp['value'])
+            elif comp['type'] == 'capacitor':
+                stamp(c_rows, c_cols, c_data,
+                      comp['node1'], comp['node2'], comp['value'])
+            elif comp['type'] == 'inductor':
+                stamp(l_rows, l_cols, l_data,
+                      comp['node1'], comp['node2'], 1.0 / comp['value'])
+            elif comp['type'] == 'voltage_source':
+                if comp['node_pos'] != 0:
+                    g_rows.append(comp['node_pos'])
+                    g_cols.append(comp['node_pos'])
+                    g_data.append(G_source)
+                    b[comp['node_pos']] += G_source * comp['value']
+                if comp['node_neg'] != 0:
+                    g_rows.append(comp['node_neg'])
+                    g_cols.append(comp['node_neg'])
+                    g_data.append(G_source)
+                    b[comp['node_neg']] -= G_source * comp['value']
+
+        shape = (num_nodes, num_nodes)
+        G = csc_matrix((g_data, (g_rows, g_cols)), shape=shape, dtype=dtype)
+        C = csc_matrix((c_data, (c_rows, c_cols)), shape=shape, dtype=dtype)
+        Gam = csc_matrix((l_data, (l_rows, l_cols)), shape=shape, dtype=dtype)
+
+        # jω as the requested dtype so scalar products don't upcast the
+        # assembled matrices back to complex128
+        jw = (2j * np.pi * frequencies).astype(dtype)
+
+        try:
+            V = np.array([spsolve(G + w * C + Gam / w, b) for w in jw])
+        except Exception as e:
+            return {'status': 'failed', 'error': f'AC solve failed: {str(e)}'}
+
+        for name, idx in self.nodes.items():
+            results['transfer_function'][name] = {
+                'magnitude': np.abs(V[:, idx]),
+                'phase': np.angle(V[:, idx]) * 180 / np.pi,
+            }
+
+        return results
+    
+    def transient_analysis(self, duration: float = 0.1, time_step: float = 0.001) -> Dict:
+        """
+        Perform transient time-domain analysis
+        Solves differential equations for RC, RL, LC circuits
+        """
+        time_points = np.arange(0, duration, time_step)
+        
+        # Check for capacitors/inductors
+        capacitors = self._by_type['capacitor']
+        inductors = self._by_type['inductor']
+        
+        if not capacitors and not inductors:
+            # No energy storage - just do DC analysis at each time
+            return self._transient_resistive(time_points)
+        
+        # Simple RC circuit transient
+        if capacitors and not inductors:
+            return self._transient_rc(time_points, capacitors)
+        
+        # Simple RL circuit transient
+        if inductors and not capacitors:
+            return self._transient_rl(time_points, inductors)
+        
+        return {'status': 'failed', 'error': 'RLC transient analysis not yet implemented'}
+    
+    def _transient_rc(self, time_points, capacitors) -> Dict:
+        """Simple RC transient analysis"""
+        resistors = self._by_type['resistor']
+        voltage_sources = self._by_type['voltage_source']
+        
+        if not resistors or not voltage_sources or not capacitors:
+            return {'status': 'failed', 'error': 'Need R, C, and voltage source for RC analysis'}
+        
+        R = resistors[0]['value']
+        C = capacitors[0]['value']
+        V_in = voltage_sources[0]['value']
+        tau = R * C
+        
+        # RC charging: V_out(t) = V_in * (1 - exp(-t/tau))
+        # Computed with in-place ufuncs to avoid full-length temporaries
+        V_out = np.empty_like(time_points)
+        np.divide(time_points, -tau, out=V_out)
+        np.exp(V_out, out=V_out)
+        np.subtract(1.0, V_out, out=V_out)
+        V_out *= V_in
+
+        I = np.subtract(V_in, V_out)
+        I /= R
+
+        P = np.square(I)
+        P *= R
+        
+        return {
+            'status': 'success',
+            'time': time_points,
+            'voltage_out': V_out,
+            'current': I,
+            'power': P,
+            'tau': tau,
+        }
+    
+    def _transient_rl(self, time_points, inductors) -> Dict:
+        """Simple RL transient analysis"""
+        resistors = self._by_type['resistor']
+        voltage_sources = self._by_type['voltage_source']
+        
+        if not resistors or not voltage_sources or not inductors:
+            return {'status': 'failed', 'error': 'Need R, L, and voltage source for RL analysis'}
+        
+        R = resistors[0]['value']
+        L = inductors[0]['value']
+        V_in = voltage_sources[0]['value']
+        tau = L / R
+        
+        # RL inductor current rise: I(t) = (V_in/R) * (1 - exp(-t*R/L))
+        # Same in-place ufunc chain as the RC kernel
+        I = np.empty_like(time_points)
+        np.divide(time_points, -tau, out=I)
+        np.exp(I, out=I)
+        np.subtract(1.0, I, out=I)
+        I *= V_in / R
+
+        V_L = np.multiply(I, -R)
+        V_L += V_in
+
+        P = np.square(I)
+        P *= R
+        
+        return {
+            'status': 'success',
+            'time': time_points,
+            'current': I,
+            'voltage_L': V_L,
+            'power': P,
+            'tau': tau,
+        }
+    
+    def _transient_resistive(self, time_points) -> Dict:
+        """Resistive-only transient (no energy storage)"""
+        dc_result = self.dc_analysis()
+        
+        if dc_result.get('status') != 'success':
+            return dc_result
+        
+        V_nodes = dc_result['node_voltages']
+        currents = dc_result['component_currents']
+        
+        # Repeat results across time as zero-copy read-only views;
+        # callers that need writable arrays must copy
+        node_voltages_time = {node: np.broadcast_to(V, time_points.shape) for node, V in zip(self.nodes.keys(), V_nodes)}
+        component_currents_time = {name: np.broadcast_to(I, time_points.shape) for name, I in currents.items()}
+        
+        return {
+            'status': 'success',
+            'time': time_points,
+            'node_voltages': node_voltages_time,
+            'component_currents': component_currents_time,
+        }
+    
+    def _calculate_currents(self, V: np.ndarray) -> Dict:
+        """Calculate currents through components"""
+        currents = {}
+        
+        for comp in self.components:
+            if comp['type'] == 'resistor':
+                n1, n2 = comp['node1'], comp['node2']
+                R = comp['value']
+                V_across = V[n1] - V[n2]
+                I = V_across / R
+                currents[comp['name']] = I
+            
+            elif comp['type'] == 'capacitor':
+                n1, n2 = comp['node1'], comp['node2']
+                V_across = V[n1] - V[n2]
+                # In DC analysis, capacitor is open circuit
+                currents[comp['name']] = 0.0
+            
+            elif comp['type'] == 'inductor':
+                n1, n2 = comp['node1'], comp['node2']
+                V_across = V[n1] - V[n2]
+                # In DC analysis, inductor is short circuit
+                L = comp['value']
+                # Current through inductor would need initial condition
+                currents[comp['name']] = 0.0
+        
+        return currents
+
+
+def parse_component_value(value_str: str) -> float:
+    """
+    Parse component value string to float
+    Examples:
+        "1k" -> 1000
+        "1.5k" -> 1500
+        "1M" -> 1000000
+        "1m" -> 0.001 (milliohm/farad)
+        "1u" -> 1e-6
+        "1n" -> 1e-9
+        "1p" -> 1e-12
+    """
+    if isinstance(value_str, (int, float)):
+        return float(value_str)
+    
+    value_str = str(value_str).strip().upper()
+    
+    # Multiplier map
+    multipliers = {
+        'P': 1e-12,  # pico
+        'N': 1e-9,   # nano
+        'U': 1e-6,   # micro
+        'M': 1e-3,   # milli (or mega for first M)
+        'K': 1e3,    # kilo
+        'MEG': 1e6,  # mega
+    }
+    
+    # Remove common units
+    value_str = value_str.replace('OHM', '').replace('Ω', '')
+    value_str = value_str.replace('F', '').replace('H', '')
+    value_str = value_str.replace('A', '').replace('V', '')
+    value_str = value_str.strip()
+    
+    # Find multiplier
+    multiplier = 1.0
+    for suffix, mult in multipliers.items():
+        if value_str.endswith(suffix):
+            multiplier = mult
+            value_str = value_str[:-len(suffix)].strip()
+            break
+    
+    try:
+        return float(value_str) * multiplier
+    except ValueError:
+        raise ValueError(f"Cannot parse component value: {value_str}")
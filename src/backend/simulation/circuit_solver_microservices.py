@@ -1,287 +1,490 @@
-"""
-Circuit Solver Microservices Adapter
-Bridges the existing CircuitSolver interface with new microservices architecture
-Provides backward compatibility while leveraging all new services
-"""
-from typing import Dict, List, Tuple, Optional
-import sys
-from pathlib import Path
-
-# Add parent path to imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from services import (
-    ServiceManager, 
-    DCAnalyzer, 
-    ACAnalyzer, 
-    TransientAnalyzer,
-    ComponentService,
-    ComponentValidator,
-    SimulationCoordinator
-)
-
-
-class CircuitSolverMicroservices:
-    """
-    Enhanced circuit solver using the new microservices architecture
-    Provides the same interface as CircuitSolver but uses ServiceManager internally
-    """
-    
-    def __init__(self):
-        """Initialize with ServiceManager"""
-        self.service_manager = ServiceManager()
-        self.dc_analyzer = self.service_manager.dc_analyzer
-        self.ac_analyzer = self.service_manager.ac_analyzer
-        self.transient_analyzer = self.service_manager.transient_analyzer
-        self.component_service = self.service_manager.component_service
-        self.library_service = self.service_manager.library_service
-        
-        self.nodes: Dict[str, int] = {}
-        self.node_counter = 0
-        self.components_list: List[Dict] = []
-        self.circuit_name = "Circuit"
-    
-    def add_node(self, node_name: str) -> int:
-        """Add node and return its index"""
-        if node_name not in self.nodes:
-            if node_name.lower() in ["gnd", "ground", "0"]:
-                self.nodes[node_name] = 0
-            else:
-                self.node_counter += 1
-                self.nodes[node_name] = self.node_counter
-        return self.nodes[node_name]
-    
-    def add_resistor(self, name: str, node1: str, node2: str, resistance: float):
-        """Add resistor with value in Ohms"""
-        if resistance <= 0:
-            raise ValueError(f"Resistor {name}: resistance must be positive, got {resistance}")
-        
-        n1 = self.add_node(node1)
-        n2 = self.add_node(node2)
-        
-        self.dc_analyzer.add_resistor(name, n1, n2, resistance)
-        self.ac_analyzer.add_resistor(name, n1, n2, resistance)
-        self.transient_analyzer.add_resistor(name, n1, n2, resistance)
-        
-        self.components_list.append({
-            'type': 'resistor',
-            'name': name,
-            'node1': n1,
-            'node2': n2,
-            'value': resistance,
-        })
-    
-    def add_capacitor(self, name: str, node1: str, node2: str, capacitance: float):
-        """Add capacitor with value in Farads"""
-        if capacitance <= 0:
-            raise ValueError(f"Capacitor {name}: capacitance must be positive, got {capacitance}")
-        
-        n1 = self.add_node(node1)
-        n2 = self.add_node(node2)
-        
-        self.ac_analyzer.add_capacitor(name, n1, n2, capacitance)
-        self.transient_analyzer.add_capacitor(name, n1, n2, capacitance)
-        
-        self.components_list.append({
-            'type': 'capacitor',
-            'name': name,
-            'node1': n1,
-            'node2': n2,
-            'value': capacitance,
-        })
-    
-    def add_inductor(self, name: str, node1: str, node2: str, inductance: float):
-        """Add inductor with value in Henries"""
-        if inductance <= 0:
-            raise ValueError(f"Inductor {name}: inductance must be positive, got {inductance}")
-        
-        n1 = self.add_node(node1)
-        n2 = self.add_node(node2)
-        
-        self.ac_analyzer.add_inductor(name, n1, n2, inductance)
-        self.transient_analyzer.add_inductor(name, n1, n2, inductance)
-        
-        self.components_list.append({
-            'type': 'inductor',
-            'name': name,
-            'node1': n1,
-            'node2': n2,
-            'value': inductance,
-        })
-    
-    def add_voltage_source(self, name: str, node_pos: str, node_neg: str, voltage: float):
-        """Add voltage source with value in Volts"""
-        n_pos = self.add_node(node_pos)
-        n_neg = self.add_node(node_neg)
-        
-        self.dc_analyzer.add_voltage_source(name, n_pos, n_neg, voltage)
-        self.ac_analyzer.add_voltage_source(name, n_pos, n_neg, voltage, phase=0)
-        # For transient, add as pulse with rise at t=0
-        self.transient_analyzer.add_pulse_source(name, n_pos, n_neg, 0, voltage, 0)
-        
-        self.components_list.append({
-            'type': 'voltage_source',
-            'name': name,
-            'node_pos': n_pos,
-            'node_neg': n_neg,
-            'value': voltage,
-        })
-    
-    def add_current_source(self, name: str, node1: str, node2: str, current: float):
-        """Add current source with value in Amperes"""
-        n1 = self.add_node(node1)
-        n2 = self.add_node(node2)
-        
-        self.dc_analyzer.add_current_source(name, n1, n2, current)
-        
-        self.components_list.append({
-            'type': 'current_source',
-            'name': name,
-            'node1': n1,
-            'node2': n2,
-            'value': current,
-        })
-    
-    def dc_analysis(self) -> Dict:
-        """Perform DC analysis using DCAnalyzer service"""
-        try:
-            if not self.nodes:
-                return {'status': 'failed', 'error': 'No nodes in circuit'}
-            
-            num_nodes = max(self.nodes.values()) + 1
-            result = self.dc_analyzer.solve(num_nodes)
-            
-            # Ensure result has all required fields
-            if isinstance(result, dict) and result.get('node_voltages') is not None:
-                return {
-                    'status': 'success',
-                    'node_voltages': result.get('node_voltages'),
-                    'node_names': {name: result['node_voltages'][idx] 
-                                  for name, idx in self.nodes.items() 
-                                  if idx < len(result['node_voltages'])},
-                    'component_currents': result.get('currents', {}),
-                    'nodes': self.nodes,
-                }
-            else:
-                return {'status': 'failed', 'error': 'Invalid DC analyzer result'}
-        except Exception as e:
-            import traceback
-            return {'status': 'failed', 'error': f'DC analysis error: {str(e)}\n{traceback.format_exc()}'}
-    
-    def ac_analysis(self, freq_start: float = 1, freq_end: float = 1e6, num_points: int = 100) -> Dict:
-        """Perform AC analysis using ACAnalyzer service"""
-        try:
-            num_nodes = max(self.nodes.values()) + 1
-            result = self.ac_analyzer.solve(
-                frequencies=list(range(num_points)),
-                num_nodes=num_nodes
-            )
-            
-            return {
-                'status': 'success',
-                'frequencies': result.get('frequencies'),
-                'impedance': result.get('impedances', {}),
-                'transfer_function': result.get('transfer_function', {}),
-            }
-        except Exception as e:
-            return {'status': 'failed', 'error': str(e)}
-    
-    def transient_analysis(self, duration: float = 0.1, time_step: float = 0.001) -> Dict:
-        """Perform transient analysis using TransientAnalyzer service"""
-        try:
-            result = self.transient_analyzer.solve(
-                t_span=(0, duration),
-                num_points=int(duration / time_step),
-                method='RK45'
-            )
-            
-            return {
-                'status': 'success',
-                'time': result.get('time'),
-                'voltage': result.get('voltage'),
-                'current': result.get('current'),
-                'power': result.get('power'),
-            }
-        except Exception as e:
-            return {'status': 'failed', 'error': str(e)}
-    
-    def validate_circuit(self) -> Tuple[bool, List[str]]:
-        """Validate circuit components"""
-        try:
-            # Basic validation
-            if not self.nodes:
-                return False, ["No nodes in circuit"]
-            
-            if not self.components_list:
-                return False, ["No components in circuit"]
-            
-            errors = []
-            
-            # Validate each component
-            for comp in self.components_list:
-                if comp['type'] == 'resistor':
-                    if comp['value'] <= 0:
-                        errors.append(f"{comp['name']}: Resistance must be positive")
-                elif comp['type'] == 'capacitor':
-                    if comp['value'] <= 0:
-                        errors.append(f"{comp['name']}: Capacitance must be positive")
-                elif comp['type'] == 'inductor':
-                    if comp['value'] <= 0:
-                        errors.append(f"{comp['name']}: Inductance must be positive")
-            
-            return len(errors) == 0, errors
-        except Exception as e:
-            return False, [str(e)]
-    
-    def get_system_info(self) -> Dict:
-        """Get system information and statistics"""
-        return {
-            'nodes': len(self.nodes),
-            'components': len(self.components_list),
-            'services': {
-                'dc_analyzer': 'active',
-                'ac_analyzer': 'active',
-                'transient_analyzer': 'active',
-                'component_validator': 'active',
-                'simulation_coordinator': 'active',
-            },
-            'libraries': len(self.library_service.libraries),
-            'total_components_available': sum(
-                len(lib_data.get('components', [])) 
-                for lib_data in self.library_service.libraries.values()
-            )
-        }
-
-
-def parse_component_value(value_str: str) -> float:
-    """
-    Parse component value string to float using ValueParser service
-    Examples: "1k" -> 1000, "1.5M" -> 1500000, "100n" -> 1e-7
-    """
-    try:
-        from services import ValueParser
-        parser = ValueParser()
-        return parser.parse(value_str)
-    except Exception:
-        # Fallback to simple parsing
-        if isinstance(value_str, (int, float)):
-            return float(value_str)
-        
-        value_str = str(value_str).strip().upper()
-        multipliers = {
-            'P': 1e-12, 'N': 1e-9, 'U': 1e-6, 'M': 1e-3, 'K': 1e3, 'MEG': 1e6,
-        }
-        
-        value_str = value_str.replace('OHM', '').replace('Ω', '')
-        value_str = value_str.replace('F', '').replace('H', '')
-        value_str = value_str.replace('A', '').replace('V', '')
-        value_str = value_str.strip()
-        
-        multiplier = 1.0
-        for suffix, mult in multipliers.items():
-            if value_str.endswith(suffix):
-                multiplier = mult
-                value_str = value_str[:-len(suffix)].strip()
-                break
-        
-        return float(value_str) * multiplier
+"""
+Circuit Solver Microservices Adapter
+Bridges the existing CircuitSolver interface with new microservices architecture
+Provides backward compatibility while leveraging all new services
+"""
+from typing import Dict, List, Tuple, Optional
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent path to imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services import (
+    ServiceManager, 
+    DCAnalyzer, 
+    ACAnalyzer, 
+    TransientAnalyzer,
+    ComponentService,
+    ComponentValidator,
+    SimulationCoordinator
+)
+
+# Shared parser instance; importing and constructing one per
+# parse_component_value call dominated batch netlist parsing
+try:
+    from services import ValueParser
+    _VALUE_PARSER = ValueParser()
+except Exception:
+    _VALUE_PARSER = None
+
+_SERVICE_MANAGER: Optional[ServiceManager] = None
+
+
+def _get_service_manager() -> ServiceManager:
+    """
+    Lazily created ServiceManager shared by all adapter instances
+    Constructing one per adapter re-loaded the component libraries from
+    disk every time; the shared services are read-only from the adapter's
+    point of view, so a single manager serves every solver
+    """
+    global _SERVICE_MANAGER
+    if _SERVICE_MANAGER is None:
+        _SERVICE_MANAGER = ServiceManager()
+    return _SERVICE_MANAGER
+
+
+class _ComponentArrays:
+    """
+    Structure-of-arrays storage for one component class
+    Parallel node/value arrays with a doubling capacity policy; far smaller
+    than a dict per component and directly usable by vectorized validation
+    """
+
+    __slots__ = ('names', 'n1', 'n2', 'value', 'count')
+
+    def __init__(self, capacity: int = 16):
+        self.names: List[str] = []
+        self.n1 = np.empty(capacity, dtype=np.int32)
+        self.n2 = np.empty(capacity, dtype=np.int32)
+        self.value = np.empty(capacity, dtype=np.float64)
+        self.count = 0
+
+    def append(self, name: str, n1: int, n2: int, value: float) -> None:
+        if self.count == len(self.value):
+            new_cap = 2 * len(self.value)
+            self.n1 = np.resize(self.n1, new_cap)
+            self.n2 = np.resize(self.n2, new_cap)
+            self.value = np.resize(self.value, new_cap)
+        self.names.append(name)
+        self.n1[self.count] = n1
+        self.n2[self.count] = n2
+        self.value[self.count] = value
+        self.count += 1
+
+    def reserve(self, capacity: int) -> None:
+        """Grow the buffers to at least capacity without changing count"""
+        if capacity > len(self.value):
+            self.n1 = np.resize(self.n1, capacity)
+            self.n2 = np.resize(self.n2, capacity)
+            self.value = np.resize(self.value, capacity)
+
+    def values(self) -> np.ndarray:
+        """View of the populated portion of the value array"""
+        return self.value[:self.count]
+
+
+class Comp:
+    """
+    Lightweight per-component record for codepaths that need one object
+    per component; slots avoid the per-instance dict a literal would cost
+    """
+
+    __slots__ = ('type', 'name', 'n1', 'n2', 'value')
+
+    def __init__(self, comp_type: str, name: str, n1: int, n2: int,
+                 value: float):
+        self.type = comp_type
+        self.name = name
+        self.n1 = n1
+        self.n2 = n2
+        self.value = value
+
+
+class CircuitSolverMicroservices:
+    """
+    Enhanced circuit solver using the new microservices architecture
+    Provides the same interface as CircuitSolver but uses ServiceManager internally
+    """
+    
+    def __init__(self, debug: bool = False):
+        """Initialize with the shared ServiceManager"""
+        self._debug = debug
+        self.service_manager = _get_service_manager()
+        # Analyzers hold per-circuit state, so each adapter gets fresh
+        # ones; only the library/component services are shared
+        self.dc_analyzer = self.service_manager.new_dc_analyzer()
+        self.ac_analyzer = self.service_manager.new_ac_analyzer()
+        self.transient_analyzer = self.service_manager.new_transient_analyzer()
+        self.component_service = self.service_manager.component_service
+        self.library_service = self.service_manager.library_service
+        
+        self.nodes: Dict[str, int] = {}
+        self.node_counter = 0
+        # SoA component storage, one array set per component class
+        self._arrays: Dict[str, _ComponentArrays] = {
+            'resistor': _ComponentArrays(),
+            'capacitor': _ComponentArrays(),
+            'inductor': _ComponentArrays(),
+            'voltage_source': _ComponentArrays(),
+            'current_source': _ComponentArrays(),
+        }
+        # How many entries per type have been forwarded to the analyzers
+        self._flushed: Dict[str, int] = {t: 0 for t in self._arrays}
+        self.circuit_name = "Circuit"
+
+    @property
+    def components_list(self) -> List[Comp]:
+        """Per-component records rebuilt from the SoA arrays (compatibility)"""
+        comps = []
+        for comp_type, arrays in self._arrays.items():
+            for i in range(arrays.count):
+                comps.append(Comp(comp_type, arrays.names[i],
+                                  int(arrays.n1[i]), int(arrays.n2[i]),
+                                  float(arrays.value[i])))
+        return comps
+    
+    # Ground aliases with common casings pre-listed so most hits avoid .lower()
+    _GND_ALIASES = frozenset(("gnd", "ground", "0", "GND", "Ground"))
+
+    def add_node(self, node_name: str) -> int:
+        """Add node and return its index"""
+        idx = self.nodes.get(node_name)
+        if idx is not None:
+            return idx
+        if node_name in self._GND_ALIASES or node_name.lower() in self._GND_ALIASES:
+            self.nodes[node_name] = 0
+            return 0
+        self.node_counter += 1
+        self.nodes[node_name] = self.node_counter
+        return self.node_counter
+    
+    def reserve(self, n_components: int) -> None:
+        """
+        Pre-size component buffers before a bulk netlist load
+        Each component class is sized for the full count since the split is
+        not known up front; the node dict still grows as nodes are added
+        (CPython dicts cannot be pre-sized)
+        """
+        for arrays in self._arrays.values():
+            arrays.reserve(n_components)
+
+    def add_resistor(self, name: str, node1: str, node2: str, resistance: float):
+        """Add resistor with value in Ohms"""
+        if resistance <= 0:
+            raise ValueError(f"Resistor {name}: resistance must be positive, got {resistance}")
+        
+        n1 = self.add_node(node1)
+        n2 = self.add_node(node2)
+
+        self._arrays['resistor'].append(name, n1, n2, resistance)
+    
+    def add_capacitor(self, name: str, node1: str, node2: str, capacitance: float):
+        """Add capacitor with value in Farads"""
+        if capacitance <= 0:
+            raise ValueError(f"Capacitor {name}: capacitance must be positive, got {capacitance}")
+        
+        n1 = self.add_node(node1)
+        n2 = self.add_node(node2)
+
+        self._arrays['capacitor'].append(name, n1, n2, capacitance)
+    
+    def add_inductor(self, name: str, node1: str, node2: str, inductance: float):
+        """Add inductor with value in Henries"""
+        if inductance <= 0:
+            raise ValueError(f"Inductor {name}: inductance must be positive, got {inductance}")
+        
+        n1 = self.add_node(node1)
+        n2 = self.add_node(node2)
+
+        self._arrays['inductor'].append(name, n1, n2, inductance)
+    
+    def add_voltage_source(self, name: str, node_pos: str, node_neg: str, voltage: float):
+        """Add voltage source with value in Volts"""
+        n_pos = self.add_node(node_pos)
+        n_neg = self.add_node(node_neg)
+
+        self._arrays['voltage_source'].append(name, n_pos, n_neg, voltage)
+    
+    def add_current_source(self, name: str, node1: str, node2: str, current: float):
+        """Add current source with value in Amperes"""
+        n1 = self.add_node(node1)
+        n2 = self.add_node(node2)
+
+        self._arrays['current_source'].append(name, n1, n2, current)
+
+    # Property names accepted by update_component, in lookup order; the
+    # inspector emits the capitalized forms
+    _UPDATE_KEYS = ('value', 'Resistance', 'Capacitance', 'Inductance',
+                    'Voltage', 'Current')
+
+    def update_component(self, name: str, properties: Dict) -> bool:
+        """
+        Patch one component's value in place after a property edit
+        A single edit changes one stamped value, so the SoA entry and any
+        analyzer-side records are updated directly instead of rebuilding
+        the whole solver; returns True when the component was found
+        """
+        value = None
+        for key in self._UPDATE_KEYS:
+            if key in properties:
+                value = properties[key]
+                break
+        if value is None:
+            return False
+        if isinstance(value, str):
+            value = parse_component_value(value)
+        value = float(value)
+
+        for comp_type, arrays in self._arrays.items():
+            try:
+                index = arrays.names.index(name)
+            except ValueError:
+                continue
+            if comp_type in ('resistor', 'capacitor', 'inductor') and value <= 0:
+                raise ValueError(
+                    f"{name}: value must be positive, got {value}")
+            arrays.value[index] = value
+            # Entries already forwarded to the analyzers are patched there
+            # too; unflushed ones flow through on the next analysis
+            if index < self._flushed[comp_type]:
+                self._patch_analyzers(comp_type, name, value)
+            return True
+        return False
+
+    def _patch_analyzers(self, comp_type: str, name: str, value: float) -> None:
+        """Propagate an updated value into the analyzers' records"""
+        if comp_type == 'voltage_source':
+            for src in self.dc_analyzer.voltage_sources:
+                if src['name'] == name:
+                    src['voltage'] = value
+                    break
+            for src in self.ac_analyzer.voltage_sources:
+                if src['name'] == name:
+                    src['magnitude'] = value
+                    break
+            for src in self.transient_analyzer.sources:
+                if src['name'] == name:
+                    # Same step shape the flush path creates, at the new level
+                    src['func'] = lambda t, v=value: v
+                    break
+        elif comp_type == 'current_source':
+            for src in self.dc_analyzer.current_sources:
+                if src['name'] == name:
+                    src['current'] = value
+                    break
+        else:
+            for analyzer in (self.dc_analyzer, self.ac_analyzer,
+                             self.transient_analyzer):
+                for comp in analyzer.components:
+                    if comp['name'] == name:
+                        comp['value'] = value
+                        break
+        # The DC factorization cache keys on list lengths, which an
+        # in-place patch does not change; drop it explicitly
+        self.dc_analyzer._factor_cache = None
+
+    def _pending(self, comp_type: str) -> Optional[Tuple]:
+        """Slices of not-yet-forwarded entries for one component type"""
+        arrays = self._arrays[comp_type]
+        start = self._flushed[comp_type]
+        if start == arrays.count:
+            return None
+        self._flushed[comp_type] = arrays.count
+        return (arrays.names[start:arrays.count],
+                arrays.n1[start:arrays.count],
+                arrays.n2[start:arrays.count],
+                arrays.value[start:arrays.count])
+
+    def _flush(self) -> None:
+        """
+        Forward buffered components to the analyzers in bulk
+        Components are queued in the SoA arrays at add time and handed over
+        in one call per type, replacing three Python calls per component
+        """
+        pending = self._pending('resistor')
+        if pending is not None:
+            self.dc_analyzer.add_resistors_bulk(*pending)
+            self.ac_analyzer.add_resistors_bulk(*pending)
+            self.transient_analyzer.add_resistors_bulk(*pending)
+
+        pending = self._pending('capacitor')
+        if pending is not None:
+            self.ac_analyzer.add_capacitors_bulk(*pending)
+            self.transient_analyzer.add_capacitors_bulk(*pending)
+
+        pending = self._pending('inductor')
+        if pending is not None:
+            self.ac_analyzer.add_inductors_bulk(*pending)
+            self.transient_analyzer.add_inductors_bulk(*pending)
+
+        pending = self._pending('voltage_source')
+        if pending is not None:
+            self.dc_analyzer.add_voltage_sources_bulk(*pending)
+            self.ac_analyzer.add_voltage_sources_bulk(*pending, phase=0)
+            # For transient, add as pulses with rise at t=0
+            self.transient_analyzer.add_pulse_sources_bulk(*pending)
+
+        pending = self._pending('current_source')
+        if pending is not None:
+            self.dc_analyzer.add_current_sources_bulk(*pending)
+
+    def dc_analysis(self) -> Dict:
+        """Perform DC analysis using DCAnalyzer service"""
+        try:
+            self._flush()
+            if not self.nodes:
+                return {'status': 'failed', 'error': 'No nodes in circuit'}
+
+            # node_counter is the highest assigned index (ground is 0), so
+            # no O(nodes) max() scan is needed per analysis call
+            num_nodes = self.node_counter + 1
+            result = self.dc_analyzer.solve(num_nodes)
+            
+            # Ensure result has all required fields
+            if isinstance(result, dict) and result.get('node_voltages') is not None:
+                return {
+                    'status': 'success',
+                    'node_voltages': result.get('node_voltages'),
+                    'node_names': {name: result['node_voltages'][idx] 
+                                  for name, idx in self.nodes.items() 
+                                  if idx < len(result['node_voltages'])},
+                    'component_currents': result.get('currents', {}),
+                    'nodes': self.nodes,
+                }
+            else:
+                return {'status': 'failed', 'error': 'Invalid DC analyzer result'}
+        except Exception as e:
+            # Formatting a traceback walks the stack and allocates a
+            # multi-KB string; only pay for it when debugging
+            error = f'DC analysis error: {type(e).__name__}: {e}'
+            if self._debug:
+                import traceback
+                error = f'{error}\n{traceback.format_exc()}'
+            return {'status': 'failed', 'error': error}
+    
+    def ac_analysis(self, freq_start: float = 1, freq_end: float = 1e6, num_points: int = 100) -> Dict:
+        """Perform AC analysis using ACAnalyzer service"""
+        try:
+            if not self.nodes:
+                return {'status': 'failed', 'error': 'No nodes in circuit'}
+
+            self._flush()
+            num_nodes = self.node_counter + 1
+            # Log-spaced sweep over the requested band; the old code passed
+            # list(range(num_points)), i.e. integer Hz starting at 0
+            frequencies = np.logspace(np.log10(freq_start),
+                                      np.log10(freq_end), num_points)
+            result = self.ac_analyzer.solve(
+                frequencies=frequencies.tolist(),
+                num_nodes=num_nodes
+            )
+            
+            return {
+                'status': 'success',
+                'frequencies': result.get('frequencies'),
+                'impedance': result.get('impedances', {}),
+                'transfer_function': result.get('transfer_function', {}),
+            }
+        except Exception as e:
+            return {'status': 'failed', 'error': str(e)}
+    
+    def transient_analysis(self, duration: float = 0.1, time_step: float = 0.001) -> Dict:
+        """Perform transient analysis using TransientAnalyzer service"""
+        try:
+            self._flush()
+            result = self.transient_analyzer.solve(
+                t_span=(0, duration),
+                num_points=int(duration / time_step),
+                method='RK45'
+            )
+            
+            return {
+                'status': 'success',
+                'time': result.get('time'),
+                'voltage': result.get('voltage'),
+                'current': result.get('current'),
+                'power': result.get('power'),
+            }
+        except Exception as e:
+            return {'status': 'failed', 'error': str(e)}
+    
+    def validate_circuit(self) -> Tuple[bool, List[str]]:
+        """Validate circuit components"""
+        try:
+            # Basic validation
+            if not self.nodes:
+                return False, ["No nodes in circuit"]
+            
+            if all(arrays.count == 0 for arrays in self._arrays.values()):
+                return False, ["No components in circuit"]
+            
+            errors = []
+
+            # One vector comparison per component class over the SoA value
+            # arrays instead of a per-component Python type dispatch
+            for comp_type, quantity in (('resistor', 'Resistance'),
+                                        ('capacitor', 'Capacitance'),
+                                        ('inductor', 'Inductance')):
+                arrays = self._arrays[comp_type]
+                bad = np.flatnonzero(arrays.values() <= 0)
+                errors.extend(f"{arrays.names[i]}: {quantity} must be positive"
+                              for i in bad)
+
+            return len(errors) == 0, errors
+        except Exception as e:
+            return False, [str(e)]
+    
+    def get_system_info(self) -> Dict:
+        """Get system information and statistics"""
+        return {
+            'nodes': len(self.nodes),
+            'components': sum(arrays.count for arrays in self._arrays.values()),
+            'services': {
+                'dc_analyzer': 'active',
+                'ac_analyzer': 'active',
+                'transient_analyzer': 'active',
+                'component_validator': 'active',
+                'simulation_coordinator': 'active',
+            },
+            'libraries': len(self.library_service.libraries),
+            'total_components_available': sum(
+                len(lib_data.get('components', [])) 
+                for lib_data in self.library_service.libraries.values()
+            )
+        }
+
+
+# Precompiled value pattern and suffix table for the fallback parser;
+# one regex match replaces the previous str.replace chain per value
+_VAL_RE = re.compile(
+    r'^\s*([+-]?\d*\.?\d+(?:[eE][+-]?\d+)?)\s*(MEG|[PNUMK])?\s*'
+    r'(?:OHM|Ω|F|H|A|V)?\s*$',
+    re.IGNORECASE)
+_MULT = {
+    '': 1.0, 'P': 1e-12, 'N': 1e-9, 'U': 1e-6, 'M': 1e-3, 'K': 1e3, 'MEG': 1e6,
+}
+
+
+def parse_component_value(value_str: str) -> float:
+    """
+    Parse component value string to float using ValueParser service
+    Examples: "1k" -> 1000, "1.5M" -> 1500000, "100n" -> 1e-7
+    """
+    if _VALUE_PARSER is not None:
+        try:
+            return _VALUE_PARSER.parse(value_str)
+        except Exception:
+            pass
+
+    # Fallback to simple parsing with no per-call allocations
+    if isinstance(value_str, (int, float)):
+        return float(value_str)
+
+    match = _VAL_RE.match(str(value_str))
+    if match is None:
+        raise ValueError(f"Cannot parse component value: {value_str}")
+    return float(match.group(1)) * _MULT[(match.group(2) or '').upper()]
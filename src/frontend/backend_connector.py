@@ -1,469 +1,784 @@
-"""
-Direct Backend Connector
-Direct integration between frontend and backend services (no HTTP API)
-Uses Python module imports for efficient direct communication
-"""
-
-import logging
-from typing import Dict, List, Optional, Any, Tuple
-from pathlib import Path
-
-# Setup paths for backend imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from backend.services.service_manager import ServiceManager
-from backend.circuit.project_manager import ProjectManager
-from backend.circuit.circuit_model import Circuit
-from backend.circuit.component_library import ComponentLibraryManager
-
-logger = logging.getLogger(__name__)
-
-
-class BackendConnector:
-    """
-    Direct connector to backend services
-    Provides unified interface to all backend functionality
-    """
-    
-    def __init__(self):
-        """Initialize backend connector"""
-        try:
-            logger.info("Initializing backend services...")
-            
-            # Initialize service manager
-            self.service_manager = ServiceManager()
-            
-            # Initialize project manager
-            self.project_manager = ProjectManager()
-            
-            # Initialize component library
-            self.component_library = ComponentLibraryManager()
-            
-            # Current circuit context
-            self.current_circuit: Optional[Circuit] = None
-            self.current_circuit_id: Optional[str] = None
-            
-            # Library change callbacks
-            self.on_library_changed = []
-            self._setup_library_callbacks()
-            
-            logger.info("✓ Backend services initialized successfully")
-            
-        except Exception as e:
-            logger.error(f"✗ Failed to initialize backend services: {e}")
-            raise
-    
-    def _setup_library_callbacks(self) -> None:
-        """Setup callbacks for library changes from backend."""
-        try:
-            library_service = self.service_manager.library_service
-            if library_service:
-                library_service.register_change_callback(self._on_library_changed)
-                logger.info("✓ Library change callbacks registered")
-        except Exception as e:
-            logger.warning(f"Could not register library callbacks: {e}")
-    
-    def _on_library_changed(self, library_name: str) -> None:
-        """Called when a library file changes."""
-        logger.info(f"Library changed: {library_name}")
-        for callback in self.on_library_changed:
-            try:
-                callback(library_name)
-            except Exception as e:
-                logger.error(f"Error in library change callback: {e}")
-    
-    def register_library_change_callback(self, callback) -> None:
-        """Register callback to be called when libraries change."""
-        if callback not in self.on_library_changed:
-            self.on_library_changed.append(callback)
-    
-    def unregister_library_change_callback(self, callback) -> None:
-        """Unregister library change callback."""
-        if callback in self.on_library_changed:
-            self.on_library_changed.remove(callback)
-    
-    # ============================================================================
-    # SYSTEM INFORMATION
-    # ============================================================================
-    
-    def get_system_info(self) -> Dict[str, Any]:
-        """Get system information"""
-        try:
-            return self.service_manager.get_system_info()
-        except Exception as e:
-            logger.error(f"Error getting system info: {e}")
-            return {}
-    
-    def get_service_statistics(self) -> Dict[str, Any]:
-        """Get service statistics"""
-        try:
-            return self.service_manager.get_service_statistics()
-        except Exception as e:
-            logger.error(f"Error getting service statistics: {e}")
-            return {}
-    
-    # ============================================================================
-    # COMPONENT LIBRARY
-    # ============================================================================
-    
-    def get_all_components(self) -> List[Dict]:
-        """Get all available components"""
-        try:
-            components = self.component_library.get_all_components()
-            return [c.to_dict() if hasattr(c, 'to_dict') else c for c in components]
-        except Exception as e:
-            logger.error(f"Error getting components: {e}")
-            return []
-    
-    def get_component_categories(self) -> Dict[str, List]:
-        """Get component categories"""
-        try:
-            return self.component_library.get_categories_with_components()
-        except Exception as e:
-            logger.error(f"Error getting categories: {e}")
-            return {}
-    
-    def get_components_by_category(self, category: str) -> List[Dict]:
-        """Get components in a category"""
-        try:
-            components = self.component_library.list_components_by_category(category)
-            return [c.to_dict() if hasattr(c, 'to_dict') else c for c in components]
-        except Exception as e:
-            logger.error(f"Error getting category components: {e}")
-            return []
-    
-    def search_components(self, query: str) -> List[Dict]:
-        """Search components by name/type"""
-        try:
-            results = self.service_manager.search_library(query)
-            return [c.to_dict() if hasattr(c, 'to_dict') else c for c in results]
-        except Exception as e:
-            logger.error(f"Error searching components: {e}")
-            return []
-    
-    def get_component_details(self, component_id: str) -> Optional[Dict]:
-        """Get component details"""
-        try:
-            component = self.component_library.get_component_by_id(component_id)
-            if component:
-                return component.to_dict() if hasattr(component, 'to_dict') else component
-            return None
-        except Exception as e:
-            logger.error(f"Error getting component details: {e}")
-            return None
-    
-    # ============================================================================
-    # CIRCUIT MANAGEMENT
-    # ============================================================================
-    
-    def create_new_circuit(self, name: str = "Untitled Circuit") -> str:
-        """Create new circuit"""
-        try:
-            circuit = self.project_manager.create_circuit(name)
-            self.current_circuit = circuit
-            self.current_circuit_id = circuit.circuit_id if hasattr(circuit, 'circuit_id') else str(id(circuit))
-            
-            logger.info(f"Created circuit: {name}")
-            return self.current_circuit_id
-        except Exception as e:
-            logger.error(f"Error creating circuit: {e}")
-            raise
-    
-    def load_circuit(self, circuit_id: str) -> bool:
-        """Load circuit by ID"""
-        try:
-            circuit = self.project_manager.load_circuit(circuit_id)
-            if circuit:
-                self.current_circuit = circuit
-                self.current_circuit_id = circuit_id
-                logger.info(f"Loaded circuit: {circuit_id}")
-                return True
-            return False
-        except Exception as e:
-            logger.error(f"Error loading circuit: {e}")
-            return False
-    
-    def save_circuit(self, circuit_id: Optional[str] = None) -> bool:
-        """Save circuit"""
-        try:
-            cid = circuit_id or self.current_circuit_id
-            if not cid or not self.current_circuit:
-                logger.warning("No circuit to save")
-                return False
-            
-            self.project_manager.save_circuit(self.current_circuit)
-            logger.info(f"Saved circuit: {cid}")
-            return True
-        except Exception as e:
-            logger.error(f"Error saving circuit: {e}")
-            return False
-    
-    def get_current_circuit_id(self) -> Optional[str]:
-        """Get current circuit ID"""
-        return self.current_circuit_id
-    
-    # ============================================================================
-    # CIRCUIT COMPONENTS
-    # ============================================================================
-    
-    def add_component_to_circuit(
-        self,
-        component_id: str,
-        x: float = 0,
-        y: float = 0,
-        rotation: float = 0,
-        properties: Optional[Dict] = None
-    ) -> Optional[str]:
-        """Add component to current circuit"""
-        try:
-            if not self.current_circuit:
-                logger.error("No active circuit")
-                return None
-            
-            instance_id = self.current_circuit.add_component(
-                component_id=component_id,
-                x=x,
-                y=y,
-                rotation=rotation,
-                properties=properties or {}
-            )
-            
-            logger.debug(f"Added component {component_id} as {instance_id}")
-            return instance_id
-        except Exception as e:
-            logger.error(f"Error adding component: {e}")
-            return None
-    
-    def update_component(
-        self,
-        instance_id: str,
-        x: Optional[float] = None,
-        y: Optional[float] = None,
-        rotation: Optional[float] = None,
-        properties: Optional[Dict] = None
-    ) -> bool:
-        """Update component"""
-        try:
-            if not self.current_circuit:
-                logger.error("No active circuit")
-                return False
-            
-            self.current_circuit.update_component(
-                instance_id=instance_id,
-                x=x,
-                y=y,
-                rotation=rotation,
-                properties=properties
-            )
-            
-            logger.debug(f"Updated component {instance_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Error updating component: {e}")
-            return False
-    
-    def delete_component(self, instance_id: str) -> bool:
-        """Delete component"""
-        try:
-            if not self.current_circuit:
-                logger.error("No active circuit")
-                return False
-            
-            self.current_circuit.delete_component(instance_id)
-            logger.debug(f"Deleted component {instance_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Error deleting component: {e}")
-            return False
-    
-    def get_circuit_components(self) -> Dict[str, Any]:
-        """Get all components in current circuit"""
-        try:
-            if not self.current_circuit:
-                return {}
-            
-            return self.current_circuit.get_components()
-        except Exception as e:
-            logger.error(f"Error getting circuit components: {e}")
-            return {}
-    
-    # ============================================================================
-    # CIRCUIT CONNECTIONS
-    # ============================================================================
-    
-    def add_connection(
-        self,
-        from_instance: str,
-        from_port: str,
-        to_instance: str,
-        to_port: str
-    ) -> Optional[str]:
-        """Add connection between components"""
-        try:
-            if not self.current_circuit:
-                logger.error("No active circuit")
-                return None
-            
-            connection_id = self.current_circuit.add_connection(
-                from_instance=from_instance,
-                from_port=from_port,
-                to_instance=to_instance,
-                to_port=to_port
-            )
-            
-            logger.debug(f"Added connection {connection_id}")
-            return connection_id
-        except Exception as e:
-            logger.error(f"Error adding connection: {e}")
-            return None
-    
-    def delete_connection(self, connection_id: str) -> bool:
-        """Delete connection"""
-        try:
-            if not self.current_circuit:
-                logger.error("No active circuit")
-                return False
-            
-            self.current_circuit.delete_connection(connection_id)
-            logger.debug(f"Deleted connection {connection_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Error deleting connection: {e}")
-            return False
-    
-    def get_circuit_connections(self) -> Dict[str, Any]:
-        """Get all connections in current circuit"""
-        try:
-            if not self.current_circuit:
-                return {}
-            
-            return self.current_circuit.get_connections()
-        except Exception as e:
-            logger.error(f"Error getting circuit connections: {e}")
-            return {}
-    
-    # ============================================================================
-    # CIRCUIT ANALYSIS
-    # ============================================================================
-    
-    def validate_circuit(self) -> Tuple[bool, List[str], List[str]]:
-        """Validate circuit"""
-        try:
-            if not self.current_circuit:
-                return False, ["No active circuit"], []
-            
-            errors = []
-            warnings = []
-            
-            # Check for unconnected components
-            if len(self.current_circuit.get_components()) > 0:
-                if len(self.current_circuit.get_connections()) == 0:
-                    warnings.append("Circuit has no connections")
-            
-            # Check for isolated nodes
-            components = self.current_circuit.get_components()
-            connections = self.current_circuit.get_connections()
-            
-            connected_instances = set()
-            for conn in connections.values():
-                connected_instances.add(conn.get('from_instance'))
-                connected_instances.add(conn.get('to_instance'))
-            
-            for instance_id in components.keys():
-                if instance_id not in connected_instances:
-                    warnings.append(f"Component {instance_id} is not connected")
-            
-            return len(errors) == 0, errors, warnings
-        
-        except Exception as e:
-            logger.error(f"Error validating circuit: {e}")
-            return False, [str(e)], []
-    
-    def run_dc_analysis(self) -> Optional[Dict]:
-        """Run DC analysis"""
-        try:
-            if not self.current_circuit:
-                logger.error("No active circuit")
-                return None
-            
-            logger.info("Running DC analysis...")
-            dc_analyzer = self.service_manager.get_service('dc')
-            
-            # Setup analysis with circuit data
-            results = dc_analyzer.analyze(self.current_circuit.get_circuit_data())
-            logger.info("DC analysis completed")
-            return results
-        except Exception as e:
-            logger.error(f"Error running DC analysis: {e}")
-            return None
-    
-    def run_ac_analysis(
-        self,
-        frequency_start: float = 1,
-        frequency_end: float = 1e6,
-        points: int = 100
-    ) -> Optional[Dict]:
-        """Run AC analysis"""
-        try:
-            if not self.current_circuit:
-                logger.error("No active circuit")
-                return None
-            
-            logger.info("Running AC analysis...")
-            ac_analyzer = self.service_manager.get_service('ac')
-            
-            results = ac_analyzer.analyze(
-                self.current_circuit.get_circuit_data(),
-                frequency_start=frequency_start,
-                frequency_end=frequency_end,
-                points=points
-            )
-            logger.info("AC analysis completed")
-            return results
-        except Exception as e:
-            logger.error(f"Error running AC analysis: {e}")
-            return None
-    
-    def run_transient_analysis(
-        self,
-        duration: float = 1.0,
-        time_step: float = 0.001
-    ) -> Optional[Dict]:
-        """Run transient analysis"""
-        try:
-            if not self.current_circuit:
-                logger.error("No active circuit")
-                return None
-            
-            logger.info("Running transient analysis...")
-            transient_analyzer = self.service_manager.get_service('transient')
-            
-            results = transient_analyzer.analyze(
-                self.current_circuit.get_circuit_data(),
-                duration=duration,
-                time_step=time_step
-            )
-            logger.info("Transient analysis completed")
-            return results
-        except Exception as e:
-            logger.error(f"Error running transient analysis: {e}")
-            return None
-
-
-# Global instance
-_backend_connector: Optional[BackendConnector] = None
-
-
-def get_backend_connector() -> BackendConnector:
-    """Get global backend connector instance"""
-    global _backend_connector
-    if _backend_connector is None:
-        _backend_connector = BackendConnector()
-    return _backend_connector
-
-
-def reset_backend_connector():
-    """Reset backend connector"""
-    global _backend_connector
-    _backend_connector = None
+"""
+Direct Backend Connector
+Direct integration between frontend and backend services (no HTTP API)
+Uses Python module imports for efficient direct communication
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Any, Set, Tuple
+from pathlib import Path
+
+# Setup paths for backend imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.services.service_manager import ServiceManager
+from backend.circuit.project_manager import ProjectManager
+from backend.circuit.circuit_model import Circuit
+from backend.circuit.component_library import (ComponentLibraryManager,
+                                               DEFAULT_USER_LIB_PATH)
+
+logger = logging.getLogger(__name__)
+
+# On-disk cache of the parsed component library (plain list of dicts),
+# keyed by library file names and mtimes so stale caches self-invalidate
+_LIBRARY_CACHE_DIR = Path.home() / ".cache" / "vde"
+_LIBRARY_CACHE_VERSION = "1.0"
+
+# Analysis results are pure functions of (circuit, parameters); keep a
+# bounded LRU of recent runs so re-running the same sweep is free
+_ANALYSIS_CACHE_SIZE = 32
+
+
+class BackendConnector:
+    """
+    Direct connector to backend services
+    Provides unified interface to all backend functionality
+    """
+
+    # Fixed attribute layout: slot access is cheaper than __dict__ lookup
+    # for the self.current_circuit/self.service_manager touches per frame
+    __slots__ = (
+        '_service_manager', '_project_manager', '_component_library',
+        'current_circuit', 'current_circuit_id', 'on_library_changed',
+        '_components_snapshot', '_connections_snapshot',
+        '_components_dirty', '_connections_dirty',
+        '_circuit_data_cache', '_circuit_data_dirty', '_circuit_data_hash',
+        '_analysis_cache', '_dc', '_ac', '_transient',
+        '_components_cache', '_categories_cache', '_by_category_cache',
+        '_to_dict_by_type', '_details_cache', '_search_cache',
+        '_connected_instances', '_instance_ref_count', '_conn_endpoints',
+    )
+
+    def __init__(self):
+        """Initialize backend connector (heavy services are created lazily)"""
+        try:
+            # Backing slots for the lazily created services
+            self._service_manager: Optional[ServiceManager] = None
+            self._project_manager: Optional[ProjectManager] = None
+            self._component_library: Optional[ComponentLibraryManager] = None
+
+            # Current circuit context
+            self.current_circuit: Optional[Circuit] = None
+            self.current_circuit_id: Optional[str] = None
+
+            # Snapshots of the circuit for high-frequency UI polling;
+            # mutators mark them dirty, getters refresh on demand
+            self._components_snapshot: Dict[str, Any] = {}
+            self._connections_snapshot: Dict[str, Any] = {}
+            self._components_dirty = True
+            self._connections_dirty = True
+
+            # Serialized circuit data shared by the analysis runners
+            self._circuit_data_cache: Optional[Dict] = None
+            self._circuit_data_dirty = True
+            self._circuit_data_hash: Optional[int] = None
+            self._analysis_cache: OrderedDict = OrderedDict()
+
+            # Incrementally maintained connectivity for validate_circuit
+            self._connected_instances: Set[str] = set()
+            self._instance_ref_count: Counter = Counter()
+            self._conn_endpoints: Dict[str, Tuple[str, str]] = {}
+
+            # Analyzer services, resolved once on first analysis run
+            self._dc: Optional[Any] = None
+            self._ac: Optional[Any] = None
+            self._transient: Optional[Any] = None
+
+            # Memoized library views, invalidated on library change
+            self._components_cache: Optional[List[Dict]] = None
+            self._categories_cache: Optional[Dict[str, List]] = None
+            self._by_category_cache: Dict[str, List[Dict]] = {}
+            # Per-type dict-conversion functions, decided once instead of
+            # a hasattr branch per component per listing
+            self._to_dict_by_type: Dict[type, Any] = {}
+            self._rebuild_lookup_caches()
+
+            # Library change callbacks, keyed by id() for O(1) (un)register
+            self.on_library_changed: Dict[int, Any] = {}
+
+            logger.info("✓ Backend connector ready (services load on first use)")
+
+        except Exception as e:
+            logger.error(f"✗ Failed to initialize backend connector: {e}")
+            raise
+
+    @property
+    def service_manager(self) -> ServiceManager:
+        """Service manager, created on first access."""
+        if self._service_manager is None:
+            logger.info("Initializing backend services...")
+            manager = ServiceManager()
+            self._setup_library_callbacks(manager)
+            self._service_manager = manager
+            logger.info("✓ Backend services initialized successfully")
+        return self._service_manager
+
+    @property
+    def project_manager(self) -> ProjectManager:
+        """Project manager, created on first access."""
+        if self._project_manager is None:
+            self._project_manager = ProjectManager()
+        return self._project_manager
+
+    @property
+    def component_library(self) -> ComponentLibraryManager:
+        """Component library manager, created on first access."""
+        if self._component_library is None:
+            self._component_library = ComponentLibraryManager()
+        return self._component_library
+
+    def _rebuild_lookup_caches(self) -> None:
+        """(Re)wrap the detail/search lookups in per-instance LRU caches."""
+        self._details_cache = functools.lru_cache(maxsize=1024)(self._details_uncached)
+        self._search_cache = functools.lru_cache(maxsize=1024)(self._search_uncached)
+
+    def _setup_library_callbacks(self, service_manager: ServiceManager) -> None:
+        """Setup callbacks for library changes from backend."""
+        try:
+            library_service = service_manager.library_service
+            if library_service:
+                library_service.register_change_callback(self._on_library_changed)
+                logger.info("✓ Library change callbacks registered")
+        except Exception as e:
+            logger.warning(f"Could not register library callbacks: {e}")
+    
+    def _on_library_changed(self, library_name: str) -> None:
+        """Called when a library file changes."""
+        logger.info(f"Library changed: {library_name}")
+        try:
+            self._library_cache_path().unlink(missing_ok=True)
+        except OSError:
+            pass
+        self._components_cache = None
+        self._categories_cache = None
+        self._by_category_cache = {}
+        self._rebuild_lookup_caches()
+        for callback in list(self.on_library_changed.values()):
+            try:
+                callback(library_name)
+            except Exception as e:
+                logger.error(f"Error in library change callback: {e}")
+
+    def register_library_change_callback(self, callback) -> None:
+        """Register callback to be called when libraries change."""
+        self.on_library_changed[id(callback)] = callback
+
+    def unregister_library_change_callback(self, callback) -> None:
+        """Unregister library change callback."""
+        self.on_library_changed.pop(id(callback), None)
+    
+    # ============================================================================
+    # SYSTEM INFORMATION
+    # ============================================================================
+    
+    def get_system_info(self) -> Dict[str, Any]:
+        """Get system information"""
+        return self.service_manager.get_system_info()
+
+    def get_service_statistics(self) -> Dict[str, Any]:
+        """Get service statistics"""
+        return self.service_manager.get_service_statistics()
+    
+    # ============================================================================
+    # COMPONENT LIBRARY
+    # ============================================================================
+
+    def _to_dict_fn(self, comp_type: type):
+        """Dict-conversion function for a component type, cached per type."""
+        fn = self._to_dict_by_type.get(comp_type)
+        if fn is None:
+            if hasattr(comp_type, 'to_dict'):
+                fn = lambda c: c.to_dict()
+            else:
+                fn = lambda c: c
+            self._to_dict_by_type[comp_type] = fn
+        return fn
+
+    def _as_dicts(self, components: List[Any]) -> List[Dict]:
+        """Convert a (homogeneous) component list to dicts via map()."""
+        if not components:
+            return []
+        return list(map(self._to_dict_fn(type(components[0])), components))
+
+    def _library_cache_path(self) -> Path:
+        """Cache file path keyed by library file names and modification times.
+
+        Deliberately avoids the lazy component_library property: the key
+        must be computable on a cache hit without constructing the
+        manager (whose __init__ parses every library).
+        """
+        digest = hashlib.sha1(_LIBRARY_CACHE_VERSION.encode())
+        libraries_path = Path(__file__).parent.parent.parent / "data" / "libraries"
+        lib_files = sorted(libraries_path.glob("*.json")) if libraries_path.exists() else []
+        if self._component_library is not None:
+            user_lib = self._component_library.user_lib_path
+        else:
+            user_lib = DEFAULT_USER_LIB_PATH
+        if user_lib and Path(user_lib).exists():
+            lib_files.append(Path(user_lib))
+        for lib_file in lib_files:
+            digest.update(lib_file.name.encode())
+            digest.update(str(lib_file.stat().st_mtime_ns).encode())
+        return _LIBRARY_CACHE_DIR / f"components-{digest.hexdigest()}.pkl"
+
+    def _load_components_from_disk(self) -> Optional[List[Dict]]:
+        """Load the serialized component list, or None on a cache miss."""
+        try:
+            cache_path = self._library_cache_path()
+            if cache_path.exists():
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+        except (OSError, pickle.UnpicklingError) as e:
+            logger.warning(f"Could not read component cache: {e}")
+        return None
+
+    def _save_components_to_disk(self, components: List[Dict]) -> None:
+        """Serialize the component list atomically (write + os.replace)."""
+        try:
+            cache_path = self._library_cache_path()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(components, f, protocol=5)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write component cache: {e}")
+
+    def get_all_components(self) -> List[Dict]:
+        """Get all available components (memoized until the library changes)"""
+        try:
+            if self._components_cache is None:
+                self._components_cache = self._load_components_from_disk()
+            if self._components_cache is None:
+                components = list(self.component_library.list_all_components().values())
+                self._components_cache = self._as_dicts(components)
+                self._save_components_to_disk(self._components_cache)
+            return self._components_cache
+        except Exception as e:
+            logger.error(f"Error getting components: {e}")
+            return []
+
+    def get_component_categories(self) -> Dict[str, List]:
+        """Get component categories (memoized until the library changes)"""
+        try:
+            if self._categories_cache is None:
+                self._categories_cache = self.component_library.get_categories_with_components()
+            return self._categories_cache
+        except Exception as e:
+            logger.error(f"Error getting categories: {e}")
+            return {}
+
+    def get_components_by_category(self, category: str) -> List[Dict]:
+        """Get components in a category (memoized per category)"""
+        try:
+            cached = self._by_category_cache.get(category)
+            if cached is not None:
+                return cached
+            components = self.component_library.list_components_by_category(category)
+            result = self._as_dicts(components)
+            self._by_category_cache[category] = result
+            return result
+        except Exception as e:
+            logger.error(f"Error getting category components: {e}")
+            return []
+    
+    def _search_uncached(self, query: str) -> List[Dict]:
+        results = self.service_manager.search_library(query)
+        return self._as_dicts(results)
+
+    def search_components(self, query: str) -> List[Dict]:
+        """Search components by name/type (LRU-cached per normalized query)"""
+        try:
+            return self._search_cache(query.lower())
+        except Exception as e:
+            logger.error(f"Error searching components: {e}")
+            return []
+
+    def _details_uncached(self, component_id: str) -> Optional[Dict]:
+        component = self.component_library.get_component_by_id(component_id)
+        if component:
+            return self._to_dict_fn(type(component))(component)
+        return None
+
+    def get_component_details(self, component_id: str) -> Optional[Dict]:
+        """Get component details (LRU-cached per component ID)"""
+        try:
+            return self._details_cache(component_id)
+        except Exception as e:
+            logger.error(f"Error getting component details: {e}")
+            return None
+    
+    # ============================================================================
+    # CIRCUIT MANAGEMENT
+    # ============================================================================
+    
+    def create_new_circuit(self, name: str = "Untitled Circuit") -> str:
+        """Create new circuit"""
+        try:
+            circuit = self.project_manager.create_circuit(name)
+            self.current_circuit = circuit
+            self.current_circuit_id = circuit.circuit_id if hasattr(circuit, 'circuit_id') else str(id(circuit))
+            self._components_dirty = True
+            self._connections_dirty = True
+            self._circuit_data_dirty = True
+            self._rebuild_connectivity()
+
+            logger.info(f"Created circuit: {name}")
+            return self.current_circuit_id
+        except Exception as e:
+            logger.error(f"Error creating circuit: {e}")
+            raise
+    
+    def load_circuit(self, circuit_id: str) -> bool:
+        """Load circuit by ID"""
+        try:
+            circuit = self.project_manager.load_circuit(circuit_id)
+            if circuit:
+                self.current_circuit = circuit
+                self.current_circuit_id = circuit_id
+                self._components_dirty = True
+                self._connections_dirty = True
+                self._circuit_data_dirty = True
+                self._rebuild_connectivity()
+                logger.info(f"Loaded circuit: {circuit_id}")
+                return True
+            return False
+        except Exception as e:
+            logger.error(f"Error loading circuit: {e}")
+            return False
+    
+    def save_circuit(self, circuit_id: Optional[str] = None) -> bool:
+        """Save circuit"""
+        try:
+            cid = circuit_id or self.current_circuit_id
+            if not cid or not self.current_circuit:
+                logger.warning("No circuit to save")
+                return False
+            
+            self.project_manager.save_circuit(self.current_circuit)
+            logger.info(f"Saved circuit: {cid}")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving circuit: {e}")
+            return False
+    
+    def get_current_circuit_id(self) -> Optional[str]:
+        """Get current circuit ID"""
+        return self.current_circuit_id
+    
+    # ============================================================================
+    # CIRCUIT COMPONENTS
+    # ============================================================================
+    
+    def add_component_to_circuit(
+        self,
+        component_id: str,
+        x: float = 0,
+        y: float = 0,
+        rotation: float = 0,
+        properties: Optional[Dict] = None
+    ) -> Optional[str]:
+        """Add component to current circuit"""
+        try:
+            if not self.current_circuit:
+                logger.error("No active circuit")
+                return None
+            
+            instance_id = self.current_circuit.add_component(
+                component_id=component_id,
+                x=x,
+                y=y,
+                rotation=rotation,
+                properties=properties or {}
+            )
+            
+            self._components_dirty = True
+            self._circuit_data_dirty = True
+            logger.debug("Added component %s as %s", component_id, instance_id)
+            return instance_id
+        except Exception as e:
+            logger.error(f"Error adding component: {e}")
+            return None
+    
+    def add_components_bulk(self, specs: List[Dict]) -> List[str]:
+        """Add many components in one call (paste/import); dirties caches once"""
+        try:
+            if not self.current_circuit:
+                logger.error("No active circuit")
+                return []
+
+            add_component = self.current_circuit.add_component
+            instance_ids = [add_component(**spec) for spec in specs]
+
+            self._components_dirty = True
+            self._circuit_data_dirty = True
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Added {len(instance_ids)} components in bulk")
+            return instance_ids
+        except Exception as e:
+            logger.error(f"Error adding components in bulk: {e}")
+            return []
+
+    def update_component(
+        self,
+        instance_id: str,
+        x: Optional[float] = None,
+        y: Optional[float] = None,
+        rotation: Optional[float] = None,
+        properties: Optional[Dict] = None
+    ) -> bool:
+        """Update component"""
+        try:
+            if not self.current_circuit:
+                logger.error("No active circuit")
+                return False
+            
+            self.current_circuit.update_component(
+                instance_id=instance_id,
+                x=x,
+                y=y,
+                rotation=rotation,
+                properties=properties
+            )
+            
+            self._components_dirty = True
+            self._circuit_data_dirty = True
+            logger.debug("Updated component %s", instance_id)
+            return True
+        except Exception as e:
+            logger.error(f"Error updating component: {e}")
+            return False
+    
+    def delete_component(self, instance_id: str) -> bool:
+        """Delete component"""
+        try:
+            if not self.current_circuit:
+                logger.error("No active circuit")
+                return False
+            
+            self.current_circuit.delete_component(instance_id)
+            self._components_dirty = True
+            self._connections_dirty = True
+            self._circuit_data_dirty = True
+            # The model may cascade-delete attached connections
+            self._rebuild_connectivity()
+            logger.debug("Deleted component %s", instance_id)
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting component: {e}")
+            return False
+    
+    def get_circuit_components(self) -> Dict[str, Any]:
+        """Get all components in current circuit (cached snapshot when clean)"""
+        # Polled at UI frame rate: a precondition branch, not try/except
+        if self.current_circuit is None:
+            return {}
+
+        if self._components_dirty:
+            self._components_snapshot = self.current_circuit.get_components()
+            self._components_dirty = False
+        return self._components_snapshot
+    
+    # ============================================================================
+    # CIRCUIT CONNECTIONS
+    # ============================================================================
+    
+    def _rebuild_connectivity(self) -> None:
+        """Recompute connectivity tracking from the circuit's connections."""
+        self._instance_ref_count = Counter()
+        self._conn_endpoints = {}
+        for conn_id, conn in self.get_circuit_connections().items():
+            endpoints = (conn.get('from_instance'), conn.get('to_instance'))
+            self._conn_endpoints[conn_id] = endpoints
+            self._instance_ref_count.update(endpoints)
+        self._connected_instances = set(self._instance_ref_count)
+
+    def _track_connection(self, connection_id: str,
+                         from_instance: str, to_instance: str) -> None:
+        """Record a new connection's endpoints incrementally."""
+        endpoints = (from_instance, to_instance)
+        self._conn_endpoints[connection_id] = endpoints
+        for instance_id in endpoints:
+            self._instance_ref_count[instance_id] += 1
+            self._connected_instances.add(instance_id)
+
+    def _untrack_connection(self, connection_id: str) -> None:
+        """Drop a deleted connection's endpoints incrementally."""
+        endpoints = self._conn_endpoints.pop(connection_id, None)
+        if endpoints is None:
+            return
+        for instance_id in endpoints:
+            self._instance_ref_count[instance_id] -= 1
+            if self._instance_ref_count[instance_id] <= 0:
+                del self._instance_ref_count[instance_id]
+                self._connected_instances.discard(instance_id)
+
+    def add_connection(
+        self,
+        from_instance: str,
+        from_port: str,
+        to_instance: str,
+        to_port: str
+    ) -> Optional[str]:
+        """Add connection between components"""
+        try:
+            if not self.current_circuit:
+                logger.error("No active circuit")
+                return None
+            
+            connection_id = self.current_circuit.add_connection(
+                from_instance=from_instance,
+                from_port=from_port,
+                to_instance=to_instance,
+                to_port=to_port
+            )
+            
+            self._connections_dirty = True
+            self._circuit_data_dirty = True
+            self._track_connection(connection_id, from_instance, to_instance)
+            logger.debug("Added connection %s", connection_id)
+            return connection_id
+        except Exception as e:
+            logger.error(f"Error adding connection: {e}")
+            return None
+    
+    def add_connections_bulk(self, specs: List[Dict]) -> List[str]:
+        """Add many connections in one call; dirties caches once"""
+        try:
+            if not self.current_circuit:
+                logger.error("No active circuit")
+                return []
+
+            add_connection = self.current_circuit.add_connection
+            connection_ids = [add_connection(**spec) for spec in specs]
+
+            self._connections_dirty = True
+            self._circuit_data_dirty = True
+            for connection_id, spec in zip(connection_ids, specs):
+                self._track_connection(connection_id, spec.get('from_instance'),
+                                       spec.get('to_instance'))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Added {len(connection_ids)} connections in bulk")
+            return connection_ids
+        except Exception as e:
+            logger.error(f"Error adding connections in bulk: {e}")
+            return []
+
+    def delete_connection(self, connection_id: str) -> bool:
+        """Delete connection"""
+        try:
+            if not self.current_circuit:
+                logger.error("No active circuit")
+                return False
+            
+            self.current_circuit.delete_connection(connection_id)
+            self._connections_dirty = True
+            self._circuit_data_dirty = True
+            self._untrack_connection(connection_id)
+            logger.debug("Deleted connection %s", connection_id)
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting connection: {e}")
+            return False
+    
+    def get_circuit_connections(self) -> Dict[str, Any]:
+        """Get all connections in current circuit (cached snapshot when clean)"""
+        if self.current_circuit is None:
+            return {}
+
+        if self._connections_dirty:
+            self._connections_snapshot = self.current_circuit.get_connections()
+            self._connections_dirty = False
+        return self._connections_snapshot
+    
+    # ============================================================================
+    # CIRCUIT ANALYSIS
+    # ============================================================================
+    
+    def validate_circuit(self) -> Tuple[bool, List[str], List[str]]:
+        """Validate circuit"""
+        try:
+            if not self.current_circuit:
+                return False, ["No active circuit"], []
+            
+            errors = []
+            warnings = []
+
+            components = self.current_circuit.get_components()
+            connections = self.current_circuit.get_connections()
+
+            # Check for unconnected components
+            if components and not connections:
+                warnings.append("Circuit has no connections")
+
+            # Connectivity is maintained incrementally by the connection
+            # mutators; validation is just a set difference
+            connected_instances = self._connected_instances
+
+            warnings.extend(
+                f"Component {instance_id} is not connected"
+                for instance_id in components.keys() - connected_instances
+            )
+
+            return len(errors) == 0, errors, warnings
+        
+        except Exception as e:
+            logger.error(f"Error validating circuit: {e}")
+            return False, [str(e)], []
+    
+    def _get_circuit_data(self) -> Dict:
+        """Serialized circuit data, rebuilt only after circuit edits."""
+        if self._circuit_data_dirty or self._circuit_data_cache is None:
+            self._circuit_data_cache = self.current_circuit.get_circuit_data()
+            self._circuit_data_hash = hash(
+                json.dumps(self._circuit_data_cache, sort_keys=True, default=str))
+            self._analysis_cache.clear()
+            self._circuit_data_dirty = False
+        return self._circuit_data_cache
+
+    def _resolve_analyzers(self) -> None:
+        """Resolve the analysis services once instead of per run."""
+        manager = self.service_manager
+        self._dc = manager.get_service('dc')
+        self._ac = manager.get_service('ac')
+        self._transient = manager.get_service('transient')
+
+    def _cached_analysis(self, key: Tuple) -> Optional[Dict]:
+        """Look up a prior analysis run, refreshing its LRU position."""
+        results = self._analysis_cache.get(key)
+        if results is not None:
+            self._analysis_cache.move_to_end(key)
+        return results
+
+    def _store_analysis(self, key: Tuple, results: Optional[Dict]) -> None:
+        """Remember an analysis run, evicting the least recently used."""
+        if results is None:
+            return
+        self._analysis_cache[key] = results
+        if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+
+    def run_dc_analysis(self) -> Optional[Dict]:
+        """Run DC analysis"""
+        try:
+            if not self.current_circuit:
+                logger.error("No active circuit")
+                return None
+            
+            circuit_data = self._get_circuit_data()
+            key = (self._circuit_data_hash, 'dc')
+            results = self._cached_analysis(key)
+            if results is not None:
+                return results
+
+            logger.info("Running DC analysis...")
+            if self._dc is None:
+                self._resolve_analyzers()
+
+            # Setup analysis with circuit data
+            results = self._dc.analyze(circuit_data)
+            self._store_analysis(key, results)
+            logger.info("DC analysis completed")
+            return results
+        except Exception as e:
+            logger.error(f"Error running DC analysis: {e}")
+            return None
+    
+    def run_ac_analysis(
+        self,
+        frequency_start: float = 1,
+        frequency_end: float = 1e6,
+        points: int = 100
+    ) -> Optional[Dict]:
+        """Run AC analysis"""
+        try:
+            if not self.current_circuit:
+                logger.error("No active circuit")
+                return None
+            
+            circuit_data = self._get_circuit_data()
+            key = (self._circuit_data_hash, 'ac', frequency_start, frequency_end, points)
+            results = self._cached_analysis(key)
+            if results is not None:
+                return results
+
+            logger.info("Running AC analysis...")
+            if self._ac is None:
+                self._resolve_analyzers()
+
+            results = self._ac.analyze(
+                circuit_data,
+                frequency_start=frequency_start,
+                frequency_end=frequency_end,
+                points=points
+            )
+            self._store_analysis(key, results)
+            logger.info("AC analysis completed")
+            return results
+        except Exception as e:
+            logger.error(f"Error running AC analysis: {e}")
+            return None
+    
+    def run_transient_analysis(
+        self,
+        duration: float = 1.0,
+        time_step: float = 0.001
+    ) -> Optional[Dict]:
+        """Run transient analysis"""
+        try:
+            if not self.current_circuit:
+                logger.error("No active circuit")
+                return None
+            
+            circuit_data = self._get_circuit_data()
+            key = (self._circuit_data_hash, 'transient', duration, time_step)
+            results = self._cached_analysis(key)
+            if results is not None:
+                return results
+
+            logger.info("Running transient analysis...")
+            if self._transient is None:
+                self._resolve_analyzers()
+
+            results = self._transient.analyze(
+                circuit_data,
+                duration=duration,
+                time_step=time_step
+            )
+            self._store_analysis(key, results)
+            logger.info("Transient analysis completed")
+            return results
+        except Exception as e:
+            logger.error(f"Error running transient analysis: {e}")
+            return None
+
+
+# Global instance
+_backend_connector: Optional[BackendConnector] = None
+_backend_connector_lock = threading.Lock()
+
+
+def get_backend_connector() -> BackendConnector:
+    """Get global backend connector instance (thread-safe lazy init)"""
+    global _backend_connector
+    # Double-checked locking: the common path stays lockless, and the
+    # heavy construction runs at most once even under thread contention
+    if _backend_connector is None:
+        with _backend_connector_lock:
+            if _backend_connector is None:
+                _backend_connector = BackendConnector()
+    return _backend_connector
+
+
+def reset_backend_connector():
+    """Reset backend connector"""
+    global _backend_connector
+    _backend_connector = None
@@ -1,19 +1,178 @@
 """
 Oscilloscope Properties Dialog - for configuring and viewing oscilloscope channels
 """
+from dataclasses import dataclass
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QGroupBox,
     QLabel, QSpinBox, QDoubleSpinBox, QComboBox, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView
+    QTableView, QHeaderView
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QColor, QFont
 
 
+@dataclass
+class Channel:
+    """One oscilloscope channel's configuration"""
+    name: str
+    color: str
+    enabled: bool
+    coupling: str = "DC"
+    scale: str = "1 V"
+
+
+class ChannelsModel(QAbstractTableModel):
+    """Table model over a plain list of Channel records
+
+    The view pulls only visible cells through data(), so populating a
+    channel is one list append instead of five QTableWidgetItem
+    allocations.
+    """
+
+    HEADERS = ("Channel", "Color", "Enabled", "Coupling", "Scale (V/div)")
+
+    # QColor parsing of a hex string is repeated for the same few palette
+    # entries; resolve each hex once and reuse the QColor
+    _color_cache = {}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.channels = []
+
+    @classmethod
+    def _qcolor(cls, hex_str):
+        color = cls._color_cache.get(hex_str)
+        if color is None:
+            color = cls._color_cache[hex_str] = QColor(hex_str)
+        return color
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.channels)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        channel = self.channels[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return channel.name
+            if col == 3:
+                return channel.coupling
+            if col == 4:
+                return channel.scale
+        elif role == Qt.ItemDataRole.BackgroundRole and col == 1:
+            return self._qcolor(channel.color)
+        elif role == Qt.ItemDataRole.CheckStateRole and col == 2:
+            return Qt.CheckState.Checked if channel.enabled else Qt.CheckState.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        channel = self.channels[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.CheckStateRole and col == 2:
+            channel.enabled = Qt.CheckState(value) == Qt.CheckState.Checked
+        elif role == Qt.ItemDataRole.EditRole and col == 3:
+            channel.coupling = str(value)
+        elif role == Qt.ItemDataRole.EditRole and col == 4:
+            channel.scale = str(value)
+        else:
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        col = index.column()
+        if col == 2:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        elif col in (3, 4):
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def add_channel(self, channel):
+        """Append one channel (a single insert notification)"""
+        row = len(self.channels)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.channels.append(channel)
+        self.endInsertRows()
+
+    def add_channels(self, channels):
+        """Append several channels under one insert notification"""
+        if not channels:
+            return
+        first = len(self.channels)
+        self.beginInsertRows(QModelIndex(), first, first + len(channels) - 1)
+        self.channels.extend(channels)
+        self.endInsertRows()
+
+    def remove_last_channel(self):
+        """Remove the last channel"""
+        row = len(self.channels) - 1
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.channels.pop()
+        self.endRemoveRows()
+
+
+class MeasurementsModel(QAbstractTableModel):
+    """Read-only table model over (channel, measurement, value, unit) rows
+
+    Refreshes swap the whole row list under one model reset - a single
+    view notification instead of four item allocations per row.
+    """
+
+    HEADERS = ("Channel", "Measurement", "Value", "Unit")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def set_rows(self, rows):
+        """Replace all rows with one reset notification"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+
 class OscilloscopeDialog(QDialog):
     """Dialog for oscilloscope configuration and channel display"""
-    
+
     settings_changed = Signal(dict)
+
+    # Channel color palette, cycled for channels beyond 8
+    _PALETTE = ("#FF0000", "#00FF00", "#0000FF", "#FFFF00",
+                "#FF00FF", "#00FFFF", "#FFFFFF", "#808080")
+
+    # Measurement rows shown per enabled channel: (measurement, unit)
+    _MEAS_ROWS = (
+        ("Frequency", "Hz"),
+        ("Period", "s"),
+        ("Amplitude", "V"),
+        ("RMS", "V"),
+    )
     
     def __init__(self, parent=None, comp_name="Oscilloscope", properties=None):
         super().__init__(parent)
@@ -36,9 +195,11 @@ class OscilloscopeDialog(QDialog):
         channels_tab = self._create_channels_tab()
         tabs.addTab(channels_tab, "Channels")
         
-        # Measurements Tab
+        # Measurements Tab (populated lazily when first shown)
         measurements_tab = self._create_measurements_tab()
-        tabs.addTab(measurements_tab, "Measurements")
+        self._meas_tab_index = tabs.addTab(measurements_tab, "Measurements")
+        self._tabs = tabs
+        tabs.currentChanged.connect(self._on_tab_changed)
         
         # Button bar
         button_layout = QHBoxLayout()
@@ -128,75 +289,45 @@ class OscilloscopeDialog(QDialog):
         layout.addLayout(button_layout)
         
         # Channel settings table
-        self.channels_table = QTableWidget()
-        self.channels_table.setColumnCount(5)
-        self.channels_table.setHorizontalHeaderLabels(
-            ["Channel", "Color", "Enabled", "Coupling", "Scale (V/div)"]
-        )
-        self.channels_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeToContents
-        )
-        
+        self.channels_model = ChannelsModel(self)
+        self.channels_table = QTableView()
+        self.channels_table.setModel(self.channels_model)
+
+        # Columns hold short, predictable strings; fixed widths avoid Qt
+        # rescanning every cell on each insert
+        header = self.channels_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        for col, width in enumerate((70, 60, 70, 80, 100)):
+            self.channels_table.setColumnWidth(col, width)
+
         # Add 4 channels initially
         self._init_channels()
-        
+
         layout.addWidget(self.channels_table)
         widget.setLayout(layout)
         return widget
-    
+
     def _init_channels(self):
-        """Initialize default channels"""
-        colors = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00"]
-        for i in range(4):
-            self._add_channel_row(f"CH{i+1}", colors[i], i < 2)
-    
-    def _add_channel_row(self, ch_name, color, enabled):
-        """Add a channel row to the table"""
-        row = self.channels_table.rowCount()
-        self.channels_table.insertRow(row)
-        
-        # Channel name
-        ch_item = QTableWidgetItem(ch_name)
-        ch_item.setFlags(ch_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        self.channels_table.setItem(row, 0, ch_item)
-        
-        # Color
-        color_item = QTableWidgetItem()
-        color_item.setBackground(QColor(color))
-        color_item.setFlags(color_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        self.channels_table.setItem(row, 1, color_item)
-        
-        # Enabled checkbox
-        enabled_item = QTableWidgetItem("✓")
-        enabled_item.setFlags(enabled_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-        enabled_item.setCheckState(Qt.CheckState.Checked if enabled else Qt.CheckState.Unchecked)
-        self.channels_table.setItem(row, 2, enabled_item)
-        
-        # Coupling
-        coupling_item = QTableWidgetItem("DC")
-        self.channels_table.setItem(row, 3, coupling_item)
-        
-        # Scale
-        scale_item = QTableWidgetItem("1 V")
-        self.channels_table.setItem(row, 4, scale_item)
-    
+        """Initialize default channels (one batched insert)"""
+        self.channels_model.add_channels([
+            Channel(f"CH{i+1}", self._PALETTE[i], i < 2)
+            for i in range(4)
+        ])
+
     def _add_channel(self):
         """Add a new channel to the oscilloscope"""
-        num_channels = self.channels_table.rowCount()
-        colors = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00", "#FF00FF", "#00FFFF", "#FFFFFF", "#808080"]
-        
+        num_channels = len(self.channels_model.channels)
+
         # Cycle through colors if more than 8 channels
-        color = colors[num_channels % len(colors)]
+        color = self._PALETTE[num_channels % len(self._PALETTE)]
         ch_name = f"CH{num_channels + 1}"
-        
-        self._add_channel_row(ch_name, color, enabled=True)
-        self.channels_table.resizeColumnsToContents()
-    
+
+        self.channels_model.add_channel(Channel(ch_name, color, enabled=True))
+
     def _remove_channel(self):
         """Remove the last channel from the oscilloscope"""
-        num_channels = self.channels_table.rowCount()
-        if num_channels > 1:  # Keep at least 1 channel
-            self.channels_table.removeRow(num_channels - 1)
+        if len(self.channels_model.channels) > 1:  # Keep at least 1 channel
+            self.channels_model.remove_last_channel()
         else:
             from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Warning", "Must have at least 1 channel")
@@ -207,17 +338,17 @@ class OscilloscopeDialog(QDialog):
         layout = QVBoxLayout()
         
         # Measurements table
-        self.measurements_table = QTableWidget()
-        self.measurements_table.setColumnCount(4)
-        self.measurements_table.setHorizontalHeaderLabels(
-            ["Channel", "Measurement", "Value", "Unit"]
-        )
+        self.measurements_model = MeasurementsModel(self)
+        self.measurements_table = QTableView()
+        self.measurements_table.setModel(self.measurements_model)
         self.measurements_table.horizontalHeader().setSectionResizeMode(
             QHeaderView.ResizeToContents
         )
-        
-        # Measurements will be populated based on enabled channels
-        self._populate_measurements()
+
+        # Populated lazily the first time the tab is shown; channel
+        # edits re-mark it dirty
+        self._meas_dirty = True
+        self.channels_model.dataChanged.connect(self._on_channels_changed)
         
         layout.addWidget(self.measurements_table)
         
@@ -229,28 +360,32 @@ class OscilloscopeDialog(QDialog):
         widget.setLayout(layout)
         return widget
     
+    def _on_tab_changed(self, index):
+        """Populate the measurements tab when it first becomes visible"""
+        if index == self._meas_tab_index and self._meas_dirty:
+            self._populate_measurements()
+
+    def _on_channels_changed(self, *args):
+        """Refresh measurements on channel edits only while the tab shows"""
+        self._meas_dirty = True
+        if self._tabs.currentIndex() == self._meas_tab_index:
+            self._populate_measurements()
+
     def _populate_measurements(self):
         """Populate measurements table based on enabled channels"""
-        self.measurements_table.setRowCount(0)
-        
-        measurement_types = ["Frequency", "Period", "Amplitude", "RMS"]
-        measurement_units = ["Hz", "s", "V", "V"]
-        
-        row = 0
-        for ch_idx in range(self.channels_table.rowCount()):
-            ch_item = self.channels_table.item(ch_idx, 0)
-            enabled_item = self.channels_table.item(ch_idx, 2)
-            
-            if ch_item and enabled_item and enabled_item.checkState() == Qt.CheckState.Checked:
-                ch_name = ch_item.text()
-                
-                for meas, unit in zip(measurement_types, measurement_units):
-                    self.measurements_table.insertRow(row)
-                    self.measurements_table.setItem(row, 0, QTableWidgetItem(ch_name))
-                    self.measurements_table.setItem(row, 1, QTableWidgetItem(meas))
-                    self.measurements_table.setItem(row, 2, QTableWidgetItem("0"))
-                    self.measurements_table.setItem(row, 3, QTableWidgetItem(unit))
-                    row += 1
+        self._meas_dirty = False
+        rows = [
+            (channel.name, meas, "0", unit)
+            for channel in self.channels_model.channels if channel.enabled
+            for meas, unit in self._MEAS_ROWS
+        ]
+        # Suppress the viewport repaint while the model resets so the
+        # rebuild paints once, after the new rows are in place
+        self.measurements_table.setUpdatesEnabled(False)
+        try:
+            self.measurements_model.set_rows(rows)
+        finally:
+            self.measurements_table.setUpdatesEnabled(True)
     
     def _apply_settings(self):
         """Apply settings and emit signal"""
@@ -283,21 +418,16 @@ class OscilloscopeDialog(QDialog):
         Returns:
             dict: Configuration with channel settings
         """
-        channels = []
-        for row in range(self.channels_table.rowCount()):
-            ch_name = self.channels_table.item(row, 0).text()
-            color = self.channels_table.item(row, 1).background().color().name()
-            enabled = self.channels_table.item(row, 2).checkState() == Qt.CheckState.Checked
-            coupling = self.channels_table.cellWidget(row, 3).currentText() if self.channels_table.cellWidget(row, 3) else "AC"
-            scale = self.channels_table.item(row, 4).text() if self.channels_table.item(row, 4) else "1V"
-            
-            channels.append({
-                "name": ch_name,
-                "color": color,
-                "enabled": enabled,
-                "coupling": coupling,
-                "scale": scale
-            })
+        channels = [
+            {
+                "name": channel.name,
+                "color": channel.color,
+                "enabled": channel.enabled,
+                "coupling": channel.coupling,
+                "scale": channel.scale
+            }
+            for channel in self.channels_model.channels
+        ]
         
         return {
             "timebase": self.timebase_combo.currentText(),
@@ -29,6 +29,7 @@ qInstallMessageHandler(qt_message_handler)
 # NOW import QApplication
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
+from PySide6.QtCore import QTimer
 
 # Add src directory to path
 src_path = Path(__file__).parent.parent
@@ -38,34 +39,39 @@ from frontend.ui.main_window import MainWindow
 from frontend.backend_connector import get_backend_connector
 
 
-def main():
-    """Initialize and run the application"""
-    # Initialize backend services
-    print("\n" + "=" * 70)
-    print("Virtual Electrical Designer & Simulator")
-    print("=" * 70)
-    
+def _init_backend():
+    """Warm up backend services after the window is already visible"""
     try:
-        backend = get_backend_connector()
+        get_backend_connector()
         print("[OK] Backend services initialized")
     except Exception as e:
         print(f"[ERROR] Failed to initialize backend: {e}")
         print("  Application will continue with limited functionality")
-    
+
+
+def main():
+    """Initialize and run the application"""
+    print("\n" + "=" * 70)
+    print("Virtual Electrical Designer & Simulator")
+    print("=" * 70)
+
     app = QApplication(sys.argv)
-    
+
     # Set application metadata
     app.setApplicationName("Virtual Electrical Designer & Simulator")
     app.setApplicationVersion("0.1.0")
     app.setOrganizationName("VED")
-    
-    # Create and show main window
+
+    # Create and show main window before the backend warms up so the UI
+    # paints on the first event-loop tick
     window = MainWindow()
     window.show()
-    
+
+    QTimer.singleShot(0, _init_backend)
+
     # Run application
     exit_code = app.exec()
-    
+
     sys.exit(exit_code)
 
 
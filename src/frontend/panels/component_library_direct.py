@@ -1,354 +1,548 @@
-"""
-Backend-integrated component library panel
-Direct integration with backend services (no HTTP API)
-"""
-
-from typing import Optional, Dict, List
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QTreeWidget, QTreeWidgetItem, QMessageBox
-from PySide6.QtCore import Qt, Signal, QMimeData, QTimer, QByteArray
-from PySide6.QtGui import QDrag
-import logging
-
-from frontend.backend_connector import get_backend_connector
-
-logger = logging.getLogger(__name__)
-
-
-class DraggableComponentTree(QTreeWidget):
-    """Custom tree widget with proper drag-and-drop support for components"""
-    
-    def mousePressEvent(self, event):
-        """Handle mouse press to start drag"""
-        super().mousePressEvent(event)
-        if event.button() == Qt.LeftButton:
-            self.drag_start_position = event.position()
-    
-    def mouseMoveEvent(self, event):
-        """Handle mouse move to start dragging"""
-        if not (event.buttons() & Qt.LeftButton):
-            return
-        
-        if not hasattr(self, 'drag_start_position'):
-            return
-        
-        # Check if we've moved far enough to start drag
-        distance = (event.position() - self.drag_start_position).manhattanLength()
-        if distance < 4:
-            return
-        
-        # Get the item under cursor
-        item = self.itemAt(int(self.drag_start_position.x()), int(self.drag_start_position.y()))
-        if not item:
-            return
-        
-        # Only drag components, not categories
-        item_type = item.data(0, Qt.UserRole)
-        if item_type != "component":
-            return
-        
-        comp_id = item.data(0, Qt.UserRole + 1)
-        comp_name = item.data(0, Qt.UserRole + 2)
-        
-        if not comp_id or not comp_name:
-            return
-        
-        # Create mime data
-        mime = QMimeData()
-        mime.setData("component/type", comp_id.encode('utf-8'))
-        mime.setData("component/name", comp_name.encode('utf-8'))
-        mime.setText(f"{comp_id}|{comp_name}")
-        
-        # Create drag
-        drag = QDrag(self)
-        drag.setMimeData(mime)
-        drag.exec(Qt.CopyAction)
-
-
-class BackendComponentLibraryPanel(QWidget):
-    """
-    Component Library Panel with direct backend integration
-    
-    Features:
-    - Loads components directly from backend services
-    - Local caching for performance
-    - Search and filtering
-    - Drag-and-drop support
-    """
-    
-    # Signals
-    component_selected = Signal(str, str)  # component_id, component_name
-    component_loaded = Signal(list)  # loaded components
-    library_error = Signal(str)  # error message
-    
-    def __init__(self):
-        super().__init__()
-        
-        try:
-            self.backend = get_backend_connector()
-        except Exception as e:
-            logger.warning(f"Backend not available: {e}")
-            self.backend = None
-        
-        self.component_cache: Dict[str, Dict] = {}
-        self.category_items: Dict[str, QTreeWidgetItem] = {}
-        
-        # Setup UI
-        layout = QVBoxLayout()
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(6)
-        self.setLayout(layout)
-        
-        # Search bar
-        self.search_box = QLineEdit()
-        self.search_box.setPlaceholderText("Search components...")
-        self.search_box.setMinimumHeight(32)
-        self.search_box.setStyleSheet("""
-            QLineEdit {
-                border: 2px solid #90caf9;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-        """)
-        self.search_box.textChanged.connect(self._filter_components)
-        layout.addWidget(self.search_box)
-        
-        # Component tree (use custom draggable tree)
-        self.tree = DraggableComponentTree()
-        self.tree.setHeaderHidden(True)
-        self.tree.setStyleSheet("""
-            QTreeWidget {
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                background: white;
-            }
-            QTreeWidget::item {
-                padding: 4px;
-                height: 24px;
-            }
-            QTreeWidget::item:hover {
-                background: #e3f2fd;
-            }
-            QTreeWidget::item:selected {
-                background: #bbdefb;
-            }
-        """)
-        self.tree.itemDoubleClicked.connect(self._on_item_double_clicked)
-        layout.addWidget(self.tree)
-        
-        # Register for library change notifications
-        if self.backend:
-            self.backend.register_library_change_callback(self._on_library_changed)
-        
-        # Load components from backend
-        QTimer.singleShot(100, self._load_components)
-    
-    def _load_components(self):
-        """Load components from backend"""
-        try:
-            if not self.backend:
-                logger.warning("Backend not available, using fallback components")
-                self._populate_fallback_components()
-                return
-            
-            logger.info("Loading components from backend...")
-            
-            # Get categories from backend
-            categories = self.backend.get_component_categories()
-            
-            if not isinstance(categories, dict) or len(categories) == 0:
-                logger.warning("No categories from backend")
-                self._populate_fallback_components()
-                return
-            
-            self.tree.clear()
-            self.category_items.clear()
-            self.component_cache.clear()
-            
-            total_components = 0
-            
-            # Add each category and its components
-            for category_name, components in categories.items():
-                cat_item = QTreeWidgetItem([category_name])
-                cat_item.setData(0, Qt.UserRole, "category")
-                self.tree.addTopLevelItem(cat_item)
-                self.category_items[category_name] = cat_item
-                
-                # Add components from the category
-                try:
-                    if isinstance(components, list):
-                        for comp in components:
-                            comp_id = comp.get('id') or comp.get('name', '').lower()
-                            comp_name = comp.get('name', '')
-                            
-                            if comp_name:
-                                comp_item = QTreeWidgetItem([comp_name])
-                                comp_item.setData(0, Qt.UserRole, "component")
-                                comp_item.setData(0, Qt.UserRole + 1, comp_id)
-                                comp_item.setData(0, Qt.UserRole + 2, comp_name)
-                                
-                                # Cache component
-                                self.component_cache[comp_id] = comp
-                                
-                                # Add tooltip
-                                description = comp.get('description', f'Component: {comp_name}')
-                                comp_item.setToolTip(0, description)
-                                
-                                cat_item.addChild(comp_item)
-                                total_components += 1
-                
-                except Exception as e:
-                    logger.error(f"Error loading category {category_name}: {e}")
-            
-            self.tree.expandAll()
-            logger.info(f"✓ Loaded {total_components} components from backend")
-            self.component_loaded.emit(list(self.component_cache.values()))
-        
-        except Exception as e:
-            logger.error(f"Error loading components: {e}")
-            self.library_error.emit(str(e))
-            self._populate_fallback_components()
-    
-    def _populate_fallback_components(self):
-        """Fallback component library (static list)"""
-        logger.info("Loading fallback component library...")
-        
-        components_by_category = {
-            "Passive Components": [
-                ("resistor", "Resistor"),
-                ("capacitor", "Capacitor"),
-                ("inductor", "Inductor"),
-                ("ground", "Ground"),
-            ],
-            "Power Sources": [
-                ("dc_source", "DC Source"),
-                ("ac_source", "AC Source"),
-                ("battery", "Battery"),
-                ("current_source", "Current Source"),
-            ],
-            "Semiconductors": [
-                ("diode", "Diode"),
-                ("led", "LED"),
-                ("bjt", "BJT Transistor"),
-                ("mosfet", "MOSFET"),
-                ("scr", "SCR"),
-            ],
-            "Integrated Circuits": [
-                ("opamp", "Op-Amp"),
-                ("timer_555", "555 Timer"),
-                ("comparator", "Comparator"),
-                ("multiplexer", "Multiplexer"),
-            ],
-            "Logic Gates": [
-                ("and_gate", "AND Gate"),
-                ("or_gate", "OR Gate"),
-                ("not_gate", "NOT Gate"),
-                ("nand_gate", "NAND Gate"),
-            ],
-            "Measurement": [
-                ("ammeter", "Ammeter"),
-                ("voltmeter", "Voltmeter"),
-                ("wattmeter", "Wattmeter"),
-            ],
-            "Test Equipment": [
-                ("oscilloscope", "Oscilloscope"),
-                ("function_generator", "Function Generator"),
-                ("multimeter_digital", "Digital Multimeter"),
-                ("spectrum_analyzer", "Spectrum Analyzer"),
-                ("power_supply_bench", "Bench Power Supply"),
-                ("clamp_meter", "Clamp Meter"),
-                ("logic_analyzer", "Logic Analyzer"),
-                ("lcr_meter", "LCR Meter"),
-            ],
-        }
-        
-        self.tree.clear()
-        self.category_items.clear()
-        
-        for category, items in components_by_category.items():
-            cat_item = QTreeWidgetItem([category])
-            cat_item.setData(0, Qt.UserRole, "category")
-            self.tree.addTopLevelItem(cat_item)
-            self.category_items[category] = cat_item
-            
-            for comp_id, comp_name in items:
-                comp_item = QTreeWidgetItem([comp_name])
-                comp_item.setData(0, Qt.UserRole, "component")
-                comp_item.setData(0, Qt.UserRole + 1, comp_id)
-                comp_item.setData(0, Qt.UserRole + 2, comp_name)
-                cat_item.addChild(comp_item)
-                
-                # Cache for compatibility
-                self.component_cache[comp_id] = {
-                    'id': comp_id,
-                    'name': comp_name,
-                    'category': category
-                }
-        
-        self.tree.expandAll()
-        logger.info("✓ Fallback library loaded")
-    
-    def _filter_components(self, text: str):
-        """Filter components based on search text"""
-        text_lower = text.lower()
-        
-        for cat_name, cat_item in self.category_items.items():
-            any_child_visible = False
-            
-            for i in range(cat_item.childCount()):
-                child = cat_item.child(i)
-                child_name = child.text(0).lower()
-                
-                # Match by name
-                matches = text_lower in child_name
-                child.setHidden(not matches)
-                
-                if matches:
-                    any_child_visible = True
-            
-            cat_item.setHidden(not any_child_visible)
-    
-    def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
-        """Handle double-click on component item"""
-        comp_id = item.data(0, Qt.UserRole + 1)
-        comp_name = item.data(0, Qt.UserRole + 2)
-        
-        if comp_id and comp_name:
-            self.component_selected.emit(comp_id, comp_name)
-    
-    def search_components(self, query: str) -> List[Dict]:
-        """Search components by query"""
-        if not self.backend:
-            return []
-        
-        try:
-            return self.backend.search_components(query)
-        except Exception as e:
-            logger.error(f"Search error: {e}")
-            return []
-    
-    def get_component_details(self, component_id: str) -> Optional[Dict]:
-        """Get component details"""
-        if component_id in self.component_cache:
-            return self.component_cache[component_id]
-        
-        if not self.backend:
-            return None
-        
-        try:
-            return self.backend.get_component_details(component_id)
-        except Exception as e:
-            logger.error(f"Error getting component details: {e}")
-            return None
-    
-    def reload_from_backend(self):
-        """Reload components from backend"""
-        logger.info("Reloading components from backend...")
-        self._load_components()
-    
-    def _on_library_changed(self, library_name: str):
-        """Called when a library file changes on disk."""
-        logger.info(f"Library changed: {library_name}, reloading UI...")
-        self._load_components()
-
+"""
+Backend-integrated component library panel
+Direct integration with backend services (no HTTP API)
+"""
+
+import os
+import pickle
+from contextlib import contextmanager
+from sys import intern
+from pathlib import Path
+from typing import Optional, Dict, List
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QTreeWidget, QTreeWidgetItem, QMessageBox
+from PySide6.QtCore import Qt, Signal, QMimeData, QObject, QThread, QTimer, QByteArray
+from PySide6.QtGui import QDrag
+import logging
+
+from frontend.backend_connector import get_backend_connector
+
+logger = logging.getLogger(__name__)
+
+# Last successful category listing, serialized so the next launch can
+# populate the tree without waiting on backend enumeration
+_CATEGORY_CACHE_PATH = Path.home() / ".cache" / "ved" / "components.pkl"
+
+
+class LoadWorker(QObject):
+    """Fetches component categories off the GUI thread"""
+
+    finished = Signal(dict)
+    error = Signal(str)
+
+    def __init__(self, backend):
+        super().__init__()
+        self.backend = backend
+
+    def run(self):
+        try:
+            self.finished.emit(self.backend.get_component_categories())
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class DraggableComponentTree(QTreeWidget):
+    """Custom tree widget with proper drag-and-drop support for components"""
+    
+    def mousePressEvent(self, event):
+        """Handle mouse press to start drag"""
+        super().mousePressEvent(event)
+        if event.button() == Qt.LeftButton:
+            self.drag_start_position = event.position()
+    
+    def mouseMoveEvent(self, event):
+        """Handle mouse move to start dragging"""
+        if not (event.buttons() & Qt.LeftButton):
+            return
+        
+        if not hasattr(self, 'drag_start_position'):
+            return
+        
+        # Check if we've moved far enough to start drag
+        distance = (event.position() - self.drag_start_position).manhattanLength()
+        if distance < 4:
+            return
+        
+        # Get the item under cursor
+        item = self.itemAt(int(self.drag_start_position.x()), int(self.drag_start_position.y()))
+        if not item:
+            return
+        
+        # Only drag components, not categories; item kind and identity are
+        # packed into one UserRole tuple, so this is a single data() call
+        item_data = item.data(0, Qt.UserRole)
+        if not item_data or item_data[0] != "component":
+            return
+        
+        # Payload bytes are precomputed at tree-build time; no encoding
+        # on the mouse-move hot path
+        id_bytes = item.data(0, Qt.UserRole + 3)
+        name_bytes = item.data(0, Qt.UserRole + 4)
+
+        if not id_bytes or not name_bytes:
+            return
+
+        # Create mime data; the drop target reads the binary roles, so
+        # no text representation is needed
+        mime = QMimeData()
+        mime.setData("component/type", id_bytes)
+        mime.setData("component/name", name_bytes)
+
+        # Create drag
+        drag = QDrag(self)
+        drag.setMimeData(mime)
+        drag.exec(Qt.CopyAction)
+
+
+class BackendComponentLibraryPanel(QWidget):
+    """
+    Component Library Panel with direct backend integration
+    
+    Features:
+    - Loads components directly from backend services
+    - Local caching for performance
+    - Search and filtering
+    - Drag-and-drop support
+    """
+    
+    # Signals
+    component_selected = Signal(str, str)  # component_id, component_name
+    component_loaded = Signal(list)  # loaded components
+    library_error = Signal(str)  # error message
+    
+    def __init__(self):
+        super().__init__()
+        
+        try:
+            self.backend = get_backend_connector()
+        except Exception as e:
+            logger.warning(f"Backend not available: {e}")
+            self.backend = None
+        
+        self.component_cache: Dict[str, Dict] = {}
+        self.category_items: Dict[str, QTreeWidgetItem] = {}
+
+        # Flat search index built once per tree population:
+        # (category item, component item, lowercase name) per component,
+        # with a parallel bytearray of current hidden states
+        self._search_index: List[tuple] = []
+        self._hidden_state = bytearray()
+
+        # Trigram -> set of _search_index positions, used to prefilter
+        # queries of three or more characters down to candidate items
+        self._trigram_index: Dict[str, set] = {}
+
+        # Debounce timer so rapid typing triggers one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self._apply_filter)
+
+        # File watchers fire several events per save; coalesce reloads
+        # into one rebuild after the burst quiesces
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(500)
+        self._reload_timer.timeout.connect(self._load_components)
+        
+        # Setup UI
+        layout = QVBoxLayout()
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(6)
+        self.setLayout(layout)
+        
+        # Search bar
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Search components...")
+        self.search_box.setMinimumHeight(32)
+        self.search_box.setStyleSheet("""
+            QLineEdit {
+                border: 2px solid #90caf9;
+                border-radius: 4px;
+                padding: 4px 8px;
+                font-size: 11px;
+                font-weight: bold;
+            }
+        """)
+        self.search_box.textChanged.connect(self._on_search_text_changed)
+        layout.addWidget(self.search_box)
+        
+        # Component tree (use custom draggable tree)
+        self.tree = DraggableComponentTree()
+        self.tree.setHeaderHidden(True)
+        self.tree.setStyleSheet("""
+            QTreeWidget {
+                border: 1px solid #ddd;
+                border-radius: 4px;
+                background: white;
+            }
+            QTreeWidget::item {
+                padding: 4px;
+                height: 24px;
+            }
+            QTreeWidget::item:hover {
+                background: #e3f2fd;
+            }
+            QTreeWidget::item:selected {
+                background: #bbdefb;
+            }
+        """)
+        # Queued so the handler runs on the next event-loop pass; the
+        # click's paint and selection updates finish first
+        self.tree.itemDoubleClicked.connect(
+            self._on_item_double_clicked, Qt.QueuedConnection)
+        layout.addWidget(self.tree)
+        
+        # Register for library change notifications
+        if self.backend:
+            self.backend.register_library_change_callback(self._on_library_changed)
+        
+        # Load components from backend off the GUI thread so startup
+        # doesn't block on library enumeration; a disk cache of the last
+        # listing skips the backend entirely until a library changes
+        if self.backend:
+            cached = self._load_categories_from_disk()
+            if cached:
+                logger.info("Populating component tree from disk cache")
+                self._on_categories_loaded(cached, from_cache=True)
+            else:
+                self._start_background_load()
+        else:
+            logger.warning("Backend not available, using fallback components")
+            self._populate_fallback_components()
+
+    @staticmethod
+    def _load_categories_from_disk() -> Optional[Dict]:
+        """Load the cached category listing, or None on a miss"""
+        try:
+            if _CATEGORY_CACHE_PATH.exists():
+                with open(_CATEGORY_CACHE_PATH, 'rb') as f:
+                    return pickle.load(f)
+        except (OSError, pickle.UnpicklingError) as e:
+            logger.warning(f"Could not read category cache: {e}")
+        return None
+
+    @staticmethod
+    def _save_categories_to_disk(categories: Dict):
+        """Serialize the category listing atomically (write + os.replace)"""
+        try:
+            _CATEGORY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _CATEGORY_CACHE_PATH.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(categories, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, _CATEGORY_CACHE_PATH)
+        except OSError as e:
+            logger.warning(f"Could not write category cache: {e}")
+
+    def _start_background_load(self):
+        """Fetch categories on a worker thread; populate when they arrive"""
+        self._load_thread = QThread(self)
+        self._load_worker = LoadWorker(self.backend)
+        self._load_worker.moveToThread(self._load_thread)
+        self._load_thread.started.connect(self._load_worker.run)
+        self._load_worker.finished.connect(self._on_categories_loaded)
+        self._load_worker.error.connect(self._on_load_error)
+        self._load_worker.finished.connect(self._load_thread.quit)
+        self._load_worker.error.connect(self._load_thread.quit)
+        self._load_thread.start()
+    
+    @staticmethod
+    def _set_drag_payload(comp_item: QTreeWidgetItem, comp_id: str, comp_name: str):
+        """Precompute the drag mime payload so drag start never encodes"""
+        comp_item.setData(0, Qt.UserRole + 3, QByteArray(comp_id.encode('utf-8')))
+        comp_item.setData(0, Qt.UserRole + 4, QByteArray(comp_name.encode('utf-8')))
+
+    @contextmanager
+    def _frozen_tree(self):
+        """Suppress per-insert repaints and signals during a bulk rebuild"""
+        self.tree.hide()
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
+            self.tree.show()
+
+    def _load_components(self):
+        """Load components from backend (synchronous reload path)"""
+        if not self.backend:
+            logger.warning("Backend not available, using fallback components")
+            self._populate_fallback_components()
+            return
+
+        logger.info("Loading components from backend...")
+        try:
+            categories = self.backend.get_component_categories()
+        except Exception as e:
+            self._on_load_error(str(e))
+            return
+        self._on_categories_loaded(categories)
+
+    def _on_load_error(self, message: str):
+        """Fall back to the static library after a failed backend fetch"""
+        logger.error(f"Error loading components: {message}")
+        self.library_error.emit(message)
+        self._populate_fallback_components()
+
+    def _on_categories_loaded(self, categories: Dict, from_cache: bool = False):
+        """Populate the tree from fetched categories (runs on the GUI thread)"""
+        try:
+            if not isinstance(categories, dict) or len(categories) == 0:
+                logger.warning("No categories from backend")
+                self._populate_fallback_components()
+                return
+            
+            with self._frozen_tree():
+                self.tree.clear()
+                self.category_items.clear()
+                self.component_cache.clear()
+                self._search_index = []
+
+                total_components = 0
+
+                # Add each category and its components
+                for category_name, components in categories.items():
+                    # The backend returns fresh str objects each fetch;
+                    # interning collapses the repeated short keys to one
+                    # canonical object
+                    category_name = intern(category_name)
+                    cat_item = QTreeWidgetItem([category_name])
+                    cat_item.setData(0, Qt.UserRole, ("category", None, None))
+                    self.tree.addTopLevelItem(cat_item)
+                    self.category_items[category_name] = cat_item
+
+                    # Add components from the category
+                    try:
+                        if isinstance(components, list):
+                            for comp in components:
+                                _get = comp.get
+                                comp_id = intern(_get('id') or _get('name', '').lower())
+                                comp_name = _get('name', '')
+
+                                if comp_name:
+                                    # Parented construction inserts in C++
+                                    # with one signal, no reparenting
+                                    comp_item = QTreeWidgetItem(cat_item, [comp_name])
+                                    comp_item.setData(
+                                        0, Qt.UserRole,
+                                        ("component", comp_id, comp_name))
+                                    self._set_drag_payload(comp_item, comp_id, comp_name)
+
+                                    # Cache component
+                                    self.component_cache[comp_id] = comp
+
+                                    # Add tooltip (only build the default
+                                    # string when none is provided)
+                                    description = _get('description') or f'Component: {comp_name}'
+                                    comp_item.setToolTip(0, description)
+
+                                    self._search_index.append(
+                                        (cat_item, comp_item, comp_name.lower()))
+                                    total_components += 1
+
+                    except Exception as e:
+                        logger.error(f"Error loading category {category_name}: {e}")
+
+                # O(categories) instead of recursing every node
+                self.tree.expandToDepth(0)
+            self._hidden_state = bytearray(len(self._search_index))
+            self._rebuild_trigram_index()
+            if not from_cache:
+                self._save_categories_to_disk(categories)
+            logger.info(f"✓ Loaded {total_components} components from backend")
+            self.component_loaded.emit(list(self.component_cache.values()))
+        
+        except Exception as e:
+            logger.error(f"Error loading components: {e}")
+            self.library_error.emit(str(e))
+            self._populate_fallback_components()
+    
+    def _populate_fallback_components(self):
+        """Fallback component library (static list)"""
+        logger.info("Loading fallback component library...")
+        
+        components_by_category = {
+            "Passive Components": [
+                ("resistor", "Resistor"),
+                ("capacitor", "Capacitor"),
+                ("inductor", "Inductor"),
+                ("ground", "Ground"),
+            ],
+            "Power Sources": [
+                ("dc_source", "DC Source"),
+                ("ac_source", "AC Source"),
+                ("battery", "Battery"),
+                ("current_source", "Current Source"),
+            ],
+            "Semiconductors": [
+                ("diode", "Diode"),
+                ("led", "LED"),
+                ("bjt", "BJT Transistor"),
+                ("mosfet", "MOSFET"),
+                ("scr", "SCR"),
+            ],
+            "Integrated Circuits": [
+                ("opamp", "Op-Amp"),
+                ("timer_555", "555 Timer"),
+                ("comparator", "Comparator"),
+                ("multiplexer", "Multiplexer"),
+            ],
+            "Logic Gates": [
+                ("and_gate", "AND Gate"),
+                ("or_gate", "OR Gate"),
+                ("not_gate", "NOT Gate"),
+                ("nand_gate", "NAND Gate"),
+            ],
+            "Measurement": [
+                ("ammeter", "Ammeter"),
+                ("voltmeter", "Voltmeter"),
+                ("wattmeter", "Wattmeter"),
+            ],
+            "Test Equipment": [
+                ("oscilloscope", "Oscilloscope"),
+                ("function_generator", "Function Generator"),
+                ("multimeter_digital", "Digital Multimeter"),
+                ("spectrum_analyzer", "Spectrum Analyzer"),
+                ("power_supply_bench", "Bench Power Supply"),
+                ("clamp_meter", "Clamp Meter"),
+                ("logic_analyzer", "Logic Analyzer"),
+                ("lcr_meter", "LCR Meter"),
+            ],
+        }
+        
+        with self._frozen_tree():
+            self.tree.clear()
+            self.category_items.clear()
+            self._search_index = []
+
+            for category, items in components_by_category.items():
+                cat_item = QTreeWidgetItem([category])
+                cat_item.setData(0, Qt.UserRole, ("category", None, None))
+                self.tree.addTopLevelItem(cat_item)
+                self.category_items[category] = cat_item
+
+                for comp_id, comp_name in items:
+                    comp_item = QTreeWidgetItem(cat_item, [comp_name])
+                    comp_item.setData(0, Qt.UserRole, ("component", comp_id, comp_name))
+                    self._set_drag_payload(comp_item, comp_id, comp_name)
+                    self._search_index.append((cat_item, comp_item, comp_name.lower()))
+
+                    # Cache for compatibility
+                    self.component_cache[comp_id] = {
+                        'id': comp_id,
+                        'name': comp_name,
+                        'category': category
+                    }
+
+            self.tree.expandToDepth(0)
+        self._hidden_state = bytearray(len(self._search_index))
+        self._rebuild_trigram_index()
+        logger.info("✓ Fallback library loaded")
+    
+    def _on_search_text_changed(self, text: str):
+        """Restart the debounce timer; the filter runs once typing pauses"""
+        self._filter_timer.start()
+
+    def _apply_filter(self):
+        self._filter_components(self.search_box.text())
+
+    def _rebuild_trigram_index(self):
+        """Index each component name's trigrams for query prefiltering"""
+        index: Dict[str, set] = {}
+        for i, (_cat_item, _comp_item, name_lower) in enumerate(self._search_index):
+            for j in range(len(name_lower) - 2):
+                index.setdefault(name_lower[j:j + 3], set()).add(i)
+        self._trigram_index = index
+
+    def _trigram_candidates(self, text_lower: str) -> set:
+        """Positions whose names contain every trigram of the query"""
+        candidates = None
+        for j in range(len(text_lower) - 2):
+            postings = self._trigram_index.get(text_lower[j:j + 3])
+            if not postings:
+                return set()
+            candidates = postings if candidates is None else candidates & postings
+            if not candidates:
+                break
+        return candidates
+
+    def _filter_components(self, text: str):
+        """Filter components using the precomputed lowercase index"""
+        text_lower = text.lower()
+        hidden_state = self._hidden_state
+        cats_with_matches = set()
+
+        # Queries of 3+ chars narrow to trigram candidates first; shorter
+        # ones fall back to checking every name
+        candidates = self._trigram_candidates(text_lower) if len(text_lower) >= 3 else None
+
+        for i, (cat_item, comp_item, name_lower) in enumerate(self._search_index):
+            if candidates is not None and i not in candidates:
+                hidden = True
+            else:
+                hidden = text_lower not in name_lower
+            if not hidden:
+                cats_with_matches.add(id(cat_item))
+            # Only cross into Qt when the state actually changes
+            if hidden_state[i] != hidden:
+                comp_item.setHidden(hidden)
+                hidden_state[i] = hidden
+
+        for cat_item in self.category_items.values():
+            cat_item.setHidden(id(cat_item) not in cats_with_matches)
+    
+    def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+        """Handle double-click on component item"""
+        item_data = item.data(0, Qt.UserRole)
+        if not item_data:
+            return
+        kind, comp_id, comp_name = item_data
+
+        if kind == "component" and comp_id and comp_name:
+            self.component_selected.emit(comp_id, comp_name)
+    
+    def search_components(self, query: str) -> List[Dict]:
+        """Search components by query"""
+        if not self.backend:
+            return []
+        
+        try:
+            return self.backend.search_components(query)
+        except Exception as e:
+            logger.error(f"Search error: {e}")
+            return []
+    
+    def get_component_details(self, component_id: str) -> Optional[Dict]:
+        """Get component details"""
+        if component_id in self.component_cache:
+            return self.component_cache[component_id]
+        
+        if not self.backend:
+            return None
+
+        try:
+            details = self.backend.get_component_details(component_id)
+            # Write back so repeat lookups stay local
+            if details:
+                self.component_cache[component_id] = {
+                    **self.component_cache.get(component_id, {}), **details}
+            return details
+        except Exception as e:
+            logger.error(f"Error getting component details: {e}")
+            return None
+    
+    def reload_from_backend(self):
+        """Reload components from backend"""
+        logger.info("Reloading components from backend...")
+        self._load_components()
+    
+    def _on_library_changed(self, library_name: str):
+        """Called when a library file changes on disk."""
+        logger.info(f"Library changed: {library_name}, reloading UI...")
+        try:
+            _CATEGORY_CACHE_PATH.unlink(missing_ok=True)
+        except OSError:
+            pass
+        self._reload_timer.start()
+
@@ -22,7 +22,7 @@ from frontend.panels.properties_panel import PropertiesPanel
 from frontend.windows.script_editor_window import ScriptEditorWindow
 from frontend.windows.waveform_viewer_window import WaveformViewerWindow
 from frontend.core.command_manager import CommandManager
-from frontend.utils.icon_loader import get_icon
+from frontend.utils.icon_loader import IconLoader, get_icon
 from backend.circuit.circuit_validator import CircuitValidator
 from backend.circuit.circuit_analyzer import CircuitAnalyzer
 from backend.reporting.report_generator import ReportGenerator
@@ -44,7 +44,11 @@ class MainWindow(QMainWindow):
         
         # Apply modern styling
         self._apply_global_styling()
-        
+
+        # Warm the icon cache in one batch so later widget setup never
+        # rasterizes on first access
+        IconLoader.preload()
+
         # Backend connector (initialized after panels setup)
         self.backend = None
         
@@ -580,8 +584,10 @@ class MainWindow(QMainWindow):
         self.circuit_canvas.undo_redo_changed.connect(self._update_undo_redo_buttons)
         self.circuit_canvas.clipboard_changed.connect(self._update_paste_button)
         
-        # Component library signals
-        self.component_library.component_selected.connect(self._on_library_component_selected)
+        # Component library signals (queued so tree paint events can
+        # interleave before the placement handler runs)
+        self.component_library.component_selected.connect(
+            self._on_library_component_selected, Qt.QueuedConnection)
         
         # Inspector signals
         self.inspector.property_changed.connect(self._on_property_changed)
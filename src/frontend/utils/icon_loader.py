@@ -1,24 +1,288 @@
 """
 Icon loader utility for loading SVG icons from assets directory
 """
+import atexit
+import shelve
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PySide6.QtGui import QPixmap, QIcon
+from PySide6.QtGui import QImage, QPainter, QPixmap, QIcon
 from PySide6.QtSvg import QSvgRenderer
-from PySide6.QtCore import QSize
+from PySide6.QtCore import Qt, QBuffer, QSize
 import logging
 
+# Compiled Qt resources (assets/icons.qrc via pyside6-rcc); importing
+# registers the :/icons/ tree so SVG reads are memory-backed instead of
+# per-icon filesystem I/O
+try:
+    from frontend.utils import icons_rc  # noqa: F401
+    _RESOURCES_AVAILABLE = True
+except ImportError:
+    _RESOURCES_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Get assets directory path
 ASSETS_DIR = Path(__file__).parent.parent.parent.parent / "assets"
 ICONS_DIR = ASSETS_DIR / "icons"
 
+# PNGs pre-rendered by tools/prerender_icons.py; loading one skips SVG
+# parsing and rasterization entirely
+ICONS_CACHE_DIR = ASSETS_DIR / "icons_cache"
+
+# Per-user cache of runtime-rendered pixmaps (PNG bytes keyed by name
+# and size), so later launches skip sizes the bundle doesn't ship
+_DISK_CACHE_PATH = Path.home() / ".cache" / "ved" / "icons.db"
+
 
 class IconLoader:
     """Loads and caches SVG icons from the assets directory"""
-    
-    _cache = {}
-    
+
+    # Each cached QPixmap/QIcon holds a native handle, so the icon and
+    # pixmap caches evict least-recently-used entries past this bound
+    _CACHE_MAX = 256
+
+    _cache = OrderedDict()
+
+    # Icons are rasterized once at this size; smaller sizes are scaled
+    # down from the master, so one SVG render amortizes over every size
+    _MASTER_SIZE = 64
+
+    # Master rasterization per icon name
+    _master_cache = {}
+
+    # Scaled pixmap per (icon name, size); both get_icon and get_pixmap
+    # draw from it so the scaling work runs once per size
+    _pixmap_cache = OrderedDict()
+
+    # Parsed QSvgRenderer per icon name, shared across all sizes so the
+    # SVG XML is parsed once; locked because icons may be requested from
+    # worker threads during startup
+    _renderer_cache = {}
+    _renderer_lock = threading.Lock()
+
+    # Icon presence by name, negative results included, so repeated
+    # lookups of a missing icon never re-stat the filesystem
+    _exists_cache = {}
+
+    # Lazily opened shelve (or plain dict when shelve can't open)
+    _disk_cache = None
+
+    @classmethod
+    def _svg_exists(cls, icon_name: str) -> bool:
+        """Whether the icon's SVG exists on disk (stat at most once)"""
+        exists = cls._exists_cache.get(icon_name)
+        if exists is None:
+            exists = cls._exists_cache[icon_name] = (
+                ICONS_DIR / f"{icon_name}.svg").exists()
+        return exists
+
+    @classmethod
+    def _get_renderer(cls, icon_name: str):
+        """Return the shared renderer for an icon, or None if missing"""
+        with cls._renderer_lock:
+            renderer = cls._renderer_cache.get(icon_name)
+            if renderer is None:
+                if cls._exists_cache.get(icon_name) is False:
+                    return None
+                if _RESOURCES_AVAILABLE:
+                    # Resource paths have no stat; validity after load
+                    # stands in for the exists() check
+                    renderer = QSvgRenderer(f":/icons/{icon_name}.svg")
+                elif cls._svg_exists(icon_name):
+                    renderer = QSvgRenderer(str(ICONS_DIR / f"{icon_name}.svg"))
+                else:
+                    renderer = None
+                if renderer is None or not renderer.isValid():
+                    cls._exists_cache[icon_name] = False
+                    logger.warning(f"Icon not found: {icon_name}")
+                    return None
+                cls._exists_cache[icon_name] = True
+                cls._renderer_cache[icon_name] = renderer
+            return renderer
+
+    @classmethod
+    def _get_disk_cache(cls):
+        """Open the persistent cache once; a dict stands in on failure"""
+        if cls._disk_cache is None:
+            try:
+                _DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                cls._disk_cache = shelve.open(str(_DISK_CACHE_PATH))
+                atexit.register(cls._disk_cache.close)
+            except OSError as e:
+                logger.warning(f"Could not open icon disk cache: {e}")
+                cls._disk_cache = {}
+        return cls._disk_cache
+
+    @classmethod
+    def _svg_mtime(cls, icon_name: str) -> int:
+        """The source SVG's mtime, or 0 when it can't be stat'ed"""
+        try:
+            return (ICONS_DIR / f"{icon_name}.svg").stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    @classmethod
+    def _load_pixmap_from_disk(cls, icon_name: str, size: int):
+        """Fetch a persisted render if the source SVG hasn't changed"""
+        entry = cls._get_disk_cache().get(f"{icon_name}_{size}")
+        if not entry:
+            return None
+        mtime, data = entry
+        if mtime != cls._svg_mtime(icon_name):
+            return None
+        pixmap = QPixmap()
+        if pixmap.loadFromData(data, "PNG"):
+            return pixmap
+        return None
+
+    @classmethod
+    def _save_pixmap_to_disk(cls, icon_name: str, size: int, pixmap):
+        """Persist one rendered pixmap as PNG bytes with the SVG mtime"""
+        try:
+            buf = QBuffer()
+            buf.open(QBuffer.WriteOnly)
+            pixmap.save(buf, "PNG")
+            cls._get_disk_cache()[f"{icon_name}_{size}"] = (
+                cls._svg_mtime(icon_name), bytes(buf.data()))
+        except Exception as e:
+            logger.warning(f"Could not persist icon {icon_name}_{size}: {e}")
+
+    @classmethod
+    def _render_master(cls, icon_name: str):
+        """Rasterize an icon at the master size, or None if missing"""
+        pixmap = cls._master_cache.get(icon_name)
+        if pixmap is not None:
+            return pixmap
+
+        # A pre-rendered PNG beats rasterizing the SVG
+        png_path = ICONS_CACHE_DIR / f"{icon_name}_{cls._MASTER_SIZE}.png"
+        if png_path.exists():
+            pixmap = QPixmap()
+            if pixmap.load(str(png_path)):
+                cls._master_cache[icon_name] = pixmap
+                return pixmap
+
+        renderer = cls._get_renderer(icon_name)
+        if renderer is None:
+            return None
+
+        pixmap = QPixmap(QSize(cls._MASTER_SIZE, cls._MASTER_SIZE))
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        renderer.render(painter)
+        painter.end()
+
+        cls._master_cache[icon_name] = pixmap
+        return pixmap
+
+    @classmethod
+    def _render_pixmap(cls, icon_name: str, size: int):
+        """Produce an icon pixmap at one size, or None if missing
+
+        Results are cached per (name, size); callers must treat the
+        returned pixmap as read-only.
+        """
+        key = (icon_name, size)
+        pixmap = cls._pixmap_cache.get(key)
+        if pixmap is not None:
+            cls._pixmap_cache.move_to_end(key)
+            return pixmap
+
+        # An exact-size pre-rendered PNG needs no scaling at all
+        png_path = ICONS_CACHE_DIR / f"{icon_name}_{size}.png"
+        if png_path.exists():
+            pixmap = QPixmap()
+            if pixmap.load(str(png_path)):
+                cls._store_pixmap(key, pixmap)
+                return pixmap
+
+        # A previous run may have rendered this size already
+        pixmap = cls._load_pixmap_from_disk(icon_name, size)
+        if pixmap is not None:
+            cls._store_pixmap(key, pixmap)
+            return pixmap
+
+        master = cls._render_master(icon_name)
+        if master is None:
+            return None
+
+        if size == cls._MASTER_SIZE:
+            pixmap = master
+        else:
+            # Small icons gain nothing from the smooth filter
+            mode = (Qt.FastTransformation if size <= 24
+                    else Qt.SmoothTransformation)
+            pixmap = master.scaled(size, size, Qt.KeepAspectRatio, mode)
+
+        cls._store_pixmap(key, pixmap)
+        cls._save_pixmap_to_disk(icon_name, size, pixmap)
+        return pixmap
+
+    @classmethod
+    def _store_pixmap(cls, key, pixmap):
+        """Insert into the pixmap cache, evicting the LRU entry if full"""
+        cls._pixmap_cache[key] = pixmap
+        if len(cls._pixmap_cache) > cls._CACHE_MAX:
+            cls._pixmap_cache.popitem(last=False)
+
+    @classmethod
+    def _render_qimage(cls, icon_name: str, size: int):
+        """Rasterize one icon to a QImage, or None if missing
+
+        QImage painting is safe off the GUI thread (unlike QPixmap), so
+        preload workers run this in parallel; the caller converts with
+        QPixmap.fromImage on the main thread. Each worker parses its own
+        renderer rather than sharing the locked cache.
+        """
+        png_path = ICONS_CACHE_DIR / f"{icon_name}_{size}.png"
+        if png_path.exists():
+            image = QImage(str(png_path))
+            if not image.isNull():
+                return image
+
+        if _RESOURCES_AVAILABLE:
+            renderer = QSvgRenderer(f":/icons/{icon_name}.svg")
+        else:
+            renderer = QSvgRenderer(str(ICONS_DIR / f"{icon_name}.svg"))
+        if not renderer.isValid():
+            return None
+
+        image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+
+        painter = QPainter(image)
+        renderer.render(painter)
+        painter.end()
+        return image
+
+    @classmethod
+    def preload(cls, names=None, sizes=(16, 24, 32)):
+        """Rasterize icons ahead of first use to warm the pixmap cache
+
+        Rendering fans out across a thread pool as QImages; only the
+        cheap QPixmap conversion runs on the calling (GUI) thread.
+
+        Args:
+            names: Icon names to render; defaults to every SVG in the
+                assets directory
+            sizes: Pixel sizes to render each icon at
+        """
+        if names is None:
+            names = sorted(path.stem for path in ICONS_DIR.glob("*.svg"))
+        jobs = [(name, size) for name in names for size in sizes
+                if (name, size) not in cls._pixmap_cache]
+        if not jobs:
+            return
+
+        with ThreadPoolExecutor() as pool:
+            for (name, size), image in zip(jobs, pool.map(
+                    lambda job: cls._render_qimage(*job), jobs)):
+                if image is not None:
+                    cls._store_pixmap((name, size), QPixmap.fromImage(image))
+
     @classmethod
     def get_icon(cls, icon_name: str, size: int = 24, color: str = None) -> QIcon:
         """
@@ -33,30 +297,24 @@ class IconLoader:
             QIcon object
         """
         cache_key = f"{icon_name}_{size}"
-        if cache_key in cls._cache:
-            return cls._cache[cache_key]
-        
-        svg_path = ICONS_DIR / f"{icon_name}.svg"
-        
-        if not svg_path.exists():
-            logger.warning(f"Icon not found: {svg_path}")
-            return QIcon()
+        icon = cls._cache.get(cache_key)
+        if icon is not None:
+            cls._cache.move_to_end(cache_key)
+            return icon
         
         try:
-            # Load SVG and render to pixmap
-            renderer = QSvgRenderer(str(svg_path))
-            pixmap = QPixmap(size, size)
-            pixmap.fill(False)  # Transparent background
-            
-            from PySide6.QtGui import QPainter
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
-            
-            icon = QIcon(pixmap)
+            pixmap = cls._render_pixmap(icon_name, size)
+            if pixmap is None:
+                # Cache the null icon so repeat lookups of missing
+                # names return without re-entering the render path
+                icon = QIcon()
+            else:
+                icon = QIcon(pixmap)
             cls._cache[cache_key] = icon
+            if len(cls._cache) > cls._CACHE_MAX:
+                cls._cache.popitem(last=False)
             return icon
-        
+
         except Exception as e:
             logger.error(f"Error loading icon {icon_name}: {e}")
             return QIcon()
@@ -73,32 +331,23 @@ class IconLoader:
         Returns:
             QPixmap object
         """
-        svg_path = ICONS_DIR / f"{icon_name}.svg"
-        
-        if not svg_path.exists():
-            logger.warning(f"Icon not found: {svg_path}")
-            return QPixmap()
-        
         try:
-            renderer = QSvgRenderer(str(svg_path))
-            pixmap = QPixmap(size, size)
-            pixmap.fill(False)  # Transparent background
-            
-            from PySide6.QtGui import QPainter
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
-            
-            return pixmap
-        
+            pixmap = cls._render_pixmap(icon_name, size)
+            return pixmap if pixmap is not None else QPixmap()
+
         except Exception as e:
             logger.error(f"Error loading pixmap {icon_name}: {e}")
             return QPixmap()
     
     @classmethod
     def clear_cache(cls):
-        """Clear the icon cache"""
+        """Clear the icon, pixmap and renderer caches"""
         cls._cache.clear()
+        cls._master_cache.clear()
+        cls._pixmap_cache.clear()
+        with cls._renderer_lock:
+            cls._renderer_cache.clear()
+            cls._exists_cache.clear()
 
 
 # Convenience functions
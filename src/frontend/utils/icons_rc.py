@@ -0,0 +1,210 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.11.2
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x01F\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2224\
+\x22 height=\x2224\x22 vi\
+ewBox=\x220 0 24 24\
+\x22 fill=\x22none\x22 st\
+roke=\x22currentCol\
+or\x22 stroke-width\
+=\x222\x22 stroke-line\
+cap=\x22round\x22 stro\
+ke-linejoin=\x22rou\
+nd\x22>\x0d\x0a  <path d=\
+\x22M4 19.5A2.5 2.5\
+ 0 0 1 6.5 17H20\
+\x22></path>\x0d\x0a  <pa\
+th d=\x22M6.5 2H20v\
+20H6.5A2.5 2.5 0\
+ 0 1 4 19.5v-15A\
+2.5 2.5 0 0 1 6.\
+5 2z\x22></path>\x0d\x0a<\
+/svg>\
+\x00\x00\x01*\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2224\
+\x22 height=\x2224\x22 vi\
+ewBox=\x220 0 24 24\
+\x22 fill=\x22none\x22 st\
+roke=\x22currentCol\
+or\x22 stroke-width\
+=\x222\x22 stroke-line\
+cap=\x22round\x22 stro\
+ke-linejoin=\x22rou\
+nd\x22>\x0d\x0a  <polylin\
+e points=\x2223 6 1\
+3.5 15.5 8 10 1 \
+17\x22></polyline>\x0d\
+\x0a  <polyline poi\
+nts=\x2217 6 23 6 2\
+3 12\x22></polyline\
+>\x0d\x0a</svg>\
+\x00\x00\x01\x9e\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2224\
+\x22 height=\x2224\x22 vi\
+ewBox=\x220 0 24 24\
+\x22 fill=\x22none\x22 st\
+roke=\x22currentCol\
+or\x22 stroke-width\
+=\x222\x22 stroke-line\
+cap=\x22round\x22 stro\
+ke-linejoin=\x22rou\
+nd\x22>\x0d\x0a  <path d=\
+\x22M14 2H6a2 2 0 0\
+ 0-2 2v16a2 2 0 \
+0 0 2 2h12a2 2 0\
+ 0 0 2-2V8z\x22></p\
+ath>\x0d\x0a  <polylin\
+e points=\x2214 2 1\
+4 8 20 8\x22></poly\
+line>\x0d\x0a  <line x\
+1=\x2212\x22 y1=\x2219\x22 x\
+2=\x2212\x22 y2=\x225\x22></\
+line>\x0d\x0a  <line x\
+1=\x229\x22 y1=\x2216\x22 x2\
+=\x2215\x22 y2=\x2216\x22></\
+line>\x0d\x0a</svg>\
+\x00\x00\x019\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2224\
+\x22 height=\x2224\x22 vi\
+ewBox=\x220 0 24 24\
+\x22 fill=\x22none\x22 st\
+roke=\x22currentCol\
+or\x22 stroke-width\
+=\x222\x22 stroke-line\
+cap=\x22round\x22 stro\
+ke-linejoin=\x22rou\
+nd\x22>\x0d\x0a  <path d=\
+\x22M3 9l9-7 9 7v11\
+a2 2 0 0 1-2 2H5\
+a2 2 0 0 1-2-2z\x22\
+></path>\x0d\x0a  <pol\
+yline points=\x229 \
+22 9 12 15 12 15\
+ 22\x22></polyline>\
+\x0d\x0a</svg>\
+\x00\x00\x01d\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2224\
+\x22 height=\x2224\x22 vi\
+ewBox=\x220 0 24 24\
+\x22 fill=\x22none\x22 st\
+roke=\x22currentCol\
+or\x22 stroke-width\
+=\x222\x22 stroke-line\
+cap=\x22round\x22 stro\
+ke-linejoin=\x22rou\
+nd\x22>\x0d\x0a  <path d=\
+\x22M3 9l9-7 9 7v11\
+a2 2 0 0 1-2 2H5\
+a2 2 0 0 1-2-2z\x22\
+></path>\x0d\x0a  <pol\
+yline points=\x229 \
+22 9 12 15 12 15\
+ 22\x22></polyline>\
+\x0d\x0a  <circle cx=\x22\
+12\x22 cy=\x2212\x22 r=\x221\
+\x22></circle>\x0d\x0a</s\
+vg>\
+\x00\x00\x01X\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2224\
+\x22 height=\x2224\x22 vi\
+ewBox=\x220 0 24 24\
+\x22 fill=\x22none\x22 st\
+roke=\x22currentCol\
+or\x22 stroke-width\
+=\x222\x22 stroke-line\
+cap=\x22round\x22 stro\
+ke-linejoin=\x22rou\
+nd\x22>\x0d\x0a  <rect x=\
+\x222\x22 y=\x223\x22 width=\
+\x2220\x22 height=\x2214\x22\
+ rx=\x222\x22 ry=\x222\x22><\
+/rect>\x0d\x0a  <path \
+d=\x22M2 17h20\x22></p\
+ath>\x0d\x0a  <path d=\
+\x22M6 20h4\x22></path\
+>\x0d\x0a  <path d=\x22M1\
+4 20h4\x22></path>\x0d\
+\x0a</svg>\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x0b\
+\x08\x81\xa9\xc7\
+\x00l\
+\x00i\x00b\x00r\x00a\x00r\x00y\x00.\x00s\x00v\x00g\
+\x00\x0d\
+\x02_!\xe7\
+\x00w\
+\x00a\x00v\x00e\x00f\x00o\x00r\x00m\x00s\x00.\x00s\x00v\x00g\
+\x00\x0b\
+\x09G\xd4\x07\
+\x00r\
+\x00e\x00p\x00o\x00r\x00t\x00s\x00.\x00s\x00v\x00g\
+\x00\x0e\
+\x0d\x0b\xd4g\
+\x00p\
+\x00r\x00o\x00p\x00e\x00r\x00t\x00i\x00e\x00s\x00.\x00s\x00v\x00g\
+\x00\x0c\
+\x07\x0fR\xc7\
+\x00a\
+\x00n\x00a\x00l\x00y\x00s\x00i\x00s\x00.\x00s\x00v\x00g\
+\x00\x0b\
+\x06\xf4\x91\x87\
+\x00c\
+\x00o\x00n\x00s\x00o\x00l\x00e\x00.\x00s\x00v\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x06\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00,\x00\x00\x00\x00\x00\x01\x00\x00\x01J\
+\x00\x00\x01\x9a\xd7cb0\
+\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x00\x06\xbf\
+\x00\x00\x01\x9a\xd7cb0\
+\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x05W\
+\x00\x00\x01\x9a\xd7cb0\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9a\xd7cb0\
+\x00\x00\x00L\x00\x00\x00\x00\x00\x01\x00\x00\x02x\
+\x00\x00\x01\x9a\xd7cb0\
+\x00\x00\x00h\x00\x00\x00\x00\x00\x01\x00\x00\x04\x1a\
+\x00\x00\x01\x9a\xd7cb0\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
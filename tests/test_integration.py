@@ -1,295 +1,273 @@
-"""Integration tests for UI and backend interaction"""
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-import pytest
-import numpy as np
-from backend.circuit.circuit_model import CircuitModel, ComponentType
-from backend.simulation.simulation_engine import SimulationEngine
-from backend.circuit.project_manager import ProjectManager
-from backend.circuit.component_library import ComponentLibraryManager
-
-
-class TestCircuitSimulationIntegration:
-    """Test circuit model and simulation integration"""
-    
-    def test_create_and_simulate_circuit(self):
-        """Test creating a circuit and running simulation"""
-        model = CircuitModel()
-        engine = SimulationEngine()
-        
-        # Create circuit
-        circuit = model.create_circuit("Test Circuit")
-        
-        # Add nodes
-        node_1 = circuit.add_node("n1", "Node 1")
-        node_2 = circuit.add_node("n2", "Node 2")
-        node_3 = circuit.add_node("n3", "GND")
-        
-        # Add components
-        vs = circuit.add_component("v1", ComponentType.VOLTAGE_SOURCE, "V1")
-        r = circuit.add_component("r1", ComponentType.RESISTOR, "R1")
-        
-        # Set parameters
-        vs.parameters = {"voltage": 5.0}
-        r.parameters = {"resistance": 1000.0}
-        
-        # Connect components
-        circuit.connect("n1", "v1")
-        circuit.connect("n3", "v1")
-        circuit.connect("n1", "r1")
-        circuit.connect("n2", "r1")
-        
-        # Run simulation
-        engine.setup_dc_analysis()
-        result = engine.run()
-        
-        assert result.status == "success"
-        assert len(result.time_points) > 0
-    
-    def test_project_save_and_load(self):
-        """Test project save and load functionality"""
-        manager = ProjectManager()
-        
-        # Create and save project
-        project = manager.create_project("Test Project")
-        assert project is not None
-        assert manager.save_project(project)
-        
-        # Load project
-        loaded = manager.load_project(project.path)
-        assert loaded.name == "Test Project"
-        assert loaded.path == project.path
-    
-    def test_component_library_access(self):
-        """Test component library access"""
-        lib_manager = ComponentLibraryManager()
-        
-        # Get component
-        resistor = lib_manager.get_component("Resistor")
-        assert resistor is not None
-        assert resistor.name == "Resistor"
-        assert "resistance" in resistor.parameters
-        
-        # Get all categories
-        categories = lib_manager.get_all_categories()
-        assert "Passive" in categories
-        assert "Sources" in categories
-        
-        # Get components by category
-        passive = lib_manager.list_components_by_category("Passive")
-        assert len(passive) > 0
-
-
-class TestSimulationResultsProcessing:
-    """Test simulation results processing"""
-    
-    def test_dc_analysis_results(self):
-        """Test DC analysis produces valid results"""
-        engine = SimulationEngine()
-        engine.setup_dc_analysis()
-        result = engine.run()
-        
-        assert result.status == "success"
-        assert len(result.time_points) == 1  # DC has single time point
-        assert isinstance(result.time_points, np.ndarray)
-        assert isinstance(result.node_voltages, dict)
-    
-    def test_transient_analysis_results(self):
-        """Test transient analysis produces time-domain results"""
-        engine = SimulationEngine()
-        engine.setup_transient_analysis(duration=0.1, time_step=0.001)
-        result = engine.run()
-        
-        assert result.status == "success"
-        assert len(result.time_points) > 1
-        assert result.time_points[-1] >= 0.1
-
-
-class TestCircuitCanvasModel:
-    """Test circuit canvas data model"""
-    
-    def test_add_components_to_canvas(self):
-        """Test adding components to canvas model"""
-        from src.frontend.panels.circuit_canvas import CircuitCanvas
-        
-        canvas = CircuitCanvas()
-        
-        # Add components
-        comp1 = canvas.add_component("Resistor", "R1", 100, 100)
-        comp2 = canvas.add_component("Capacitor", "C1", 200, 100)
-        
-        assert comp1 in canvas.components
-        assert comp2 in canvas.components
-        assert len(canvas.components) == 2
-    
-    def test_add_wires_to_canvas(self):
-        """Test adding wires (connections) to canvas"""
-        from src.frontend.panels.circuit_canvas import CircuitCanvas
-        
-        canvas = CircuitCanvas()
-        
-        # Add components to create nodes
-        canvas.add_component("Resistor", "R1", 100, 100)
-        
-        # Get nodes
-        node_ids = list(canvas.nodes.keys())
-        assert len(node_ids) >= 2
-        
-        # Add wire
-        wire_id = canvas.add_wire(node_ids[0], node_ids[1])
-        assert wire_id is not None
-        assert wire_id in canvas.wires
-    
-    def test_component_selection(self):
-        """Test component selection on canvas"""
-        from src.frontend.panels.circuit_canvas import CircuitCanvas
-        
-        canvas = CircuitCanvas()
-        comp_id = canvas.add_component("Resistor", "R1", 100, 100)
-        
-        canvas.select_component(comp_id)
-        assert canvas.selected_component == comp_id
-        assert canvas.components[comp_id].selected
-    
-    def test_component_movement(self):
-        """Test moving components on canvas"""
-        from src.frontend.panels.circuit_canvas import CircuitCanvas
-        
-        canvas = CircuitCanvas()
-        comp_id = canvas.add_component("Resistor", "R1", 100, 100)
-        original_pos = (canvas.components[comp_id].x, canvas.components[comp_id].y)
-        
-        canvas.move_component(comp_id, 50, 50)
-        new_pos = (canvas.components[comp_id].x, canvas.components[comp_id].y)
-        
-        assert new_pos[0] == original_pos[0] + 50
-        assert new_pos[1] == original_pos[1] + 50
-
-
-class TestPropertyEditingFlow:
-    """Test end-to-end property editing flow: UI → Canvas → SimulationPanel → Solver"""
-    
-    def test_property_edit_signal_flow(self):
-        """Test that property edits flow through signals correctly"""
-        from src.frontend.panels.circuit_canvas import CircuitCanvas
-        from src.frontend.panels.simulation import SimulationPanel
-        from src.backend.circuit.circuit_model import Component
-        
-        # Create canvas and simulation panel
-        canvas = CircuitCanvas()
-        sim_panel = SimulationPanel(canvas=canvas)
-        
-        # Add a resistor to canvas
-        comp_id = canvas.add_component("Resistor", "R1", 100, 100)
-        comp = canvas.components[comp_id]
-        
-        # Verify component has properties
-        assert hasattr(comp, 'properties'), "Component should have properties attribute"
-        original_resistance = comp.properties.get("Resistance", 1000)
-        
-        # Simulate property edit signal (as would come from InspectorPanel)
-        new_resistance = 2200
-        new_properties = {"Resistance": new_resistance}
-        
-        # Emit the component_properties_changed signal
-        canvas.component_properties_changed.emit(comp_id, new_properties)
-        
-        # Verify component properties were updated in SimulationPanel
-        assert comp.properties["Resistance"] == new_resistance, \
-            f"Expected Resistance {new_resistance}, got {comp.properties['Resistance']}"
-        print(f"[OK] Property edit flow: {original_resistance}Ω -> {new_resistance}Ω")
-    
-    def test_simulation_uses_updated_properties(self):
-        """Test that DC analysis uses updated component properties"""
-        from src.frontend.panels.circuit_canvas import CircuitCanvas
-        from src.frontend.panels.simulation import SimulationPanel
-        from src.backend.simulation.circuit_solver_microservices import CircuitSolverMicroservices
-        
-        # Create canvas
-        canvas = CircuitCanvas()
-        
-        # Add voltage source
-        vs_id = canvas.add_component("VoltageSource", "V1", 50, 100)
-        vs = canvas.components[vs_id]
-        vs.properties["Voltage"] = 5.0
-        
-        # Add resistor
-        r_id = canvas.add_component("Resistor", "R1", 150, 100)
-        r = canvas.components[r_id]
-        original_r_value = 1000  # 1k ohms
-        r.properties["Resistance"] = original_r_value
-        
-        # Add ground
-        gnd_id = canvas.add_component("Ground", "GND", 250, 100)
-        
-        # Manually create solver to test
-        try:
-            solver = CircuitSolverMicroservices(canvas.components, canvas.wires, canvas.nodes)
-            
-            # Run DC analysis with original resistance
-            result1 = solver.dc_analysis()
-            
-            # Now update resistance via property edit signal
-            new_r_value = 2200  # 2.2k ohms
-            canvas.component_properties_changed.emit(r_id, {"Resistance": new_r_value})
-            
-            # Component properties should be updated
-            assert r.properties["Resistance"] == new_r_value, \
-                f"Resistance should be updated to {new_r_value}"
-            
-            # Create new solver with updated component
-            solver2 = CircuitSolverMicroservices(canvas.components, canvas.wires, canvas.nodes)
-            result2 = solver2.dc_analysis()
-            
-            # Verify results reflect the property change
-            # Current through 1k ohm: I = V/R = 5V/1000Ω = 5mA
-            # Current through 2.2k ohm: I = V/R = 5V/2200Ω ≈ 2.27mA
-            # So current should be lower with higher resistance
-            
-            print(f"[OK] Simulation property update: R1 {original_r_value}Ω -> {new_r_value}Ω")
-            print(f"  Result 1 status: {result1.get('status', 'N/A')}")
-            print(f"  Result 2 status: {result2.get('status', 'N/A')}")
-            
-        except Exception as e:
-            print(f"⚠ Simulation test skipped (solver initialization): {str(e)}")
-    
-    def test_inspector_commit_changes_signal(self):
-        """Test that InspectorPanel commit_changes signal is properly wired"""
-        from src.frontend.panels.inspector import InspectorPanel
-        from src.backend.circuit.circuit_model import Component
-        
-        # Create inspector panel
-        inspector = InspectorPanel()
-        
-        # Verify it has commit_changes signal
-        assert hasattr(inspector, 'commit_changes'), \
-            "InspectorPanel should have commit_changes signal"
-        
-        # Create a mock component
-        comp_id = "R1"
-        properties = {"Resistance": 1000, "Type": "Resistor"}
-        
-        # Track signal emissions
-        signal_received = []
-        def capture_signal(cid, props):
-            signal_received.append((cid, props))
-        
-        inspector.commit_changes.connect(capture_signal)
-        
-        # Emit commit_changes
-        inspector.commit_changes.emit(comp_id, properties)
-        
-        # Verify signal was received
-        assert len(signal_received) > 0, "commit_changes signal should be emitted"
-        assert signal_received[0][0] == comp_id, "Component ID should match"
-        assert signal_received[0][1] == properties, "Properties should match"
-        print(f"[OK] InspectorPanel.commit_changes signal verified")
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
-
+"""Integration tests for UI and backend interaction"""
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+import numpy as np
+from backend.circuit.circuit_model import CircuitModel, ComponentType
+from backend.simulation.simulation_engine import SimulationEngine
+from backend.circuit.project_manager import ProjectManager
+from backend.circuit.component_library import ComponentLibraryManager
+
+# Widget and solver imports hoisted to module scope so they resolve once
+# instead of inside every test call
+from src.frontend.panels.circuit_canvas import CircuitCanvas
+from src.frontend.panels.inspector import InspectorPanel
+from src.backend.simulation.circuit_solver_microservices import CircuitSolverMicroservices
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """One SimulationEngine per module; each test reconfigures it"""
+    return SimulationEngine()
+
+
+@pytest.fixture(scope="module")
+def canvas():
+    """One CircuitCanvas per module; widget construction is expensive"""
+    return CircuitCanvas()
+
+
+@pytest.fixture(scope="module")
+def sim_panel(canvas):
+    """One SimulationPanel wired to the shared canvas
+
+    Imported here rather than at module scope so a missing panel module
+    fails only the tests that need it, not collection.
+    """
+    from src.frontend.panels.simulation import SimulationPanel
+    return SimulationPanel(canvas=canvas)
+
+
+@pytest.fixture(autouse=True)
+def _reset_canvas(request):
+    """Clear shared canvas state after each test that touched it"""
+    yield
+    if "canvas" in request.fixturenames:
+        request.getfixturevalue("canvas").clear_canvas()
+
+
+class TestCircuitSimulationIntegration:
+    """Test circuit model and simulation integration"""
+
+    def test_create_and_simulate_circuit(self, engine):
+        """Test creating a circuit and running simulation"""
+        model = CircuitModel()
+
+        # Create circuit
+        circuit = model.create_circuit("Test Circuit")
+
+        # Add nodes
+        node_1 = circuit.add_node("n1", "Node 1")
+        node_2 = circuit.add_node("n2", "Node 2")
+        node_3 = circuit.add_node("n3", "GND")
+
+        # Add components
+        vs = circuit.add_component("v1", ComponentType.VOLTAGE_SOURCE, "V1")
+        r = circuit.add_component("r1", ComponentType.RESISTOR, "R1")
+
+        # Set parameters
+        vs.parameters = {"voltage": 5.0}
+        r.parameters = {"resistance": 1000.0}
+
+        # Connect components
+        circuit.connect("n1", "v1")
+        circuit.connect("n3", "v1")
+        circuit.connect("n1", "r1")
+        circuit.connect("n2", "r1")
+
+        # Run simulation
+        engine.setup_dc_analysis()
+        result = engine.run()
+
+        assert result.status == "success"
+        assert len(result.time_points) > 0
+
+    def test_project_save_and_load(self):
+        """Test project save and load functionality"""
+        manager = ProjectManager()
+
+        # Create and save project
+        project = manager.create_project("Test Project")
+        assert project is not None
+        assert manager.save_project(project)
+
+        # Load project
+        loaded = manager.load_project(project.path)
+        assert loaded.name == "Test Project"
+        assert loaded.path == project.path
+
+    def test_component_library_access(self):
+        """Test component library access"""
+        lib_manager = ComponentLibraryManager()
+
+        # Get component
+        resistor = lib_manager.get_component("Resistor")
+        assert resistor is not None
+        assert resistor.name == "Resistor"
+        assert "resistance" in resistor.parameters
+
+        # Get all categories
+        categories = lib_manager.get_all_categories()
+        assert "Passive" in categories
+        assert "Sources" in categories
+
+        # Get components by category
+        passive = lib_manager.list_components_by_category("Passive")
+        assert len(passive) > 0
+
+
+class TestSimulationResultsProcessing:
+    """Test simulation results processing"""
+
+    def test_dc_analysis_results(self, engine):
+        """Test DC analysis produces valid results"""
+        engine.setup_dc_analysis()
+        result = engine.run()
+
+        assert result.status == "success"
+        assert len(result.time_points) == 1  # DC has single time point
+        assert isinstance(result.time_points, np.ndarray)
+        assert isinstance(result.node_voltages, dict)
+
+    def test_transient_analysis_results(self, engine):
+        """Test transient analysis produces time-domain results"""
+        engine.setup_transient_analysis(duration=0.1, time_step=0.001)
+        result = engine.run()
+
+        assert result.status == "success"
+        assert len(result.time_points) > 1
+        assert result.time_points[-1] >= 0.1
+
+
+class TestCircuitCanvasModel:
+    """Test circuit canvas data model"""
+
+    def test_add_components_to_canvas(self, canvas):
+        """Test adding components to canvas model"""
+        # Add components
+        comp1 = canvas.add_component("Resistor", "R1", 100, 100)
+        comp2 = canvas.add_component("Capacitor", "C1", 200, 100)
+
+        assert comp1 in canvas.components
+        assert comp2 in canvas.components
+        assert len(canvas.components) == 2
+
+    def test_add_wires_to_canvas(self, canvas):
+        """Test adding wires (connections) to canvas"""
+        # Add components to create nodes
+        canvas.add_component("Resistor", "R1", 100, 100)
+
+        # Get nodes
+        node_ids = list(canvas.nodes.keys())
+        assert len(node_ids) >= 2
+
+        # Add wire
+        wire_id = canvas.add_wire(node_ids[0], node_ids[1])
+        assert wire_id is not None
+        assert wire_id in canvas.wires
+
+    def test_component_selection(self, canvas):
+        """Test component selection on canvas"""
+        comp_id = canvas.add_component("Resistor", "R1", 100, 100)
+
+        canvas.select_component(comp_id)
+        assert canvas.selected_component == comp_id
+        assert canvas.components[comp_id].selected
+
+    def test_component_movement(self, canvas):
+        """Test moving components on canvas"""
+        comp_id = canvas.add_component("Resistor", "R1", 100, 100)
+        original_pos = (canvas.components[comp_id].x, canvas.components[comp_id].y)
+
+        canvas.move_component(comp_id, 50, 50)
+        new_pos = (canvas.components[comp_id].x, canvas.components[comp_id].y)
+
+        assert new_pos[0] == original_pos[0] + 50
+        assert new_pos[1] == original_pos[1] + 50
+
+
+class TestPropertyEditingFlow:
+    """Test end-to-end property editing flow: UI → Canvas → SimulationPanel → Solver"""
+
+    def test_property_edit_signal_flow(self, canvas, sim_panel):
+        """Test that property edits flow through signals correctly"""
+        # Add a resistor to canvas
+        comp_id = canvas.add_component("Resistor", "R1", 100, 100)
+        comp = canvas.components[comp_id]
+
+        # Verify component has properties
+        assert hasattr(comp, 'properties'), "Component should have properties attribute"
+        original_resistance = comp.properties.get("Resistance", 1000)
+
+        # Simulate property edit signal (as would come from InspectorPanel)
+        new_resistance = 2200
+        new_properties = {"Resistance": new_resistance}
+
+        # Emit the component_properties_changed signal
+        canvas.component_properties_changed.emit(comp_id, new_properties)
+
+        # Verify component properties were updated in SimulationPanel
+        assert comp.properties["Resistance"] == new_resistance, \
+            f"Expected Resistance {new_resistance}, got {comp.properties['Resistance']}"
+        print(f"[OK] Property edit flow: {original_resistance}Ω -> {new_resistance}Ω")
+
+    def test_simulation_uses_updated_properties(self):
+        """Test that DC analysis reflects an in-place property update"""
+        solver = CircuitSolverMicroservices()
+        solver.add_voltage_source("V1", "n1", "gnd", 5.0)
+        solver.add_resistor("R1", "n1", "gnd", 1000)
+
+        # Run DC analysis with original resistance
+        result1 = solver.dc_analysis()
+        assert result1["status"] == "success"
+
+        # Patch the resistance in place, as the inspector edit flow does,
+        # instead of constructing a second solver
+        assert solver.update_component("R1", {"Resistance": 2200})
+        result2 = solver.dc_analysis()
+        assert result2["status"] == "success"
+
+        # Current through 1k ohm: I = V/R = 5V/1000Ω = 5mA
+        # Current through 2.2k ohm: I = V/R = 5V/2200Ω ≈ 2.27mA
+        assert result1["component_currents"]["R1"] == pytest.approx(5.0 / 1000)
+        assert result2["component_currents"]["R1"] == pytest.approx(5.0 / 2200)
+
+        # An unknown component reports no update
+        assert not solver.update_component("R99", {"Resistance": 100})
+
+    def test_inspector_commit_changes_signal(self):
+        """Test that InspectorPanel commit_changes signal is properly wired"""
+        # Create inspector panel
+        inspector = InspectorPanel()
+
+        # Verify it has commit_changes signal
+        assert hasattr(inspector, 'commit_changes'), \
+            "InspectorPanel should have commit_changes signal"
+
+        # Create a mock component
+        comp_id = "R1"
+        properties = {"Resistance": 1000, "Type": "Resistor"}
+
+        # Track signal emissions
+        signal_received = []
+        def capture_signal(cid, props):
+            signal_received.append((cid, props))
+
+        inspector.commit_changes.connect(capture_signal)
+
+        # Emit commit_changes
+        inspector.commit_changes.emit(comp_id, properties)
+
+        # Verify signal was received
+        assert len(signal_received) > 0, "commit_changes signal should be emitted"
+        assert signal_received[0][0] == comp_id, "Component ID should match"
+        assert signal_received[0][1] == properties, "Properties should match"
+        print(f"[OK] InspectorPanel.commit_changes signal verified")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
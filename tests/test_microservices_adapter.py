@@ -5,8 +5,8 @@ Validates that the adapter correctly bridges frontend and microservices
 import sys
 from pathlib import Path
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from backend.simulation.circuit_solver_microservices import CircuitSolverMicroservices, parse_component_value
 
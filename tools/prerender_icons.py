@@ -0,0 +1,60 @@
+"""
+Pre-render the SVG icon set to PNGs at the standard UI sizes
+
+Run as a build step:
+
+    python tools/prerender_icons.py
+
+Output lands in assets/icons_cache/<name>_<size>.png; IconLoader prefers
+these over rasterizing the SVG at runtime.
+"""
+import sys
+from pathlib import Path
+
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QGuiApplication, QPainter, QPixmap
+from PySide6.QtSvg import QSvgRenderer
+
+REPO_ROOT = Path(__file__).parent.parent
+ICONS_DIR = REPO_ROOT / "assets" / "icons"
+CACHE_DIR = REPO_ROOT / "assets" / "icons_cache"
+
+# Sizes the UI requests icons at, plus the loader's 64px master size
+SIZES = (16, 24, 32, 48, 64)
+
+
+def prerender(sizes=SIZES) -> int:
+    """Rasterize every SVG in ICONS_DIR at each size; returns PNG count"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    count = 0
+
+    for svg_path in sorted(ICONS_DIR.glob("*.svg")):
+        renderer = QSvgRenderer(str(svg_path))
+        if not renderer.isValid():
+            print(f"  [SKIP] {svg_path.name}: not a valid SVG")
+            continue
+
+        for size in sizes:
+            pixmap = QPixmap(QSize(size, size))
+            pixmap.fill(Qt.transparent)
+
+            painter = QPainter(pixmap)
+            renderer.render(painter)
+            painter.end()
+
+            out_path = CACHE_DIR / f"{svg_path.stem}_{size}.png"
+            pixmap.save(str(out_path), "PNG")
+            count += 1
+
+    return count
+
+
+def main():
+    # QPixmap needs a Qt application; no windows are shown
+    app = QGuiApplication(sys.argv)
+    count = prerender()
+    print(f"Rendered {count} PNGs into {CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    main()